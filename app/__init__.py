@@ -1,9 +1,10 @@
-from dash import Dash, dcc, html
-from dash.dependencies import Input, Output
-import dash_bootstrap_components as dbc
-
-
 def create_app():
+    # Web dependencies are imported here so the geometry and export modules
+    # (app.utils, app.cli) can be used without Dash installed
+    from dash import Dash, dcc, html
+    from dash.dependencies import ClientsideFunction, Input, Output, State
+    import dash_bootstrap_components as dbc
+
     # Initialize the app with Bootstrap for the modal component
     app = Dash(
         __name__,
@@ -16,15 +17,13 @@ def create_app():
     
     # Import components after app creation to avoid circular imports
     from .callbacks import register_callbacks
-    from .layout import (
-        create_barrel_vault_layout,
-        create_double_barrel_vault_layout,
-        create_landing_layout,
-        create_pseudo_dome_layout,
-    )
+    from .metrics import register_metrics
+    from .routes import register_export_routes
 
     app.layout = html.Div([
         dcc.Location(id='url', refresh=False),
+        # Random id per browser tab, used to drop superseded pattern requests
+        dcc.Store(id='session-id', storage_type='session'),
         html.Div(id='page-content')
     ])
 
@@ -33,6 +32,13 @@ def create_app():
         Input('url', 'pathname')
     )
     def display_page(pathname):
+        # Page layouts are built on the first route hit, not at worker boot
+        from .layout import (
+            create_barrel_vault_layout,
+            create_double_barrel_vault_layout,
+            create_landing_layout,
+            create_pseudo_dome_layout,
+        )
         if pathname == '/pseudo-dome':
             return create_pseudo_dome_layout()
         elif pathname == '/barrel-vault':
@@ -42,6 +48,15 @@ def create_app():
         else:
             return create_landing_layout()
 
+    app.clientside_callback(
+        ClientsideFunction(namespace='ui', function_name='session_id'),
+        Output('session-id', 'data'),
+        Input('url', 'pathname'),
+        State('session-id', 'data')
+    )
+
     register_callbacks(app)
+    register_export_routes(app.server)
+    register_metrics(app)
     
     return app
\ No newline at end of file
@@ -0,0 +1,28 @@
+// Clientside callbacks for UI-only state. They run in the browser, so these
+// interactions never wait behind pattern generation on the server.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    ui: {
+        // Open a help modal from any of its help buttons, close it from its
+        // close button ("...close-help-modal"). The last argument is is_open.
+        toggle_help_modal: function() {
+            const isOpen = arguments[arguments.length - 1];
+            const triggered = window.dash_clientside.callback_context.triggered;
+            if (!triggered || !triggered.length || triggered[0].prop_id === '.') {
+                return isOpen;
+            }
+            const buttonId = triggered[0].prop_id.split('.')[0];
+            return !buttonId.endsWith('close-help-modal');
+        },
+
+        // Random id of this browser tab, created once per session
+        session_id: function(pathname, current) {
+            if (current) {
+                return window.dash_clientside.no_update;
+            }
+            if (window.crypto && window.crypto.randomUUID) {
+                return window.crypto.randomUUID();
+            }
+            return Date.now().toString(36) + Math.random().toString(36).slice(2);
+        }
+    }
+});
@@ -1,11 +1,11 @@
 import numpy as np
 import plotly.graph_objs as go
 from dash import dcc, html
-from dash.dependencies import Input, Output, State
+from dash.dependencies import ClientsideFunction, Input, Output, State
 from dash.exceptions import PreventUpdate
 from dash import callback_context
 
-from .layout import format_parameters
+from .coalescing import request_sequencer
 from .utils.barrel_vault_single import generate_barrel_vault_pattern
 from .utils.barrel_vault_double import generate_double_barrel_vault_pattern
 from .utils.calculations import (
@@ -24,33 +24,58 @@ from .utils.export import (
     create_double_barrel_vault_svg, create_double_barrel_vault_dxf
 )
 from .utils.pattern_generator import generate_pattern
+from .utils.lod import level_of_detail, parse_viewport, viewport_changed
+from .utils.plotly_adapter import geometry_to_grouped_traces, outline_trace
 from .utils.config_loader import (
     get_pseudo_dome_config,
     get_barrel_vault_config,
     get_double_barrel_vault_config
 )
 
+# Opens a help modal from its help buttons and closes it from its close button
+TOGGLE_HELP_MODAL = ClientsideFunction(namespace='ui', function_name='toggle_help_modal')
+
+
+def requested_viewport(graph_id, relayout_data):
+    """
+    Return the zoomed window of a preview graph, or None for the whole pattern.
+
+    Only a zoom or pan of the graph itself selects a window; parameter changes
+    reset the view. Other relayout events (drag mode, autosize) are ignored.
+    """
+    if callback_context.triggered_id != graph_id:
+        return None
+    if not viewport_changed(relayout_data):
+        raise PreventUpdate
+    return parse_viewport(relayout_data)
+
+
+def stop_if_superseded(session_id, channel, ticket):
+    """Skip the rest of a preview callback once a newer request of its session and page has arrived."""
+    if request_sequencer.superseded(session_id, channel, ticket):
+        raise PreventUpdate
+
+
+def preview_traces(geometry, viewport):
+    """Figure traces of the creases worth drawing in a viewport (see utils.lod)."""
+    drawn, outline = level_of_detail(geometry, viewport)
+    traces = geometry_to_grouped_traces(drawn, binary=True)
+    if outline is not None:
+        traces.append(outline_trace(outline, binary=True))
+    return traces
+
 
 def register_pseudo_dome_callbacks(app):
-    # Help modal callbacks
-    @app.callback(
+    # Help modal toggle, handled in the browser (assets/clientside.js)
+    app.clientside_callback(
+        TOGGLE_HELP_MODAL,
         Output("help-modal", "is_open"),
         [Input("radius-help-button", "n_clicks"), 
          Input("segments-help-button", "n_clicks"), 
          Input("close-help-modal", "n_clicks")],
         [State("help-modal", "is_open")],
     )
-    def toggle_help_modal(radius_help_clicks, segments_help_clicks, close_clicks, is_open):
-        ctx = callback_context
-        if not ctx.triggered:
-            return is_open
-        else:
-            button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-            if button_id in ["radius-help-button", "segments-help-button"] and not is_open:
-                return True
-            elif button_id == "close-help-modal" and is_open:
-                return False
-            return is_open
+
     @app.callback(
         [Output('pattern-plot', 'figure'),
         Output('parameter-display', 'children')],
@@ -60,9 +85,11 @@ def register_pseudo_dome_callbacks(app):
         Input('fold-color-2-input', 'value'),
         Input('radial-color-input', 'value'),
         Input('fold-width-input', 'value'),
-        Input('radial-width-input', 'value')]
+        Input('radial-width-input', 'value'),
+        Input('pattern-plot', 'relayoutData')],
+        [State('session-id', 'data')]
     )
-    def update_pattern(r, n, fold_color_1, fold_color_2, radial_color, fold_width, radial_width):
+    def update_pattern(r, n, fold_color_1, fold_color_2, radial_color, fold_width, radial_width, relayout_data, session_id):
         # Use values from YAML configuration
         config = get_pseudo_dome_config()
         
@@ -77,6 +104,8 @@ def register_pseudo_dome_callbacks(app):
         radial_color (str): Color for radial lines
         mv_width (float): Line width for mountain and valley folds
         radial_width (float): Line width for radial lines
+        relayout_data (dict): Zoom state of the plot, for the level of detail
+        session_id (str): Browser session id, for dropping superseded requests
         
         Returns:
         tuple: (Plotly figure, Parameter display string)
@@ -84,8 +113,13 @@ def register_pseudo_dome_callbacks(app):
         if r is None or n is None:
             return go.Figure(), "Please enter valid values for r and n."
 
+        viewport = requested_viewport('pattern-plot', relayout_data)
+        ticket = request_sequencer.begin(session_id, 'pseudo-dome')
         thetas, s, A, beta, a, alpha, h, theta1, theta_l, CD, alpha11, num_radial_segments = calculate_parameters(r, n)
-        traces = generate_pattern(r, n, fold_color_1, fold_color_2, radial_color, fold_width, radial_width)
+        # A newer request of this session is already on its way; skip the generation and the figure
+        stop_if_superseded(session_id, 'pseudo-dome', ticket)
+        geometry = generate_pattern(r, n, fold_color_1, fold_color_2, radial_color, fold_width, radial_width)
+        stop_if_superseded(session_id, 'pseudo-dome', ticket)
 
         layout = go.Layout(
             showlegend=False,
@@ -94,10 +128,12 @@ def register_pseudo_dome_callbacks(app):
             height=800,
             margin=dict(l=50, r=50, b=50, t=50),
             plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
+            paper_bgcolor='rgba(0,0,0,0)',
+            # Keep the user's zoom while only the level of detail changes
+            uirevision=f"{r},{n}"
         )
 
-        figure = {'data': traces, 'layout': layout}
+        figure = {'data': preview_traces(geometry, viewport), 'layout': layout}
         # Format folding angles in two aligned columns
         folding_angles = "\n".join([f"α{i+1}1: {np.degrees(a1):6.2f}°    α{i+1}2: {np.degrees(a2):6.2f}°" 
                                     for i, (a1, a2) in enumerate(alpha)])
@@ -151,16 +187,16 @@ Heights (hi):
         if n_clicks == 0:
             raise PreventUpdate
         
-        buffer = create_dxf(r, n, fold_color_1, fold_color_2, radial_color, fold_width, radial_width)
-        return dcc.send_bytes(buffer.getvalue(), "pseudo_dome_pattern.dxf")
+        dxf_bytes = create_dxf(r, n, fold_color_1, fold_color_2, radial_color, fold_width, radial_width)
+        return dcc.send_bytes(dxf_bytes, "pseudo_dome_pattern.dxf")
 
     @app.callback(
         Output("download-svg", "data"),
         Input("export-button", "n_clicks"),
         [State('radius-input', 'value'),
         State('segments-input', 'value'),
-        Input('fold-color-1-input', 'value'),
-        Input('fold-color-2-input', 'value'),
+        State('fold-color-1-input', 'value'),
+        State('fold-color-2-input', 'value'),
         State('radial-color-input', 'value'),
         State('fold-width-input', 'value'),
         State('radial-width-input', 'value')],
@@ -177,8 +213,9 @@ Heights (hi):
 
 
 def register_barrel_vault_callbacks(app):
-    # Help modal callbacks
-    @app.callback(
+    # Help modal toggle, handled in the browser (assets/clientside.js)
+    app.clientside_callback(
+        TOGGLE_HELP_MODAL,
         Output("barrel-help-modal", "is_open"),
         [Input("barrel-radius-help-button", "n_clicks"), 
          Input("barrel-segments-help-button", "n_clicks"),
@@ -188,26 +225,7 @@ def register_barrel_vault_callbacks(app):
          Input("barrel-close-help-modal", "n_clicks")],
         [State("barrel-help-modal", "is_open")],
     )
-    def toggle_barrel_help_modal(radius_help_clicks, segments_help_clicks, tiles_help_clicks, 
-                               height_help_clicks, omega_help_clicks, close_clicks, is_open):
-        ctx = callback_context
-        if not ctx.triggered:
-            return is_open
-        else:
-            button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-            help_buttons = [
-                "barrel-radius-help-button", 
-                "barrel-segments-help-button",
-                "barrel-tiles-help-button",
-                "barrel-height-help-button",
-                "barrel-omega-help-button"
-            ]
-            if button_id in help_buttons and not is_open:
-                return True
-            elif button_id == "barrel-close-help-modal" and is_open:
-                return False
-            return is_open
-            
+
     # SVG Export callback
     @app.callback(
         Output("barrel-download-svg", "data"),
@@ -255,8 +273,8 @@ def register_barrel_vault_callbacks(app):
         if n_clicks == 0:
             raise PreventUpdate
         
-        dxf_base64 = create_barrel_vault_dxf(r, n, m, omega, h, fold_color_1, fold_color_2, connecting_color, mv_width, connecting_width)
-        return dict(content=dxf_base64, filename="barrel_vault_pattern.dxf", type="application/dxf", base64=True)
+        dxf_bytes = create_barrel_vault_dxf(r, n, m, omega, h, fold_color_1, fold_color_2, connecting_color, mv_width, connecting_width)
+        return dcc.send_bytes(dxf_bytes, "barrel_vault_pattern.dxf", type="application/dxf")
     @app.callback(
         [Output('barrel-pattern-plot', 'figure'),
         Output('barrel-parameter-display', 'children'),
@@ -266,9 +284,14 @@ def register_barrel_vault_callbacks(app):
         Input('barrel-segments-input', 'value'),
         Input('barrel-tiles-input', 'value'),
         Input('barrel-omega-input', 'value'),
-        Input('barrel-height-input', 'value')]
+        Input('barrel-height-input', 'value'),
+        Input('barrel-pattern-plot', 'relayoutData')],
+        [State('session-id', 'data')]
     )
-    def update_barrel_vault_pattern(r, n, m, omega, h):
+    def update_barrel_vault_pattern(r, n, m, omega, h, relayout_data, session_id):
+        viewport = requested_viewport('barrel-pattern-plot', relayout_data)
+        ticket = request_sequencer.begin(session_id, 'barrel-vault')
+
         # Calculate parameters
         theta = calculate_segment_angle(omega, n)
         s = calculate_segment_length(r, theta)
@@ -285,9 +308,12 @@ def register_barrel_vault_callbacks(app):
         total_height = 2 * h_clamped
         
         # Generate pattern
-        traces = generate_barrel_vault_pattern(r, n, m, omega, h_clamped)
+        stop_if_superseded(session_id, 'barrel-vault', ticket)
+        geometry = generate_barrel_vault_pattern(r, n, m, omega, h_clamped)
+        stop_if_superseded(session_id, 'barrel-vault', ticket)
         
         # Format parameters display
+        from .layout import format_parameters
         parameters_text = format_parameters(r, n, m, omega, theta, s, alpha, h_max, h_clamped, total_width, total_height)
         
         layout = go.Layout(
@@ -302,16 +328,18 @@ def register_barrel_vault_callbacks(app):
                 scaleratio=1,
                 range=[-total_height/2 - h_clamped/2, total_height/2 + h_clamped]
             ),
-            showlegend=False
+            showlegend=False,
+            uirevision=f"{r},{n},{m},{omega},{h_clamped}"
         )
         
-        return {'data': traces, 'layout': layout}, parameters_text, barrel_height_label, h_clamped
+        return {'data': preview_traces(geometry, viewport), 'layout': layout}, parameters_text, barrel_height_label, h_clamped
 
 
 
 def register_double_barrel_vault_callbacks(app):
-    # Help modal callbacks
-    @app.callback(
+    # Help modal toggle, handled in the browser (assets/clientside.js)
+    app.clientside_callback(
+        TOGGLE_HELP_MODAL,
         Output("double-barrel-help-modal", "is_open"),
         [Input("double-barrel-radius-help-button", "n_clicks"),
          Input("double-barrel-segments-help-button", "n_clicks"),
@@ -321,25 +349,6 @@ def register_double_barrel_vault_callbacks(app):
          Input("double-barrel-close-help-modal", "n_clicks")],
         [State("double-barrel-help-modal", "is_open")],
     )
-    def toggle_double_barrel_help_modal(radius_help_clicks, segments_help_clicks, tiles_help_clicks,
-                               distance_help_clicks, omega_help_clicks, close_clicks, is_open):
-        ctx = callback_context
-        if not ctx.triggered:
-            return is_open
-        else:
-            button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-            help_buttons = [
-                "double-barrel-radius-help-button",
-                "double-barrel-segments-help-button",
-                "double-barrel-tiles-help-button",
-                "double-barrel-distance-help-button",
-                "double-barrel-omega-help-button"
-            ]
-            if button_id in help_buttons and not is_open:
-                return True
-            elif button_id == "double-barrel-close-help-modal" and is_open:
-                return False
-            return is_open
 
     # SVG Export callback
     @app.callback(
@@ -388,8 +397,8 @@ def register_double_barrel_vault_callbacks(app):
         if n_clicks == 0:
             raise PreventUpdate
 
-        dxf_base64 = create_double_barrel_vault_dxf(r, n, m, omega, a, fold_color_1, fold_color_2, connecting_color, mv_width, connecting_width)
-        return dict(content=dxf_base64, filename="double_barrel_vault_pattern.dxf", type="application/dxf", base64=True)
+        dxf_bytes = create_double_barrel_vault_dxf(r, n, m, omega, a, fold_color_1, fold_color_2, connecting_color, mv_width, connecting_width)
+        return dcc.send_bytes(dxf_bytes, "double_barrel_vault_pattern.dxf", type="application/dxf")
 
     @app.callback(
         [Output('double-barrel-pattern-plot', 'figure'),
@@ -398,9 +407,14 @@ def register_double_barrel_vault_callbacks(app):
         Input('double-barrel-segments-input', 'value'),
         Input('double-barrel-tiles-input', 'value'),
         Input('double-barrel-omega-input', 'value'),
-        Input('double-barrel-distance-input', 'value')]
+        Input('double-barrel-distance-input', 'value'),
+        Input('double-barrel-pattern-plot', 'relayoutData')],
+        [State('session-id', 'data')]
     )
-    def update_double_barrel_vault_pattern(r, n, m, omega, a):
+    def update_double_barrel_vault_pattern(r, n, m, omega, a, relayout_data, session_id):
+        viewport = requested_viewport('double-barrel-pattern-plot', relayout_data)
+        ticket = request_sequencer.begin(session_id, 'double-barrel-vault')
+
         # Calculate parameters
         theta = calculate_segment_angle(omega, n)
         s = calculate_segment_length(r, theta)
@@ -415,7 +429,9 @@ def register_double_barrel_vault_callbacks(app):
         total_height = 2 * h
 
         # Generate pattern
-        traces = generate_double_barrel_vault_pattern(r, n, m, omega, a)
+        stop_if_superseded(session_id, 'double-barrel-vault', ticket)
+        geometry = generate_double_barrel_vault_pattern(r, n, m, omega, a)
+        stop_if_superseded(session_id, 'double-barrel-vault', ticket)
 
         # Format parameters display - with separate alpha1 and alpha2
         parameters_text = f"""
@@ -450,10 +466,11 @@ Total Height: {total_height:.2f}
                 scaleratio=1,
                 range=[-total_height/2 - h/2, total_height/2 + h]
             ),
-            showlegend=False
+            showlegend=False,
+            uirevision=f"{r},{n},{m},{omega},{a}"
         )
 
-        return {'data': traces, 'layout': layout}, parameters_text
+        return {'data': preview_traces(geometry, viewport), 'layout': layout}, parameters_text
 
 
 def register_callbacks(app):
@@ -0,0 +1,69 @@
+"""
+Headless command line interface (the ori-kin console script).
+"""
+import argparse
+import sys
+
+from .utils.export import EXPORT_FORMATS, PARAM_TYPES, PATTERN_FAMILIES, STYLE_PARAMS, prepare_export
+
+PARAM_HELP = {
+    'r': 'radius',
+    'n': 'number of segments',
+    'm': 'number of tiles',
+    'omega': 'central angle in degrees',
+    'h': 'unit cell height',
+    'a': 'distance between barrel vault centers',
+}
+
+
+def build_parser():
+    """Create the argument parser with one subcommand per pattern family."""
+    parser = argparse.ArgumentParser(
+        prog='ori-kin',
+        description='Generate origami crease patterns and export them as files.',
+        epilog='Use "ori-kin batch --help" to export parameter grids on all cores.')
+    subparsers = parser.add_subparsers(dest='pattern', metavar='PATTERN', required=True)
+    for name, family in PATTERN_FAMILIES.items():
+        sub = subparsers.add_parser(name, help=f'export a {name.replace("-", " ")} pattern')
+        for param in family.params:
+            sub.add_argument(f'--{param}', type=PARAM_TYPES[param], required=True, help=PARAM_HELP[param])
+        for style, convert in STYLE_PARAMS.items():
+            sub.add_argument(f'--{style.replace("_", "-")}', dest=style, type=convert,
+                             help='defaults to the pattern configuration')
+        sub.add_argument('--format', '-f', choices=sorted(EXPORT_FORMATS), default='svg',
+                         help='output format (default: svg)')
+        sub.add_argument('--output', '-o',
+                         help=f'output file, "-" for stdout (default: {family.filename}.<format>)')
+    return parser
+
+
+def main(argv=None):
+    """Entry point of the ori-kin console script."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ['batch']:
+        from .utils.batch import main as batch_main
+        return batch_main(argv[1:], prog='ori-kin batch')
+
+    args = build_parser().parse_args(argv)
+    family = PATTERN_FAMILIES[args.pattern]
+    style = {name: getattr(args, name) for name in STYLE_PARAMS if getattr(args, name) is not None}
+    try:
+        export = prepare_export(args.pattern, *(getattr(args, param) for param in family.params), **style)
+        output = args.output or export.filename(args.format)
+        stream = sys.stdout.buffer if output == '-' else open(output, 'wb')
+        try:
+            for chunk in export.stream(args.format):
+                stream.write(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+        finally:
+            if stream is not sys.stdout.buffer:
+                stream.close()
+    except Exception as e:
+        print(f"ori-kin: error: {e}", file=sys.stderr)
+        return 1
+    if output != '-':
+        print(output, file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Coalescing of superseded pattern requests across threads and worker processes.
+"""
+import hashlib
+import multiprocessing
+
+# Number of (session, page) entries; a colliding entry only disables
+# coalescing for the session it displaced, it never drops a current request
+SEQUENCER_SLOTS = 4096
+
+
+class RequestSequencer:
+    """
+    Latest request ticket per (session, channel), shared between processes.
+
+    A request that finds a newer ticket for its session and channel is
+    superseded; the browser only shows the answer to the latest one.
+
+    Args:
+        slots (int): Size of the hash table
+    """
+
+    def __init__(self, slots=SEQUENCER_SLOTS):
+        self.slots = slots
+        self._lock = multiprocessing.Lock()
+        self._counter = multiprocessing.RawValue('q', 0)
+        self._keys = multiprocessing.RawArray('q', slots)
+        self._tickets = multiprocessing.RawArray('q', slots)
+
+    def _slot(self, session, channel):
+        digest = hashlib.blake2b(f'{session}\0{channel}'.encode(), digest_size=8).digest()
+        key = int.from_bytes(digest, 'little', signed=True) or 1  # 0 marks an empty slot
+        return key % self.slots, key
+
+    def begin(self, session, channel):
+        """
+        Register a new request.
+
+        Args:
+            session (str): Browser session id, may be None
+            channel (str): Request stream within the session, e.g. the page
+
+        Returns:
+            int: Ticket of the request, None when there is no session
+        """
+        if not session:
+            return None
+        index, key = self._slot(session, channel)
+        with self._lock:
+            self._counter.value += 1
+            ticket = self._counter.value
+            self._keys[index] = key
+            self._tickets[index] = ticket
+        return ticket
+
+    def superseded(self, session, channel, ticket):
+        """Return True if a newer request of the same session and channel has arrived."""
+        if ticket is None:
+            return False
+        index, key = self._slot(session, channel)
+        with self._lock:
+            return self._keys[index] == key and self._tickets[index] > ticket
+
+
+# Created at import time in shared memory. Worker processes share it only if
+# they are forked after the import, i.e. with gunicorn's preload_app (set in
+# gunicorn_config.py); otherwise each worker coalesces its own requests.
+request_sequencer = RequestSequencer()
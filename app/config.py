@@ -1,10 +1,17 @@
-import plotly.express as px
-
 # Color configurations
-SET1_COLORS = px.colors.qualitative.Set1
+# Plotly's qualitative Set1 palette (plotly.express.colors.qualitative.Set1),
+# spelled out so the layouts don't import plotly.express
+SET1_COLORS = [
+    'rgb(228,26,28)', 'rgb(55,126,184)', 'rgb(77,175,74)',
+    'rgb(152,78,163)', 'rgb(255,127,0)', 'rgb(255,255,51)',
+    'rgb(166,86,40)', 'rgb(247,129,191)', 'rgb(153,153,153)',
+]
 ADDITIONAL_COLORS = ['red', 'black', 'blue', 'green']
 ALL_COLORS = SET1_COLORS + ADDITIONAL_COLORS
 
 # Color options for dropdowns
 COLOR_OPTIONS = [{'label': f'Color {i+1}', 'value': color} for i, color in enumerate(SET1_COLORS)] + \
                 [{'label': color.capitalize(), 'value': color} for color in ADDITIONAL_COLORS]
+
+# Seconds a parameter input waits after the last keystroke before it updates the pattern
+INPUT_DEBOUNCE = 0.4
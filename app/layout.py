@@ -1,7 +1,7 @@
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 
-from .config import COLOR_OPTIONS
+from .config import COLOR_OPTIONS, INPUT_DEBOUNCE
 from .utils.config_loader import get_pseudo_dome_config
 
 
@@ -91,7 +91,7 @@ def create_pseudo_dome_layout():
                                 }
                             ),
                         ], style={'margin-bottom': '5px'}),
-                        dcc.Input(id='radius-input', type='number', value=5, min=1, step=0.1, 
+                        dcc.Input(id='radius-input', type='number', debounce=INPUT_DEBOUNCE, value=5, min=1, step=0.1, 
                                  style={'width': '100%', 'margin-bottom': '5px'})
                     ], style={'margin-bottom': '15px'}),
                     html.Div([
@@ -111,7 +111,7 @@ def create_pseudo_dome_layout():
                                 }
                             ),
                         ], style={'margin-bottom': '5px'}),
-                        dcc.Input(id='segments-input', type='number', value=5, min=3, step=1,
+                        dcc.Input(id='segments-input', type='number', debounce=INPUT_DEBOUNCE, value=5, min=3, step=1,
                                  style={'width': '100%', 'margin-bottom': '5px'})
                     ], style={'margin-bottom': '20px'}),
                     # Hidden inputs with values from config (no UI elements)
@@ -194,7 +194,7 @@ def create_barrel_vault_layout():
                             }
                         ),
                     ], style={'margin-bottom': '5px'}),
-                    dcc.Input(id='barrel-radius-input', type='number', value=2, min=1, step=0.1,
+                    dcc.Input(id='barrel-radius-input', type='number', debounce=INPUT_DEBOUNCE, value=2, min=1, step=0.1,
                              style={'width': '100%', 'margin-bottom': '5px'})
                 ], style={'margin-bottom': '15px'}),
                 html.Div([
@@ -214,7 +214,7 @@ def create_barrel_vault_layout():
                             }
                         ),
                     ], style={'margin-bottom': '5px'}),
-                    dcc.Input(id='barrel-segments-input', type='number', value=6, min=3, max=20, step=1,
+                    dcc.Input(id='barrel-segments-input', type='number', debounce=INPUT_DEBOUNCE, value=6, min=3, max=20, step=1,
                              style={'width': '100%', 'margin-bottom': '5px'})
                 ], style={'margin-bottom': '15px'}),
                 html.Div([
@@ -234,7 +234,7 @@ def create_barrel_vault_layout():
                             }
                         ),
                     ], style={'margin-bottom': '5px'}),
-                    dcc.Input(id='barrel-tiles-input', type='number', value=1, min=1, max=20, step=1,
+                    dcc.Input(id='barrel-tiles-input', type='number', debounce=INPUT_DEBOUNCE, value=1, min=1, max=20, step=1,
                              style={'width': '100%', 'margin-bottom': '5px'})
                 ], style={'margin-bottom': '15px'}),
                 html.Div([
@@ -254,7 +254,7 @@ def create_barrel_vault_layout():
                             }
                         ),
                     ], style={'margin-bottom': '5px'}),
-                    dcc.Input(id='barrel-height-input', type='number', value=1, min=0, max=20, step=0.001,
+                    dcc.Input(id='barrel-height-input', type='number', debounce=INPUT_DEBOUNCE, value=1, min=0, max=20, step=0.001,
                              style={'width': '100%', 'margin-bottom': '5px'})
                 ], style={'margin-bottom': '15px'}),
                 html.Div([
@@ -274,7 +274,7 @@ def create_barrel_vault_layout():
                             }
                         ),
                     ], style={'margin-bottom': '5px'}),
-                    dcc.Input(id='barrel-omega-input', type='number', value=180, min=1, max=360, step=1,
+                    dcc.Input(id='barrel-omega-input', type='number', debounce=INPUT_DEBOUNCE, value=180, min=1, max=360, step=1,
                              style={'width': '100%', 'margin-bottom': '5px'})
                 ], style={'margin-bottom': '20px'}),
                 # Hidden inputs for configuration values (loaded from YAML)
@@ -342,7 +342,7 @@ def create_double_barrel_vault_layout():
                             }
                         ),
                     ], style={'margin-bottom': '5px'}),
-                    dcc.Input(id='double-barrel-radius-input', type='number', value=2, min=1, step=0.1,
+                    dcc.Input(id='double-barrel-radius-input', type='number', debounce=INPUT_DEBOUNCE, value=2, min=1, step=0.1,
                              style={'width': '100%', 'margin-bottom': '5px'})
                 ], style={'margin-bottom': '15px'}),
                 html.Div([
@@ -362,7 +362,7 @@ def create_double_barrel_vault_layout():
                             }
                         ),
                     ], style={'margin-bottom': '5px'}),
-                    dcc.Input(id='double-barrel-segments-input', type='number', value=6, min=3, max=20, step=1,
+                    dcc.Input(id='double-barrel-segments-input', type='number', debounce=INPUT_DEBOUNCE, value=6, min=3, max=20, step=1,
                              style={'width': '100%', 'margin-bottom': '5px'})
                 ], style={'margin-bottom': '15px'}),
                 html.Div([
@@ -382,7 +382,7 @@ def create_double_barrel_vault_layout():
                             }
                         ),
                     ], style={'margin-bottom': '5px'}),
-                    dcc.Input(id='double-barrel-tiles-input', type='number', value=1, min=1, max=20, step=1,
+                    dcc.Input(id='double-barrel-tiles-input', type='number', debounce=INPUT_DEBOUNCE, value=1, min=1, max=20, step=1,
                              style={'width': '100%', 'margin-bottom': '5px'})
                 ], style={'margin-bottom': '15px'}),
                 html.Div([
@@ -402,7 +402,7 @@ def create_double_barrel_vault_layout():
                             }
                         ),
                     ], style={'margin-bottom': '5px'}),
-                    dcc.Input(id='double-barrel-distance-input', type='number', value=1, min=0, step=0.01,
+                    dcc.Input(id='double-barrel-distance-input', type='number', debounce=INPUT_DEBOUNCE, value=1, min=0, step=0.01,
                              style={'width': '100%', 'margin-bottom': '5px'})
                 ], style={'margin-bottom': '15px'}),
                 html.Div([
@@ -422,7 +422,7 @@ def create_double_barrel_vault_layout():
                             }
                         ),
                     ], style={'margin-bottom': '5px'}),
-                    dcc.Input(id='double-barrel-omega-input', type='number', value=180, min=1, max=360, step=1,
+                    dcc.Input(id='double-barrel-omega-input', type='number', debounce=INPUT_DEBOUNCE, value=180, min=1, max=360, step=1,
                              style={'width': '100%', 'margin-bottom': '5px'})
                 ], style={'margin-bottom': '20px'}),
                 # Hidden inputs for configuration values (loaded from YAML)
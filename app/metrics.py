@@ -0,0 +1,124 @@
+"""
+Prometheus metrics for callbacks, exports and pattern generation.
+"""
+import os
+import time
+
+from flask import Response, g, has_request_context, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess,
+)
+
+from .utils.cache import geometry_cache
+from .utils.export import EXPORT_LISTENERS
+
+# Histogram buckets
+LATENCY_BUCKETS = (.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30)
+BYTES_BUCKETS = tuple(2 ** exponent for exponent in range(10, 27, 2))  # 1 KB to 64 MB
+SEGMENT_BUCKETS = tuple(4 ** exponent for exponent in range(2, 11))    # 16 to ~1M
+
+DASH_CALLBACK_PATH = '/_dash-update-component'
+
+CALLBACK_DURATION = Histogram(
+    'orikin_callback_duration_seconds', 'Dash callback request latency',
+    ['callback', 'segments'], buckets=LATENCY_BUCKETS)
+CALLBACK_BYTES = Histogram(
+    'orikin_callback_response_bytes', 'Dash callback response payload size',
+    ['callback'], buckets=BYTES_BUCKETS)
+CALLBACK_SEGMENTS = Histogram(
+    'orikin_callback_segments', 'Segments of the patterns generated by a Dash callback',
+    ['callback'], buckets=SEGMENT_BUCKETS)
+EXPORT_DURATION = Histogram(
+    'orikin_export_duration_seconds', 'Time to write an exported file',
+    ['pattern', 'format'], buckets=LATENCY_BUCKETS)
+EXPORT_BYTES = Histogram(
+    'orikin_export_bytes', 'Size of an exported file',
+    ['pattern', 'format'], buckets=BYTES_BUCKETS)
+EXPORT_SEGMENTS = Histogram(
+    'orikin_export_segments', 'Segments in an exported pattern',
+    ['pattern'], buckets=SEGMENT_BUCKETS)
+GENERATION_DURATION = Histogram(
+    'orikin_generation_duration_seconds', 'Pattern generation time on a cache miss',
+    ['pattern'], buckets=LATENCY_BUCKETS)
+GENERATION_SEGMENTS = Histogram(
+    'orikin_generation_segments', 'Segments in a generated pattern',
+    ['pattern'], buckets=SEGMENT_BUCKETS)
+CACHE_REQUESTS = Counter(
+    'orikin_geometry_cache_requests', 'Geometry cache lookups',
+    ['pattern', 'result'])
+
+
+def segment_bucket(count):
+    """Return the label of the SEGMENT_BUCKETS bucket holding count, e.g. '1024' or '+Inf'."""
+    if count is None:
+        return 'none'
+    return next((str(bound) for bound in SEGMENT_BUCKETS if count <= bound), '+Inf')
+
+
+def observe_generation(name, geometry, seconds):
+    """Geometry cache listener."""
+    if has_request_context():
+        # Attributed to the Dash callback serving this request
+        g.metrics_segments = g.get('metrics_segments', 0) + len(geometry)
+    if seconds is None:
+        CACHE_REQUESTS.labels(name, 'hit').inc()
+        return
+    CACHE_REQUESTS.labels(name, 'miss').inc()
+    GENERATION_DURATION.labels(name).observe(seconds)
+    GENERATION_SEGMENTS.labels(name).observe(len(geometry))
+
+
+def observe_export(export, fmt, seconds, size):
+    """Export engine listener."""
+    pattern = export.family.name
+    EXPORT_DURATION.labels(pattern, fmt).observe(seconds)
+    EXPORT_BYTES.labels(pattern, fmt).observe(size)
+    EXPORT_SEGMENTS.labels(pattern).observe(len(export.geometry))
+
+
+def metrics_registry():
+    """Return the registry to scrape: all workers in multiprocess mode, else this process."""
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def register_metrics(app):
+    """
+    Instrument a Dash app and serve its metrics on /metrics.
+
+    Args:
+        app (dash.Dash): Dash app with its callbacks registered
+    """
+    if observe_generation not in geometry_cache.listeners:
+        geometry_cache.listeners.append(observe_generation)
+    if observe_export not in EXPORT_LISTENERS:
+        EXPORT_LISTENERS.append(observe_export)
+
+    server = app.server
+
+    @server.before_request
+    def start_timer():
+        if request.path == DASH_CALLBACK_PATH:
+            g.metrics_start = time.perf_counter()
+
+    @server.after_request
+    def observe_callback(response):
+        start = g.pop('metrics_start', None)
+        if start is not None:
+            # Label by callback function name; the output spec identifies the callback
+            output = (request.get_json(silent=True) or {}).get('output')
+            callback = app.callback_map.get(output, {}).get('callback')
+            name = getattr(callback, '__name__', 'unknown')
+            segments = g.pop('metrics_segments', None)
+            CALLBACK_DURATION.labels(name, segment_bucket(segments)).observe(time.perf_counter() - start)
+            CALLBACK_BYTES.labels(name).observe(response.calculate_content_length() or 0)
+            if segments is not None:
+                CALLBACK_SEGMENTS.labels(name).observe(segments)
+        return response
+
+    @server.route('/metrics')
+    def metrics():
+        return Response(generate_latest(metrics_registry()), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,47 @@
+"""
+Plain Flask routes served next to the Dash app.
+"""
+from flask import Response, abort, request, stream_with_context
+
+from .utils.export import EXPORT_FORMATS, PARAM_TYPES, PATTERN_FAMILIES, STYLE_PARAMS, prepare_export
+
+
+def _parse_args(names, types, required):
+    """Read parameters from the query string, aborting with 400 on bad input."""
+    values = {}
+    for name in names:
+        value = request.args.get(name)
+        if not value:
+            if required:
+                abort(400, description=f"missing parameter '{name}'")
+            continue
+        try:
+            values[name] = types[name](value)
+        except ValueError:
+            abort(400, description=f"invalid value for '{name}': {value}")
+    return values
+
+
+def register_export_routes(server):
+    """
+    Register the streaming export routes on the Flask server.
+
+    /export/<pattern>.<fmt> serves any registered format, with the pattern
+    parameters in the query string, e.g. /export/pseudo-dome.svgz?r=1&n=8
+
+    Args:
+        server (flask.Flask): Server of the Dash app
+    """
+    @server.route('/export/<pattern>.<fmt>')
+    def export_pattern(pattern, fmt):
+        if pattern not in PATTERN_FAMILIES or fmt not in EXPORT_FORMATS:
+            abort(404)
+        family = PATTERN_FAMILIES[pattern]
+        params = _parse_args(family.params, PARAM_TYPES, required=True)
+        style = _parse_args(STYLE_PARAMS, STYLE_PARAMS, required=False)
+
+        # Generate before the response starts so errors still produce a status code
+        export = prepare_export(pattern, *(params[name] for name in family.params), **style)
+        headers = {'Content-Disposition': f'attachment; filename="{export.filename(fmt)}"'}
+        return Response(stream_with_context(export.stream(fmt)),
+                        mimetype=EXPORT_FORMATS[fmt].mimetype, headers=headers)
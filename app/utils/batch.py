@@ -0,0 +1,270 @@
+"""
+Batch export of pattern catalogues.
+"""
+import argparse
+import itertools
+import json
+import logging
+import os
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from .export import EXPORT_FORMATS, PARAM_TYPES, PATTERN_FAMILIES, STYLE_PARAMS, get_family, get_format, prepare_export
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.jsonl'
+
+# Chunks per worker when the chunk size is chosen automatically
+CHUNKS_PER_WORKER = 4
+
+
+def expand_grid(grid):
+    """
+    Expand a parameter grid into the list of its parameter sets.
+
+    Args:
+        grid (dict): Parameter name -> value or list of values
+
+    Returns:
+        list: Parameter dictionaries of the Cartesian product, last name varying fastest
+    """
+    names = list(grid)
+    values = [value if isinstance(value, (list, tuple, range)) else [value] for value in grid.values()]
+    return [dict(zip(names, combination)) for combination in itertools.product(*values)]
+
+
+def job_name(pattern, params):
+    """
+    Return the file stem of a job, e.g. "pseudo_dome_pattern_r1_n8".
+
+    Args:
+        pattern (str): Pattern family name
+        params (dict): Geometric parameters by name
+    """
+    family = get_family(pattern)
+    return '_'.join([family.filename] + [f'{name}{params[name]:g}' for name in family.params])
+
+
+def _export_chunk(pattern, jobs, formats, style):
+    """
+    Export a chunk of parameter sets (runs in a worker process).
+
+    Returns:
+        list: (name, params, {format: bytes} or None, error message or None) per job
+    """
+    family = get_family(pattern)
+    results = []
+    for params in jobs:
+        name = job_name(pattern, params)
+        try:
+            export = prepare_export(pattern, *(params[key] for key in family.params), **style)
+            files = {fmt: export.render(fmt) for fmt in formats}
+        except Exception as e:
+            results.append((name, params, None, f'{e.__class__.__name__}: {e}'))
+        else:
+            results.append((name, params, files, None))
+    return results
+
+
+class _Output:
+    """Write exported files into a directory or, for a .zip path, a zip archive."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.is_zip = self.path.suffix == '.zip'
+        if self.is_zip:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.manifest_path = self.path.with_suffix('.manifest.jsonl')
+            self.archive = zipfile.ZipFile(self.path, 'a', compression=zipfile.ZIP_DEFLATED)
+        else:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self.manifest_path = self.path / MANIFEST_NAME
+            self.archive = None
+        self.manifest = open(self.manifest_path, 'a')
+
+    def write(self, filename, data):
+        if self.archive is not None:
+            if filename in self.archive.NameToInfo:
+                # Left over from a failed job of an earlier run; keep the archive readable
+                logger.warning("%s already exists in %s, skipping", filename, self.path)
+                return
+            self.archive.writestr(filename, data)
+        else:
+            (self.path / filename).write_bytes(data)
+
+    def exists(self, filename):
+        if self.archive is not None:
+            return filename in self.archive.NameToInfo
+        return (self.path / filename).is_file()
+
+    def record(self, entry):
+        self.manifest.write(json.dumps(entry) + '\n')
+        self.manifest.flush()
+
+    def close(self):
+        self.manifest.close()
+        if self.archive is not None:
+            self.archive.close()
+
+
+def read_manifest(path):
+    """
+    Read the successfully exported jobs from a manifest.
+
+    Args:
+        path (str): Manifest file
+
+    Returns:
+        dict: Job name -> {format: filename} of the jobs with status "ok"
+    """
+    done = {}
+    if not os.path.exists(path):
+        return done
+    with open(path) as file:
+        for line in file:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Truncated last line of an interrupted run
+                continue
+            if entry.get('status') == 'ok':
+                done[entry['name']] = entry.get('files', {})
+    return done
+
+
+def run_batch(pattern, param_sets, output, formats=('svg',), style=None, workers=None,
+              chunk_size=None, resume=False):
+    """
+    Export a list of parameter sets on a process pool.
+
+    Args:
+        pattern (str): Pattern family name
+        param_sets (list): Parameter dictionaries, see expand_grid
+        output (str): Output directory, or a path ending in .zip for a zip archive
+        formats (iterable): Registered format names
+        style (dict): Style arguments of prepare_export shared by all jobs
+        workers (int): Number of worker processes, defaults to the CPU count
+        chunk_size (int): Parameter sets per task, chosen from the job count by default
+        resume (bool): Skip jobs the manifest records as exported whose files still exist
+
+    Returns:
+        dict: Counts of 'ok', 'error' and 'skipped' jobs
+    """
+    family = get_family(pattern)
+    formats = list(formats)
+    for fmt in formats:
+        get_format(fmt)
+    style = dict(style or {})
+    for params in param_sets:
+        missing = [name for name in family.params if name not in params]
+        if missing:
+            raise ValueError(f"parameter set {params} is missing {', '.join(missing)}")
+
+    out = _Output(output)
+    counts = {'ok': 0, 'error': 0, 'skipped': 0}
+    try:
+        if resume:
+            done = {name for name, files in read_manifest(out.manifest_path).items()
+                    if set(formats) <= set(files) and all(out.exists(files[fmt]) for fmt in formats)}
+            todo = [params for params in param_sets if job_name(pattern, params) not in done]
+            counts['skipped'] = len(param_sets) - len(todo)
+        else:
+            todo = list(param_sets)
+        if not todo:
+            return counts
+
+        workers = workers or os.cpu_count() or 1
+        chunk_size = chunk_size or max(1, -(-len(todo) // (workers * CHUNKS_PER_WORKER)))
+        chunks = [todo[start:start + chunk_size] for start in range(0, len(todo), chunk_size)]
+        logger.info("Exporting %d %s patterns in %d chunks on %d workers",
+                    len(todo), pattern, len(chunks), workers)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_export_chunk, pattern, chunk, formats, style) for chunk in chunks]
+            for future in as_completed(futures):
+                for name, params, files, error in future.result():
+                    entry = {'name': name, 'pattern': pattern, 'params': params}
+                    if error is None:
+                        entry['files'] = {}
+                        for fmt, data in files.items():
+                            filename = f'{name}.{EXPORT_FORMATS[fmt].extension}'
+                            out.write(filename, data)
+                            entry['files'][fmt] = filename
+                        entry['status'] = 'ok'
+                    else:
+                        logger.warning("Export of %s failed: %s", name, error)
+                        entry['status'] = 'error'
+                        entry['error'] = error
+                    out.record(entry)
+                    counts[entry['status']] += 1
+    finally:
+        out.close()
+    return counts
+
+
+def _parse_values(name, text, types):
+    """Parse "v1,v2,..." or an inclusive integer range "start..stop[..step]"."""
+    convert = types[name]
+    if '..' in text:
+        bounds = [int(part) for part in text.split('..')]
+        start, stop, step = (bounds + [1])[:3]
+        return list(range(start, stop + 1, step))
+    return [convert(value) for value in text.split(',')]
+
+
+def _parse_assignments(assignments, types):
+    values = {}
+    for assignment in assignments:
+        name, sep, text = assignment.partition('=')
+        if not sep or name not in types:
+            raise argparse.ArgumentTypeError(f"invalid assignment '{assignment}'")
+        values[name] = _parse_values(name, text, types)
+    return values
+
+
+def main(argv=None, prog='python -m app.utils.batch'):
+    """Command line entry point of the batch exporter."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Export a grid of pattern parameters on all cores.')
+    parser.add_argument('pattern', choices=sorted(PATTERN_FAMILIES))
+    parser.add_argument('--param', action='append', default=[], metavar='NAME=VALUES',
+                        help='values of a parameter: "1,2.5" or an integer range "3..40[..step]"')
+    parser.add_argument('--params-file', help='JSON file with a list of parameter sets or a grid')
+    parser.add_argument('--style', action='append', default=[], metavar='NAME=VALUE',
+                        help=f'style argument ({", ".join(STYLE_PARAMS)})')
+    parser.add_argument('--format', action='append', dest='formats', choices=sorted(EXPORT_FORMATS),
+                        help='output format, may be repeated (default: svg)')
+    parser.add_argument('--output', '-o', required=True, help='output directory or .zip file')
+    parser.add_argument('--workers', '-j', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, help='parameter sets per task')
+    parser.add_argument('--resume', action='store_true', help='skip jobs recorded as exported in the manifest')
+    args = parser.parse_args(argv)
+
+    try:
+        param_sets = []
+        if args.params_file:
+            with open(args.params_file) as file:
+                loaded = json.load(file)
+            param_sets = loaded if isinstance(loaded, list) else expand_grid(loaded)
+        if args.param:
+            param_sets += expand_grid(_parse_assignments(args.param, PARAM_TYPES))
+        style = {name: values[0] for name, values in _parse_assignments(args.style, STYLE_PARAMS).items()}
+    except (OSError, ValueError, argparse.ArgumentTypeError) as e:
+        parser.error(str(e))
+    if not param_sets:
+        parser.error('no parameter sets given (use --param or --params-file)')
+
+    logging.basicConfig(format='%(levelname)s %(message)s')
+    logging.getLogger('app').setLevel(logging.INFO)
+    counts = run_batch(args.pattern, param_sets, args.output, args.formats or ['svg'], style,
+                       workers=args.workers, chunk_size=args.chunk_size, resume=args.resume)
+    print(f"{counts['ok']} exported, {counts['error']} failed, {counts['skipped']} skipped")
+    return 1 if counts['error'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
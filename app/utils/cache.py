@@ -0,0 +1,129 @@
+"""
+In-process cache for generated pattern geometry.
+"""
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+
+# Default cache bounds
+GEOMETRY_CACHE_SIZE = 64
+GEOMETRY_CACHE_MAX_AGE = 600  # seconds
+
+# Digits kept when canonicalizing float parameters
+CANONICAL_DIGITS = 12
+
+
+def canonicalize(value):
+    """
+    Normalize a generator argument for use in a cache key.
+
+    Empty values (None, '' from the hidden style inputs) all mean "use the
+    config default"; numbers compare by value regardless of int/float/numpy type.
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, bool):
+        return value
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return value
+    if number.is_integer():
+        return int(number)
+    return round(number, CANONICAL_DIGITS)
+
+
+class GeometryCache:
+    """
+    Thread-safe LRU cache with a maximum size and a maximum entry age.
+
+    Args:
+        maxsize (int): Maximum number of entries
+        max_age (float): Seconds after which an entry is regenerated
+    """
+
+    def __init__(self, maxsize=GEOMETRY_CACHE_SIZE, max_age=GEOMETRY_CACHE_MAX_AGE):
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Called as listener(pattern name, geometry, seconds) after every lookup
+        # through cached_geometry; seconds is the generation time, None on a hit
+        self.listeners = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            created, value = entry
+            if time.monotonic() - created > self.max_age:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store value under key, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+geometry_cache = GeometryCache()
+
+
+def cached_geometry(name):
+    """
+    Memoize a pattern generator in the shared geometry cache.
+
+    The key is the pattern name plus the generator's canonicalized arguments.
+    The returned geometry is frozen before it is stored. Cached generators
+    take geometric parameters only; callers attach the style table afterwards
+    with with_styles, so a colour or width change reuses the cached geometry.
+
+    Args:
+        name (str): Pattern family name, also passed to the cache listeners
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (name, tuple(canonicalize(arg) for arg in bound.arguments.values()))
+            geometry = geometry_cache.get(key)
+            seconds = None
+            if geometry is None:
+                start = time.perf_counter()
+                geometry = func(*args, **kwargs).freeze()
+                seconds = time.perf_counter() - start
+                geometry_cache.put(key, geometry)
+            for listener in geometry_cache.listeners:
+                listener(name, geometry, seconds)
+            return geometry
+
+        wrapper.cache = geometry_cache
+        return wrapper
+    return decorator
@@ -66,4 +66,179 @@ def calculate_beta_angle(a,r,n):
     """Calculate double barrel vault's beta angle using ASKK's equation from notes"""
     invcos_a2r = np.acos(a / (2*r)) 
     return np.degrees((2*invcos_a2r) - invcos_a2r/n) 
-        
\ No newline at end of file
+        
+
+### Fold angles
+# A crease folds by the deviation from flat of the angle between the facets it
+# joins, 180 - beta. Each function returns the (mountain, valley) fold angle
+# magnitudes in degrees. The pseudo-dome has no such closed form: its zigzag
+# angles beta are angles in the flat pattern, not between folded facets.
+def calculate_barrel_vault_fold_angles(n, omega):
+    """Barrel vault fold angles: 180 - beta = theta (equation 3.7), i.e. twice the folding angle α"""
+    theta = 2 * calculate_folding_angle(calculate_segment_angle(omega, n))
+    return theta, theta
+
+def calculate_double_barrel_vault_fold_angles(r, n, a):
+    """Double barrel vault fold angles from ASKK's beta angle"""
+    fold_angle = 180 - calculate_beta_angle(a, r, n)
+    return fold_angle, fold_angle
+
+
+### Batched calculations
+def _structured(fields, shape=None):
+    """
+    Pack named arrays into one structured array.
+
+    Without a shape the fields are broadcast against each other. With a shape,
+    trailing axes beyond it become per-segment subarray fields.
+    """
+    arrays = {name: np.asarray(value) for name, value in fields.items()}
+    if shape is None:
+        shape = np.broadcast_shapes(*(value.shape for value in arrays.values()))
+    dtype = [(name, value.dtype, value.shape[len(shape):]) for name, value in arrays.items()]
+    result = np.empty(shape, dtype=dtype)
+    for name, value in arrays.items():
+        result[name] = value
+    return result
+
+
+def calculate_parameters_batch(r, n):
+    """
+    Vectorized calculate_parameters for arrays of radii and segment counts.
+
+    r and n are broadcast against each other and every configuration is
+    evaluated in one pass. Per-segment quantities are padded with NaN up to
+    the largest n in the batch.
+
+    Args:
+        r (array_like): Radii of the domes
+        n (array_like): Numbers of segments (n >= 3)
+
+    Returns:
+        np.ndarray: Structured array with the broadcast shape of r and n and fields
+            r, n, theta1, theta_l, CD, alpha11, num_radial_segments,
+            thetas, s, A, h (n_max,), beta, a (n_max - 1,) and alpha (n_max, 2)
+
+    Raises:
+        ValueError: If any n is less than 3
+    """
+    r, n = np.broadcast_arrays(np.asarray(r, dtype=np.float64), np.asarray(n, dtype=np.int64))
+    if (n < 3).any():
+        raise ValueError("the pseudo-dome needs at least 3 segments")
+    shape = r.shape
+    r, n = r.ravel(), n.ravel()
+    n_max = int(n.max())
+    rows = np.arange(len(n))
+
+    theta1 = np.radians(180 / (n * (n + 1)))
+    theta_l = (np.pi / n) - theta1
+    CD = (theta_l - theta1) / (n - 1)
+
+    i = np.arange(n_max)
+    thetas = np.where(i < n[:, None], theta1[:, None] + i * CD[:, None], np.nan)
+    s = 2 * r[:, None] * np.sin(thetas / 2)
+    A = np.pi/2 - thetas/2
+    beta = A[:, :-1] + A[:, 1:]
+    a = 2 * r[:, None] * np.cos((np.pi - (thetas[:, :-1] + thetas[:, 1:])) / 2)
+
+    sin_beta = np.sin(beta)
+    alpha = np.full((len(n), n_max, 2), np.nan)
+    alpha[:, :-1, 0] = np.arcsin(sin_beta * s[:, 1:] / a)
+    alpha[:, :-1, 1] = np.arcsin(sin_beta * s[:, :-1] / a)
+
+    h = np.full((len(n), n_max), np.nan)
+    h[:, :-1] = s[:, :-1] * np.sin(alpha[:, :-1, 0])
+
+    # last parameters that are special
+    alpha_l1 = np.pi - (beta[rows, n - 2] + alpha[rows, n - 3, 1])
+    alpha[rows, n - 1, 0] = alpha_l1
+    alpha[rows, n - 1, 1] = np.pi/2 - alpha_l1
+    h[rows, n - 1] = s[rows, n - 1] * np.sin(alpha_l1)
+
+    # Calculate number of radial segments
+    alpha11 = alpha[:, 0, 0]
+    num_radial_segments = np.rint(360 / (2 * np.degrees(alpha11 / 2))).astype(np.int64)
+
+    per_segment = lambda values: values.reshape(shape + values.shape[1:])
+    return _structured({
+        'r': r.reshape(shape),
+        'n': n.reshape(shape),
+        'theta1': theta1.reshape(shape),
+        'theta_l': theta_l.reshape(shape),
+        'CD': CD.reshape(shape),
+        'alpha11': alpha11.reshape(shape),
+        'num_radial_segments': num_radial_segments.reshape(shape),
+        'thetas': per_segment(thetas),
+        's': per_segment(s),
+        'A': per_segment(A),
+        'beta': per_segment(beta),
+        'a': per_segment(a),
+        'alpha': per_segment(alpha),
+        'h': per_segment(h),
+    }, shape)
+
+
+def calculate_barrel_vault_parameters(r, n, omega, h=None):
+    """
+    Vectorized barrel vault calculations (equations 3.1 - 3.10).
+
+    All inputs are broadcast against each other.
+
+    Args:
+        r (array_like): Radii
+        n (array_like): Numbers of segments
+        omega (array_like): Central angles in degrees
+        h (array_like): Requested unit cell heights, clamped to [0, h_max].
+            Defaults to h_max.
+
+    Returns:
+        np.ndarray: Structured array with fields r, n, omega, theta, s, alpha, h_max, h
+    """
+    r = np.asarray(r, dtype=np.float64)
+    n = np.asarray(n, dtype=np.int64)
+    omega = np.asarray(omega, dtype=np.float64)
+
+    theta = calculate_segment_angle(omega, n)
+    s = calculate_segment_length(r, theta)
+    alpha = calculate_folding_angle(theta)
+    h_max = calculate_height(s, alpha)
+    h = h_max if h is None else np.clip(h, 0, h_max)
+
+    return _structured({
+        'r': r, 'n': n, 'omega': omega,
+        'theta': theta, 's': s, 'alpha': alpha, 'h_max': h_max, 'h': h,
+    })
+
+
+def calculate_double_barrel_vault_parameters(r, n, omega, a):
+    """
+    Vectorized double barrel vault calculations.
+
+    All inputs are broadcast against each other.
+
+    Args:
+        r (array_like): Radii
+        n (array_like): Numbers of segments
+        omega (array_like): Central angles in degrees
+        a (array_like): Distances between barrel vault centers
+
+    Returns:
+        np.ndarray: Structured array with fields r, n, omega, a, theta, s,
+            alpha1, beta, alpha2, h
+    """
+    r = np.asarray(r, dtype=np.float64)
+    n = np.asarray(n, dtype=np.int64)
+    omega = np.asarray(omega, dtype=np.float64)
+    a = np.asarray(a, dtype=np.float64)
+
+    theta = calculate_segment_angle(omega, n)
+    s = calculate_segment_length(r, theta)
+    alpha1 = calculate_alpha1_angle(a, r, n)
+    beta = calculate_beta_angle(a, r, n)
+    alpha2 = calculate_alpha2_angle(beta)
+    h = calculate_height(s, alpha1)
+
+    return _structured({
+        'r': r, 'n': n, 'omega': omega, 'a': a,
+        'theta': theta, 's': s, 'alpha1': alpha1, 'beta': beta, 'alpha2': alpha2, 'h': h,
+    })
@@ -3,8 +3,53 @@ Common utility functions shared across pattern generators and export functions.
 """
 import numpy as np
 
-# Default rounding precision for coordinate comparison
-ROUNDING_DECIMAL = 4
+from .geometry import (
+    BOUNDARY, CONNECTING, MOUNTAIN, ROUNDING_DECIMAL, VALLEY,
+    CreaseGeometry, TiledGeometry, make_style,
+)
+from .spatial import SegmentIndex
+
+
+def find_duplicate_segments(segments, rounding_decimal=ROUNDING_DECIMAL):
+    """
+    Find duplicate segments in one vectorized pass.
+
+    Endpoints are rounded to rounding_decimal and put in a canonical order, so
+    a segment and its reversed copy are duplicates. The first segment of each
+    group of duplicates is kept.
+
+    Args:
+        segments (np.ndarray): (N, 4) array of (x0, y0, x1, y1) rows
+        rounding_decimal (int): Number of decimal places to round coordinates to
+
+    Returns:
+        tuple: (keep, counts) where keep is an (N,) boolean mask of the segments
+            to keep and counts is an (N,) array with the number of segments
+            sharing each segment's endpoints
+    """
+    # adding 0.0 turns -0.0 into 0.0 so both round to the same key
+    keys = np.round(np.asarray(segments, dtype=np.float64).reshape(-1, 4), rounding_decimal) + 0.0
+    start, end = keys[:, :2], keys[:, 2:]
+    swap = (start[:, 0] > end[:, 0]) | ((start[:, 0] == end[:, 0]) & (start[:, 1] > end[:, 1]))
+    keys[swap] = keys[swap][:, [2, 3, 0, 1]]
+
+    n = len(keys)
+    keep = np.zeros(n, dtype=bool)
+    counts = np.zeros(n, dtype=np.int64)
+    if n == 0:
+        return keep, counts
+
+    # lexsort is stable, so the first row of each group is its first occurrence
+    order = np.lexsort(keys.T[::-1])
+    sorted_keys = keys[order]
+    new_group = np.empty(n, dtype=bool)
+    new_group[0] = True
+    np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1, out=new_group[1:])
+    group_starts = np.flatnonzero(new_group)
+    keep[order[group_starts]] = True
+    group_sizes = np.diff(np.append(group_starts, n))
+    counts[order] = np.repeat(group_sizes, group_sizes)
+    return keep, counts
 
 
 def remove_duplicate_traces(traces, rounding_decimal=ROUNDING_DECIMAL):
@@ -21,9 +66,7 @@ def remove_duplicate_traces(traces, rounding_decimal=ROUNDING_DECIMAL):
     Returns:
         list: List of unique traces
     """
-    unique_traces = []
-    unique_coords = set()
-
+    endpoints = []
     for trace in traces:
         # Handle both go.Scatter objects and dictionaries
         if hasattr(trace, 'x') and hasattr(trace, 'y'):
@@ -32,20 +75,89 @@ def remove_duplicate_traces(traces, rounding_decimal=ROUNDING_DECIMAL):
         else:
             # This is a dictionary
             x, y = trace['x'], trace['y']
+        endpoints.append((x[0], y[0], x[-1], y[-1]))
+
+    keep, _ = find_duplicate_segments(endpoints, rounding_decimal)
+    return [trace for trace, kept in zip(traces, keep) if kept]
+
+
+def remove_duplicate_segments(geometry, rounding_decimal=ROUNDING_DECIMAL):
+    """
+    Remove duplicate segments from a CreaseGeometry.
+
+    Array counterpart of remove_duplicate_traces: the first segment with a
+    given set of rounded endpoints is kept, regardless of direction.
+
+    Args:
+        geometry (CreaseGeometry): Pattern geometry
+        rounding_decimal (int): Number of decimal places to round coordinates to
+
+    Returns:
+        CreaseGeometry: Geometry holding only the unique segments
+    """
+    keep, _ = find_duplicate_segments(geometry.segments, rounding_decimal)
+    return geometry.subset(keep)
 
-        # Create coordinate tuple for comparison
-        trace_coords = (
-            np.round(x[0], rounding_decimal),
-            np.round(y[0], rounding_decimal),
-            np.round(x[-1], rounding_decimal),
-            np.round(y[-1], rounding_decimal)
-        )
 
-        if trace_coords not in unique_coords:
-            unique_coords.add(trace_coords)
-            unique_traces.append(trace)
+def tile_unit_cell(unit_cell, hl_pos, total_length, m, h, rounding_decimal=ROUNDING_DECIMAL):
+    """
+    Tile a barrel vault unit cell m times above and below itself.
+
+    Copies are spaced 4*h apart. Horizontal segments on the bottom and top
+    edges of the cell are shared with the neighbouring copy and owned once;
+    the outermost edges are replaced by black boundary lines.
+
+    Args:
+        unit_cell (CreaseGeometry): Unit cell segments
+        hl_pos (list): Y positions of the bottom, centre and top horizontal lines
+        total_length (float): Width of the pattern
+        m (int): Number of tiles
+        h (float): Unit cell height
+        rounding_decimal (int): Number of decimal places used to match edge positions
 
-    return unique_traces
+    Returns:
+        TiledGeometry: Lazily tiled pattern
+    """
+    # horizontal segments on the bottom and top edge lines of the cell; some
+    # fold lines run past the sheet, so search the cell's full width
+    index = SegmentIndex(unit_cell.segments, rounding_decimal)
+    x_min, _, x_max, _ = unit_cell.bounds()
+    bottom_edge = np.zeros(len(unit_cell), dtype=bool)
+    bottom_edge[index.overlapping(x_min, hl_pos[0], x_max, hl_pos[0])] = True
+    top_edge = np.zeros(len(unit_cell), dtype=bool)
+    top_edge[index.overlapping(x_min, hl_pos[-1], x_max, hl_pos[-1])] = True
+
+    # new boundary lines on top and bottom that are black
+    y_bottom = hl_pos[0]*(2*m-1)
+    y_top = hl_pos[-1]*(2*m-1)
+    edges = CreaseGeometry([[0, hlp, total_length, hlp] for hlp in [y_bottom, y_top]],
+                           [BOUNDARY, BOUNDARY], unit_cell.styles)
+
+    # with h == 0 every copy coincides with the unit cell
+    return TiledGeometry(unit_cell, (0, 4*h), m if h != 0 else 1, bottom_edge, top_edge, edges)
+
+
+def vault_styles(fold_color_1, fold_color_2, connecting_color, mv_width, connecting_width, connecting_line_style):
+    """
+    Style table of the barrel vault crease kinds.
+
+    Args:
+        fold_color_1 (str): Color for mountain folds
+        fold_color_2 (str): Color for valley folds
+        connecting_color (str): Color for connecting lines
+        mv_width (float): Line width for mountain and valley folds
+        connecting_width (float): Line width for connecting lines
+        connecting_line_style (str): Dash style of the connecting lines
+
+    Returns:
+        dict: Crease kind -> style entry
+    """
+    return {
+        MOUNTAIN: make_style(fold_color_1, mv_width),
+        VALLEY: make_style(fold_color_2, mv_width, 'solid'),
+        CONNECTING: make_style(connecting_color, connecting_width, connecting_line_style),
+        BOUNDARY: make_style('black', mv_width, 'solid'),
+    }
 
 
 def get_dxf_color(rgb_str):
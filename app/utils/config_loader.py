@@ -1,71 +1,166 @@
+import logging
 import os
+import threading
 import yaml
 from pathlib import Path
+from types import MappingProxyType
 
-def load_config(config_file):
+logger = logging.getLogger(__name__)
+
+# Fallback values used when a configuration file can't be loaded or misses keys
+PSEUDO_DOME_DEFAULTS = {
+    'colors': {
+        'fold_color_1': 'red',
+        'fold_color_2': 'red',
+        'radial_color': 'blue'
+    },
+    'line_widths': {
+        'fold_width': 3,
+        'radial_width': 3
+    },
+    'line_styles': {
+        'radial_line_style': 'solid'
+    }
+}
+
+BARREL_VAULT_DEFAULTS = {
+    'colors': {
+        'fold_color_1': 'red',
+        'fold_color_2': 'red',
+        'connecting_color': 'black'
+    },
+    'line_widths': {
+        'fold_width': 3,
+        'connecting_width': 3
+    },
+    'line_styles': {
+        'connecting_line_style': 'solid'
+    }
+}
+
+# Parsed configurations keyed by file path: (mtime_ns or None on failure, frozen config)
+_config_cache = {}
+_config_lock = threading.Lock()
+
+
+def _freeze(value):
+    """Recursively wrap dictionaries in read-only mapping proxies."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def validate_config(config, defaults, config_file=None):
+    """
+    Check a configuration against its defaults and fill in missing values.
+
+    Args:
+        config (dict): Parsed configuration
+        defaults (dict): Default configuration with every required section and key
+        config_file (str): Path used in log messages
+
+    Returns:
+        dict: Configuration with all sections and keys of defaults
+
+    Raises:
+        ValueError: If the configuration or one of its sections is not a mapping
+    """
+    if not isinstance(config, dict):
+        raise ValueError("configuration must be a mapping")
+    validated = dict(config)
+    for section, section_defaults in defaults.items():
+        values = config.get(section, {})
+        if not isinstance(values, dict):
+            raise ValueError(f"section '{section}' must be a mapping")
+        merged = dict(section_defaults)
+        merged.update(values)
+        missing = sorted(set(section_defaults) - set(values))
+        if missing:
+            logger.warning("Configuration file %s is missing %s.%s, using defaults",
+                           config_file, section, ', '.join(missing))
+        validated[section] = merged
+    return validated
+
+
+def load_config(config_file, defaults=PSEUDO_DOME_DEFAULTS):
     """
     Load a YAML configuration file
-    
+
+    The file is parsed once per process and re-read only when its modification
+    time changes. The returned configuration is read-only.
+
     Args:
         config_file (str): Path to the configuration file
-        
+        defaults (dict): Defaults used for missing keys, or for everything if
+            the file can't be loaded
+
     Returns:
-        dict: Configuration dictionary
+        Mapping: Configuration dictionary
     """
+    config_file = str(config_file)
     try:
+        mtime = os.stat(config_file).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    with _config_lock:
+        cached = _config_cache.get(config_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        if mtime is None:
+            raise FileNotFoundError(config_file)
         with open(config_file, 'r') as file:
-            config = yaml.safe_load(file)
-        return config
+            config = validate_config(yaml.safe_load(file), defaults, config_file)
     except Exception as e:
-        print(f"Error loading configuration file {config_file}: {str(e)}")
+        logger.warning("Error loading configuration file %s: %s; using defaults", config_file, e)
         # Return default configuration if file can't be loaded
-        return {
-            'colors': {
-                'fold_color_1': 'red',
-                'fold_color_2': 'red',
-                'radial_color': 'blue'
-            },
-            'line_widths': {
-                'fold_width': 3,
-                'radial_width': 3
-            },
-            'line_styles': {
-                'radial_line_style': 'solid'
-            }
-        }
+        config = defaults
+
+    config = _freeze(config)
+    with _config_lock:
+        _config_cache[config_file] = (mtime, config)
+    return config
+
+
+def clear_config_cache():
+    """Forget all parsed configuration files."""
+    with _config_lock:
+        _config_cache.clear()
 
 def get_pseudo_dome_config():
     """
     Get the Pseudo-Dome pattern configuration
-    
+
     Returns:
-        dict: Pseudo-Dome configuration dictionary
+        Mapping: Pseudo-Dome configuration dictionary
     """
     # Get the absolute path to the config file
     base_dir = Path(__file__).parent.parent
     config_file = os.path.join(base_dir, 'config', 'pseudo_dome_config.yaml')
-    return load_config(config_file)
+    return load_config(config_file, PSEUDO_DOME_DEFAULTS)
 
 def get_barrel_vault_config():
     """
     Get the Barrel Vault pattern configuration
 
     Returns:
-        dict: Barrel Vault configuration dictionary
+        Mapping: Barrel Vault configuration dictionary
     """
     # Get the absolute path to the config file
     base_dir = Path(__file__).parent.parent
     config_file = os.path.join(base_dir, 'config', 'barrel_vault_config.yaml')
-    return load_config(config_file)
+    return load_config(config_file, BARREL_VAULT_DEFAULTS)
 
 def get_double_barrel_vault_config():
     """
     Get the Double Barrel Vault pattern configuration
 
     Returns:
-        dict: Double Barrel Vault configuration dictionary
+        Mapping: Double Barrel Vault configuration dictionary
     """
     # Get the absolute path to the config file
     base_dir = Path(__file__).parent.parent
     config_file = os.path.join(base_dir, 'config', 'double_barrel_vault_config.yaml')
-    return load_config(config_file)
+    return load_config(config_file, BARREL_VAULT_DEFAULTS)
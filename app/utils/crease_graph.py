@@ -0,0 +1,107 @@
+"""
+Vertex/edge graph of a crease pattern.
+"""
+import numpy as np
+
+from .geometry import (
+    BOUNDARY, CONNECTING, CUT, MOUNTAIN, RADIAL, ROUNDING_DECIMAL, VALLEY,
+    CreaseGeometry,
+)
+from .spatial import SegmentIndex
+
+# Fold assignment per crease kind, as FOLD edges_assignment letters:
+# M(ountain), V(alley), F(lat), B(oundary), C(ut)
+FOLD_ASSIGNMENTS = {
+    MOUNTAIN: 'M',
+    VALLEY: 'V',
+    RADIAL: 'F',
+    # the vault generators draw connecting lines only at x = 0 and
+    # x = total_length, i.e. they are the left and right edges of the sheet
+    CONNECTING: 'B',
+    CUT: 'C',
+    BOUNDARY: 'B',
+}
+
+
+class CreaseGraph:
+    """
+    Crease pattern as merged vertices and the edges between them.
+
+    Attributes:
+        vertices (np.ndarray): (V, 2) float64 vertex coordinates
+        edges (np.ndarray): (E, 2) int64 start and end vertex ids
+        kinds (np.ndarray): (E,) int8 crease kinds
+        styles (dict): Crease kind -> style entry (see make_style)
+    """
+
+    def __init__(self, vertices, edges, kinds, styles=None):
+        self.vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+        self.edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        self.kinds = np.asarray(kinds, dtype=np.int8)
+        if len(self.kinds) != len(self.edges):
+            raise ValueError("edges and kinds must have the same length")
+        self.styles = styles if styles is not None else {}
+
+    def __len__(self):
+        return len(self.edges)
+
+    def __repr__(self):
+        return f"CreaseGraph({len(self.vertices)} vertices, {len(self)} edges)"
+
+    @classmethod
+    def from_geometry(cls, geometry, rounding_decimal=ROUNDING_DECIMAL):
+        """
+        Build the graph of a generated pattern.
+
+        Endpoints that agree to rounding_decimal places are merged into one
+        vertex. Edges that collapse into a single vertex, repeat an earlier
+        edge (in either direction) or have a non-finite endpoint are dropped;
+        the remaining edges keep the order of the geometry.
+
+        Args:
+            geometry (CreaseGeometry or TiledGeometry): Pattern geometry
+            rounding_decimal (int): Decimal places at which endpoints coincide
+
+        Returns:
+            CreaseGraph: Merged graph
+        """
+        vertices, vertex_ids = SegmentIndex(geometry.segments, rounding_decimal).merge_endpoints()
+        edges = vertex_ids.reshape(-1, 2)
+
+        valid = np.flatnonzero((edges[:, 0] >= 0) & (edges[:, 1] >= 0) & (edges[:, 0] != edges[:, 1]))
+        low = np.minimum(edges[valid, 0], edges[valid, 1])
+        high = np.maximum(edges[valid, 0], edges[valid, 1])
+        _, first = np.unique(low * len(vertices) + high, return_index=True)
+        keep = valid[np.sort(first)]
+        edges = edges[keep]
+
+        # renumber the vertices left without an edge away
+        used = np.zeros(len(vertices), dtype=bool)
+        used[edges] = True
+        new_ids = np.cumsum(used) - 1
+        return cls(vertices[used], new_ids[edges], geometry.kinds[keep], geometry.styles)
+
+    @property
+    def assignments(self):
+        """(E,) array of FOLD assignment letters of the edges."""
+        table = np.array([FOLD_ASSIGNMENTS.get(kind, 'U') for kind in range(max(FOLD_ASSIGNMENTS) + 1)])
+        return table[self.kinds]
+
+    @property
+    def segments(self):
+        """(E, 4) array of (x0, y0, x1, y1) edge coordinates."""
+        return self.vertices[self.edges].reshape(-1, 4)
+
+    def to_geometry(self):
+        """Return the edges as a CreaseGeometry with exactly shared endpoints."""
+        return CreaseGeometry(self.segments, self.kinds, self.styles)
+
+    def bounds(self):
+        """
+        Return the axis-aligned extents of the vertices.
+
+        Returns:
+            tuple: (min_x, min_y, max_x, max_y)
+        """
+        (min_x, min_y), (max_x, max_y) = self.vertices.min(axis=0), self.vertices.max(axis=0)
+        return float(min_x), float(min_y), float(max_x), float(max_y)
@@ -1,9 +1,10 @@
-import os
-import tempfile
-import base64
-from io import BytesIO
-
-import ezdxf
+"""
+Export engine for all pattern families.
+"""
+import logging
+import math
+import re
+import time
 
 from .pattern_generator import generate_pattern
 from .barrel_vault_single import generate_barrel_vault_pattern
@@ -13,745 +14,519 @@ from .config_loader import (
     get_barrel_vault_config,
     get_double_barrel_vault_config
 )
+from .calculations import (
+    calculate_barrel_vault_fold_angles,
+    calculate_double_barrel_vault_fold_angles,
+)
 from .common_utils import get_dxf_color
+from .crease_graph import CreaseGraph
+from .geometry import CONNECTING, CUT, MOUNTAIN, RADIAL, VALLEY
+from .fold_writer import FOLD_MIMETYPE, iter_fold_document
+from .svg_writer import SVG_MIMETYPE, SVGZ_MIMETYPE, gzip_chunks, iter_svg_document, svg_bounds
+
+logger = logging.getLogger(__name__)
+
+# Crease kinds drawn with the accent (radial or connecting) line style
+ACCENT_KINDS = (RADIAL, CONNECTING)
+
+# SVG dash patterns for the configurable line styles
+SVG_DASHARRAYS = {
+    'dash': '5,5',
+    'dot': '1,3',
+    'dashdot': '5,2,1,2',
+}
+
+# Types of the geometric parameters, for parsing them from text
+PARAM_TYPES = {
+    'r': float,
+    'n': int,
+    'm': int,
+    'omega': float,
+    'h': float,
+    'a': float,
+}
+
+_NAMED_COLOR = re.compile(r'[A-Za-z]+|#(?:[0-9A-Fa-f]{3}){1,2}')
+_RGB_COLOR = re.compile(r'rgb\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)')
+
+
+def parse_color(text):
+    """
+    Check a colour argument: a colour name, #rgb or #rrggbb, or rgb(r,g,b).
 
+    Raises:
+        ValueError: If the colour can't be written to SVG and DXF
+    """
+    if 'rgb' in text:
+        match = _RGB_COLOR.fullmatch(text)
+        if match is None or any(int(channel) > 255 for channel in match.groups()):
+            raise ValueError(f"invalid rgb colour: {text}")
+    elif not _NAMED_COLOR.fullmatch(text):
+        raise ValueError(f"invalid colour: {text}")
+    return text
 
-def create_dxf(r, n, fold_color_1=None, fold_color_2=None, radial_color=None, fold_width=None, radial_width=None):
-    # Load configuration from YAML file
-    config = get_pseudo_dome_config()
-    
-    # Use provided values or defaults from config
-    fold_color_1 = fold_color_1 or config['colors']['fold_color_1']
-    fold_color_2 = fold_color_2 or config['colors']['fold_color_2']
-    radial_color = radial_color or config['colors']['radial_color']
-    fold_width = fold_width or config['line_widths']['fold_width']
-    radial_width = radial_width or config['line_widths']['radial_width']
-    radial_line_style = config['line_styles']['radial_line_style']
-    
+
+def parse_width(text):
     """
-    Create DXF file with exact dimensions matching the pattern generation
-    Using newer AutoCAD format for better compatibility
+    Parse a line width argument.
+
+    Raises:
+        ValueError: If the width is not a positive finite number
+    """
+    width = float(text)
+    if not (math.isfinite(width) and width > 0):
+        raise ValueError(f"line width must be positive: {text}")
+    return width
+
+
+# Optional style arguments of prepare_export and their types
+STYLE_PARAMS = {
+    'fold_color_1': parse_color,
+    'fold_color_2': parse_color,
+    'accent_color': parse_color,
+    'fold_width': parse_width,
+    'accent_width': parse_width,
+}
+
+# Labels of the pattern parameters in the SVG metadata
+METADATA_LABELS = {
+    'r': 'radius',
+    'n': 'segments',
+    'm': 'tiles',
+    'omega': 'omega',
+    'h': 'height',
+    'a': 'distance',
+}
+
+
+class PatternFamily:
+    """
+    Description of one pattern family for the export engine.
+
+    Args:
+        name (str): Family name used in routes and file names, e.g. "barrel-vault"
+        generate (callable): Geometry generator taking params, then the style arguments
+        get_config (callable): Configuration getter of the family
+        params (tuple): Names of the geometric parameters, in generator order
+        accent (str): Config name of the non-fold crease ("radial" or "connecting")
+        fold_angles (callable): Takes the params by name, returns the (mountain, valley)
+            fold angles in degrees; None when the fold angles are not known
+        flip_y (bool): Whether the SVG is mirrored so the pattern isn't upside down
     """
-    try:
-        # Use AutoCAD 2010 format instead of R12
-        doc = ezdxf.new('AC1024')  # AutoCAD 2010
-        msp = doc.modelspace()
 
-        # Set units to meters with absolute coordinates
-        doc.header['$MEASUREMENT'] = 1     # Set measurement to metric
-        doc.header['$INSUNITS'] = 6        # 6 = meters (1 = inches)
-        doc.header['$LUNITS'] = 2          # Scientific notation
-        doc.header['$AUNITS'] = 0          # Decimal degrees
-        doc.header['$UNITMODE'] = 0        # Display units as decimal
-        
-        # Create required linetypes
-        if 'DASHED' not in doc.linetypes:
-            doc.linetypes.add('DASHED', pattern='A,0.5,-0.25')
-
-        # Get pattern using existing generate_pattern function
-        traces = generate_pattern(r, n, fold_color_1, fold_color_2, radial_color, fold_width, radial_width)
-        
-        # Track pattern extents for verification
-        min_x = min_y = float('inf')
-        max_x = max_y = float('-inf')
-        
-        # Add pattern lines using exact coordinates from generate_pattern
-        for trace in traces:
-            x, y = trace['x'], trace['y']
-            
-            if len(x) == 2 and all(coord is not None for coord in x + y):
-                start = (float(x[0]), float(y[0]))
-                end = (float(x[1]), float(y[1]))
-                
-                min_x = min(min_x, start[0], end[0])
-                max_x = max(max_x, start[0], end[0])
-                min_y = min(min_y, start[1], end[1])
-                max_y = max(max_y, start[1], end[1])
-                
-                # Add lines with appropriate line type and color
-                # Apply line style based on configuration
-                if trace['line']['color'] == radial_color:
-                    linetype = 'CONTINUOUS'
-                    if radial_line_style in ['dash', 'dot', 'dashdot']:
-                        linetype = radial_line_style
-                    
-                    # Use the color mapping function for radial color
-                    dxf_color = get_dxf_color(radial_color)
-                    msp.add_line(start, end, dxfattribs={
-                        'linetype': linetype,
-                        'color': dxf_color,
-                        'lineweight': radial_width
-                    })
-                else:
-                    # Determine if this is fold_color_1 or fold_color_2
-                    dxf_color = get_dxf_color(trace['line']['color'])
-                    msp.add_line(start, end, dxfattribs={
-                        'color': dxf_color,
-                        'lineweight': fold_width
-                    })
-
-        # Print exact dimensions for verification
-        print(f"DXF Pattern Dimensions:")
-        print(f"X extent: {min_x:.6f}m to {max_x:.6f}m (width: {(max_x - min_x):.6f}m)")
-        print(f"Y extent: {min_y:.6f}m to {max_y:.6f}m (height: {(max_y - min_y):.6f}m)")
-        print(f"Input radius: {r:.6f}m")
-        print(f"Measured radius: {max(abs(max_x), abs(max_y)):.6f}m")
-        
-        # Add verification circle at exact input radius
-        msp.add_circle((0, 0), r, dxfattribs={'color': 3})  # Green
-
-        # Setup dimension style
-        dimstyle = doc.dimstyles.new('METRIC')
-        dimstyle.dxf.dimscale = 1.0
-        dimstyle.dxf.dimexe = 0.05
-        dimstyle.dxf.dimexo = 0.05
-        dimstyle.dxf.dimasz = 0.1
-        dimstyle.dxf.dimtxt = 0.2
-        
-        # Add diameter dimension
-        msp.add_linear_dim(
-            base=(0, min_y - 0.5),
-            p1=(-max_x, 0),
-            p2=(max_x, 0),
-            dimstyle='METRIC',
-            override={
-                'dimtxt': 0.2,
-                'dimclrd': 7,  # Dimension line color
-                'dimclre': 7   # Extension line color
-            }
-        ).render()
-
-        # Create temporary file and save
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.dxf') as tmp_file:
-            tmp_filename = tmp_file.name
-            doc.saveas(tmp_filename)
-            
-            file_size = os.path.getsize(tmp_filename)
-            print(f"DXF file created: {file_size} bytes")
-            
-            with open(tmp_filename, 'rb') as f:
-                buffer = BytesIO(f.read())
-            
-        os.unlink(tmp_filename)
-        
-        buffer.seek(0)
-        return buffer
-
-    except Exception as e:
-        print(f"Error creating DXF: {str(e)}")
-        print(f"Error details: {str(e.__class__.__name__)}")
-        raise
+    def __init__(self, name, generate, get_config, params, accent, fold_angles, flip_y=False):
+        self.name = name
+        self.generate = generate
+        self.get_config = get_config
+        self.params = params
+        self.accent = accent
+        self.fold_angles = fold_angles
+        self.flip_y = flip_y
+
+    def __repr__(self):
+        return f"PatternFamily({self.name!r})"
+
+    @property
+    def filename(self):
+        """Base name of exported files, e.g. "barrel_vault_pattern"."""
+        return f"{self.name.replace('-', '_')}_pattern"
+
+
+PATTERN_FAMILIES = {
+    family.name: family for family in (
+        PatternFamily('pseudo-dome', generate_pattern, get_pseudo_dome_config,
+                      ('r', 'n'), 'radial', fold_angles=None, flip_y=True),
+        PatternFamily('barrel-vault', generate_barrel_vault_pattern, get_barrel_vault_config,
+                      ('r', 'n', 'm', 'omega', 'h'), 'connecting',
+                      lambda r, n, m, omega, h: calculate_barrel_vault_fold_angles(n, omega)),
+        PatternFamily('double-barrel-vault', generate_double_barrel_vault_pattern, get_double_barrel_vault_config,
+                      ('r', 'n', 'm', 'omega', 'a'), 'connecting',
+                      lambda r, n, m, omega, a: calculate_double_barrel_vault_fold_angles(r, n, a)),
+    )
+}
+
+
+class StyleTable:
+    """
+    Export attributes per crease kind, resolved once per generated pattern.
 
-def create_svg(r, n, fold_color_1=None, fold_color_2=None, radial_color=None, mv_width=None, radial_width=None):
-    """Create SVG for pseudo dome pattern"""
+    Attributes:
+        svg_strokes (dict): Crease kind -> (stroke colour, stroke width, stroke dasharray)
+    """
+
+    def __init__(self, geometry, config, accent, accent_line_style):
+        # Named colours are written as the config colour of their crease kind
+        config_colors = {
+            MOUNTAIN: config['colors']['fold_color_1'],
+            VALLEY: config['colors']['fold_color_2'],
+            CUT: config['colors']['fold_color_1'],
+        }
+        for kind in ACCENT_KINDS:
+            config_colors[kind] = config['colors'][f'{accent}_color']
+
+        self.styles = geometry.styles
+        self.accent_line_style = accent_line_style
+        self.svg_strokes = {}
+        for kind, style in self.styles.items():
+            color, width, dash = style['color'], style['width'], style['dash']
 
-    # Load configuration from YAML file
-    config = get_pseudo_dome_config()
-    
-    # Use provided values or defaults from config
-    fold_color_1 = fold_color_1 or config['colors']['fold_color_1']
-    fold_color_2 = fold_color_2 or config['colors']['fold_color_2']
-    radial_color = radial_color or config['colors']['radial_color']
-    mv_width = mv_width or config['line_widths']['fold_width']
-    radial_width = radial_width or config['line_widths']['radial_width']
-    radial_line_style = config['line_styles']['radial_line_style']
-    traces = generate_pattern(r, n, fold_color_1, fold_color_2, radial_color, mv_width, radial_width)
-    
-    # We'll set the viewBox after calculating the actual pattern dimensions
-    svg_lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        # Placeholder for viewBox, will be replaced after calculating dimensions
-        '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="800px" height="800px" viewBox="0 0 0 0" preserveAspectRatio="xMidYMid meet">',
-        # Add a comment about units
-        '<!-- Pattern dimensions in meters -->',
-        '<!-- Units: All measurements are in meters -->',
-    ]
-    
-    # Track min/max coordinates to verify viewBox
-    min_x = min_y = float('inf')
-    max_x = max_y = float('-inf')
-    
-    for trace in traces:
-        x, y = trace['x'], trace['y']
-        color = trace['line']['color']
-        width = trace['line']['width']
-        dash = trace['line']['dash']
-        
-        if len(x) == 2 and all(coord is not None for coord in x + y):
-            x1, y1, x2, y2 = float(x[0]), -float(y[0]), float(x[1]), -float(y[1])
-            
-            # Track pattern extents
-            min_x = min(min_x, x1, x2)
-            max_x = max(max_x, x1, x2)
-            min_y = min(min_y, y1, y2)
-            max_y = max(max_y, y1, y2)
-            
             # Apply line style based on configuration
-            stroke_dasharray = 'none'
-            if dash == 'dash' or (color == radial_color and radial_line_style == 'dash'):
-                stroke_dasharray = '5,5'
-            elif dash == 'dot' or (color == radial_color and radial_line_style == 'dot'):
-                stroke_dasharray = '1,3'
-            elif dash == 'dashdot' or (color == radial_color and radial_line_style == 'dashdot'):
-                stroke_dasharray = '5,2,1,2'
-            
-            # Ensure color is properly formatted
-            if color.startswith('rgb'):
-                # Already in correct format
-                stroke_color = color
-            else:
-                # Default to config colors if not in RGB format
-                if color == fold_color_1:
-                    stroke_color = config['colors']['fold_color_1']
-                elif color == fold_color_2:
-                    stroke_color = config['colors']['fold_color_2']
-                elif color == radial_color:
-                    stroke_color = config['colors']['radial_color']
-                else:
-                    stroke_color = color
-            
+            stroke_dasharray = SVG_DASHARRAYS.get(dash)
+            if stroke_dasharray is None and kind in ACCENT_KINDS:
+                stroke_dasharray = SVG_DASHARRAYS.get(accent_line_style)
+            stroke_color = color if color.startswith('rgb') else config_colors.get(kind, color)
             # Scale the line width to be proportional to the pattern size
-            # This ensures line widths look appropriate regardless of pattern size
-            scaled_width = width * 0.01  # Scale down the line width
-                    
-            line = f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="{stroke_color}" stroke-width="{scaled_width}" stroke-dasharray="{stroke_dasharray}" />'
-            svg_lines.append(line)
-    
-    svg_lines.append('</svg>')
-    
-    # Calculate the ideal viewBox based on actual pattern dimensions
-    pattern_width = max_x - min_x
-    pattern_height = max_y - min_y
-    
-    # Add 10% padding around the pattern
-    padding_x = pattern_width * 0.1
-    padding_y = pattern_height * 0.1
-    
-    # Calculate viewBox parameters
-    viewbox_x = min_x - padding_x
-    viewbox_y = min_y - padding_y
-    viewbox_width = pattern_width + (2 * padding_x)
-    viewbox_height = pattern_height + (2 * padding_y)
-    
-    # Add metadata to the SVG to indicate units
-    svg_lines.insert(3, f'<metadata>\n  <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">\n    <rdf:Description>\n      <units>meters</units>\n      <radius>{r}</radius>\n      <segments>{n}</segments>\n    </rdf:Description>\n  </rdf:RDF>\n</metadata>')
-    
-    # Replace the placeholder viewBox with the calculated one
-    viewbox_str = f'{viewbox_x} {viewbox_y} {viewbox_width} {viewbox_height}'
-    svg_content = '\n'.join(svg_lines)
-    svg_content = svg_content.replace('viewBox="0 0 0 0"', f'viewBox="{viewbox_str}"')
-    
-    # Print dimensions for verification
-    print(f"SVG Pattern Dimensions:")
-    print(f"X range: {min_x:.2f} to {max_x:.2f}, width: {pattern_width:.2f}")
-    print(f"Y range: {min_y:.2f} to {max_y:.2f}, height: {pattern_height:.2f}")
-    print(f"ViewBox: {viewbox_str}")
-    
-    return svg_content
+            self.svg_strokes[kind] = (stroke_color, width * 0.01, stroke_dasharray or 'none')
+        self._dxf_attribs = None
+
+    @property
+    def dxf_attribs(self):
+        """Crease kind -> dxfattribs dictionary, resolved on first use by the DXF writer."""
+        if self._dxf_attribs is None:
+            attribs = {}
+            for kind, style in self.styles.items():
+                attribs[kind] = {
+                    'color': get_dxf_color(style['color']),
+                    'lineweight': style['width']
+                }
+                if kind in ACCENT_KINDS:
+                    linetype = 'CONTINUOUS'
+                    if self.accent_line_style in SVG_DASHARRAYS:
+                        linetype = self.accent_line_style.upper()
+                    attribs[kind]['linetype'] = linetype
+            self._dxf_attribs = attribs
+        return self._dxf_attribs
 
 
-def create_barrel_vault_svg(r, n, m, omega, h, fold_color_1=None, fold_color_2=None, connecting_color=None, mv_width=None, connecting_width=None):
-    """Create SVG for barrel vault pattern"""
-    # Load configuration from YAML file
-    config = get_barrel_vault_config()
-    
-    # Use provided values or defaults from config
-    fold_color_1 = fold_color_1 or config['colors']['fold_color_1']
-    fold_color_2 = fold_color_2 or config['colors']['fold_color_2']
-    connecting_color = connecting_color or config['colors']['connecting_color']
-    mv_width = mv_width or config['line_widths']['fold_width']
-    connecting_width = connecting_width or config['line_widths']['connecting_width']
-    connecting_line_style = config['line_styles']['connecting_line_style']
-    
-    # Generate pattern using the barrel vault pattern generator
-    traces = generate_barrel_vault_pattern(r, n, m, omega, h, fold_color_1, fold_color_2, 
-                                          connecting_color, mv_width, connecting_width)
-    
-    # We'll set the viewBox after calculating the actual pattern dimensions
-    svg_lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        # Placeholder for viewBox, will be replaced after calculating dimensions
-        '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="800px" height="800px" viewBox="0 0 0 0" preserveAspectRatio="xMidYMid meet">',
-        # Add a comment about units
-        '<!-- Pattern dimensions in meters -->',
-        '<!-- Units: All measurements are in meters -->',
-    ]
-    
-    # Track min/max coordinates to determine viewBox
-    min_x = min_y = float('inf')
-    max_x = max_y = float('-inf')
-    
-    for trace in traces:
-        # For barrel vault pattern, the traces are go.Scatter objects, not dictionaries
-        # Extract x, y, and line properties safely
-        if hasattr(trace, 'x') and hasattr(trace, 'y') and hasattr(trace, 'line'):
-            # This is a go.Scatter object
-            x, y = trace.x, trace.y
-            color = trace.line.color
-            width = trace.line.width
-            # Safely get dash property, default to 'solid' if not present
-            dash = getattr(trace.line, 'dash', 'solid')
-        else:
-            # This is a dictionary (like in the pseudo dome pattern)
-            x, y = trace['x'], trace['y']
-            color = trace['line']['color']
-            width = trace['line']['width']
-            dash = trace['line'].get('dash', 'solid')
-        
-        # Convert plotly traces to SVG lines
-        if len(x) == 2 and all(coord is not None for coord in x + y):
-            x1, y1, x2, y2 = float(x[0]), float(y[0]), float(x[1]), float(y[1])
-            
-            # Track pattern extents
-            min_x = min(min_x, x1, x2)
-            max_x = max(max_x, x1, x2)
-            min_y = min(min_y, y1, y2)
-            max_y = max(max_y, y1, y2)
-            
-            # Apply line style based on configuration
-            stroke_dasharray = 'none'
-            if dash == 'dash' or (color == connecting_color and connecting_line_style == 'dash'):
-                stroke_dasharray = '5,5'
-            elif dash == 'dot' or (color == connecting_color and connecting_line_style == 'dot'):
-                stroke_dasharray = '1,3'
-            elif dash == 'dashdot' or (color == connecting_color and connecting_line_style == 'dashdot'):
-                stroke_dasharray = '5,2,1,2'
-            
-            # Ensure color is properly formatted
-            if color.startswith('rgb'):
-                # Already in correct format
-                stroke_color = color
-            else:
-                # Default to config colors if not in RGB format
-                if color == fold_color_1:
-                    stroke_color = config['colors']['fold_color_1']
-                elif color == fold_color_2:
-                    stroke_color = config['colors']['fold_color_2']
-                elif color == connecting_color:
-                    stroke_color = config['colors']['connecting_color']
-                else:
-                    stroke_color = color
-            
-            # Scale the line width to be proportional to the pattern size
-            scaled_width = width * 0.01  # Scale down the line width
-                    
-            line = f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="{stroke_color}" stroke-width="{scaled_width}" stroke-dasharray="{stroke_dasharray}" />'
-            svg_lines.append(line)
-    
-    svg_lines.append('</svg>')
-    
-    # Calculate the ideal viewBox based on actual pattern dimensions
-    pattern_width = max_x - min_x
-    pattern_height = max_y - min_y
-    
-    # Add 10% padding around the pattern
-    padding_x = pattern_width * 0.1
-    padding_y = pattern_height * 0.1
-    
-    # Calculate viewBox parameters
-    viewbox_x = min_x - padding_x
-    viewbox_y = min_y - padding_y
-    viewbox_width = pattern_width + (2 * padding_x)
-    viewbox_height = pattern_height + (2 * padding_y)
-    
-    # Add metadata to the SVG to indicate units
-    svg_lines.insert(3, f'<metadata>\n  <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">\n    <rdf:Description>\n      <units>meters</units>\n      <radius>{r}</radius>\n      <segments>{n}</segments>\n      <tiles>{m}</tiles>\n      <omega>{omega}</omega>\n      <height>{h}</height>\n    </rdf:Description>\n  </rdf:RDF>\n</metadata>')
-    
-    # Replace the placeholder viewBox with the calculated one
-    viewbox_str = f'{viewbox_x} {viewbox_y} {viewbox_width} {viewbox_height}'
-    svg_content = '\n'.join(svg_lines)
-    svg_content = svg_content.replace('viewBox="0 0 0 0"', f'viewBox="{viewbox_str}"')
-    
-    # Print dimensions for verification
-    print(f"Barrel Vault SVG Pattern Dimensions:")
-    print(f"X range: {min_x:.2f} to {max_x:.2f}, width: {pattern_width:.2f}")
-    print(f"Y range: {min_y:.2f} to {max_y:.2f}, height: {pattern_height:.2f}")
-    print(f"ViewBox: {viewbox_str}")
-    
-    return svg_content
+class PatternExport:
+    """
+    One generated pattern, ready to be written in any registered format.
 
+    Attributes:
+        family (PatternFamily): Pattern family
+        params (dict): Geometric parameters by name
+        geometry (CreaseGeometry or TiledGeometry): Generated geometry
+        styles (StyleTable): Export attributes per crease kind
+    """
 
-def create_barrel_vault_dxf(r, n, m, omega, h, fold_color_1=None, fold_color_2=None, connecting_color=None, fold_width=None, connecting_width=None):
-    """Create DXF file for barrel vault pattern"""
-    # Load configuration from YAML file
-    config = get_barrel_vault_config()
-    
-    # Use provided values or defaults from config
-    fold_color_1 = fold_color_1 or config['colors']['fold_color_1']
-    fold_color_2 = fold_color_2 or config['colors']['fold_color_2']
-    connecting_color = connecting_color or config['colors']['connecting_color']
-    fold_width = fold_width or config['line_widths']['fold_width']
-    connecting_width = connecting_width or config['line_widths']['connecting_width']
-    connecting_line_style = config['line_styles']['connecting_line_style']
-    
-    try:
-        # Use AutoCAD 2010 format instead of R12
-        doc = ezdxf.new('AC1024')  # AutoCAD 2010
-        msp = doc.modelspace()
+    def __init__(self, family, params, geometry, styles):
+        self.family = family
+        self.params = params
+        self.geometry = geometry
+        self.styles = styles
+        self._graph = None
+
+    def __repr__(self):
+        return f"PatternExport({self.family.name!r}, {self.params!r})"
+
+    @property
+    def graph(self):
+        """CreaseGraph of the pattern with merged vertices, built on first use."""
+        if self._graph is None:
+            self._graph = CreaseGraph.from_geometry(self.geometry)
+        return self._graph
+
+    def merged_geometry(self):
+        """
+        Return the graph edges as a CreaseGeometry with shared endpoints.
+
+        Degenerate patterns without a single finite edge are returned as generated.
+        """
+        if not len(self.graph):
+            return self.geometry
+        return self.graph.to_geometry()
+
+    def stream(self, fmt):
+        """
+        Write the pattern in a format, chunk by chunk.
+
+        Args:
+            fmt (str): Registered format name
+
+        Returns:
+            iterator: str or bytes chunks
+        """
+        chunks = get_format(fmt).writer(self)
+        if EXPORT_LISTENERS:
+            chunks = self._observed(chunks, fmt)
+        return chunks
+
+    def _observed(self, chunks, fmt):
+        """Pass chunks through and report the finished export to the listeners."""
+        start = time.perf_counter()
+        size = 0
+        for chunk in chunks:
+            size += len(chunk) if isinstance(chunk, bytes) or chunk.isascii() else len(chunk.encode('utf-8'))
+            yield chunk
+        seconds = time.perf_counter() - start
+        for listener in EXPORT_LISTENERS:
+            listener(self, fmt, seconds, size)
+
+    def render(self, fmt):
+        """
+        Write the pattern in a format.
+
+        Args:
+            fmt (str): Registered format name
+
+        Returns:
+            bytes: File content
+        """
+        return b''.join(chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+                        for chunk in self.stream(fmt))
+
+    def filename(self, fmt):
+        """Return the download file name for a format."""
+        return f"{self.family.filename}.{get_format(fmt).extension}"
+
+
+class ExportFormat:
+    """
+    Registered output format.
 
-        # Set units to meters with absolute coordinates
-        doc.header['$MEASUREMENT'] = 1     # Set measurement to metric
-        doc.header['$INSUNITS'] = 6        # 6 = meters (1 = inches)
-        doc.header['$LUNITS'] = 2          # Scientific notation
-        doc.header['$AUNITS'] = 0          # Decimal degrees
-        doc.header['$UNITMODE'] = 0        # Display units as decimal
-        
-        # Create required linetypes
-        if 'DASHED' not in doc.linetypes:
-            doc.linetypes.add('DASHED', pattern='A,0.5,-0.25')
-
-        # Get pattern using existing generate_barrel_vault_pattern function
-        traces = generate_barrel_vault_pattern(r, n, m, omega, h, fold_color_1, fold_color_2, connecting_color, fold_width, connecting_width)
-        
-        # Track pattern extents for verification
-        min_x = min_y = float('inf')
-        max_x = max_y = float('-inf')
-        
-        # Add pattern lines using exact coordinates from generate_pattern
-        for trace in traces:
-            # For barrel vault pattern, the traces are go.Scatter objects, not dictionaries
-            # Extract x, y, and line properties safely
-            if hasattr(trace, 'x') and hasattr(trace, 'y') and hasattr(trace, 'line'):
-                # This is a go.Scatter object
-                x, y = trace.x, trace.y
-                line_color = trace.line.color
-            else:
-                # This is a dictionary (like in the pseudo dome pattern)
-                x, y = trace['x'], trace['y']
-                line_color = trace['line']['color']
-            
-            if len(x) == 2 and all(coord is not None for coord in x + y):
-                start = (float(x[0]), float(y[0]))
-                end = (float(x[1]), float(y[1]))
-                
-                min_x = min(min_x, start[0], end[0])
-                max_x = max(max_x, start[0], end[0])
-                min_y = min(min_y, start[1], end[1])
-                max_y = max(max_y, start[1], end[1])
-                
-                # Add lines with appropriate line type and color
-                # Apply line style based on configuration
-                if line_color == connecting_color:
-                    linetype = 'CONTINUOUS'
-                    if connecting_line_style in ['dash', 'dot', 'dashdot']:
-                        linetype = connecting_line_style.upper()
-                    
-                    # Use the color mapping function for connecting color
-                    dxf_color = get_dxf_color(connecting_color)
-                    msp.add_line(start, end, dxfattribs={
-                        'linetype': linetype,
-                        'color': dxf_color,
-                        'lineweight': connecting_width
-                    })
-                else:
-                    # Determine if this is fold_color_1 or fold_color_2
-                    dxf_color = get_dxf_color(line_color)
-                    msp.add_line(start, end, dxfattribs={
-                        'color': dxf_color,
-                        'lineweight': fold_width
-                    })
-
-        # Print exact dimensions for verification
-        print(f"Barrel Vault DXF Pattern Dimensions:")
-        print(f"X extent: {min_x:.6f}m to {max_x:.6f}m (width: {(max_x - min_x):.6f}m)")
-        print(f"Y extent: {min_y:.6f}m to {max_y:.6f}m (height: {(max_y - min_y):.6f}m)")
-        
-        # Add verification rectangle at pattern extents
-        msp.add_lwpolyline([(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y), (min_x, min_y)], dxfattribs={'color': 3})  # Green
-
-        # Setup dimension style
-        dimstyle = doc.dimstyles.new('METRIC')
-        dimstyle.dxf.dimscale = 1.0
-        dimstyle.dxf.dimexe = 0.05
-        dimstyle.dxf.dimexo = 0.05
-        dimstyle.dxf.dimasz = 0.1
-        dimstyle.dxf.dimtxt = 0.2
-        
-        # Add width dimension
-        msp.add_linear_dim(
-            base=(0, min_y - 0.5),
-            p1=(min_x, 0),
-            p2=(max_x, 0),
-            dimstyle='METRIC',
-            override={
-                'dimtxt': 0.2,
-                'dimclrd': 7,  # Dimension line color
-                'dimclre': 7   # Extension line color
-            }
-        ).render()
-
-        # Create temporary file and save
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.dxf') as tmp_file:
-            tmp_filename = tmp_file.name
-            doc.saveas(tmp_filename)
-            
-            file_size = os.path.getsize(tmp_filename)
-            print(f"DXF file created: {file_size} bytes")
-            
-            with open(tmp_filename, 'rb') as f:
-                buffer = BytesIO(f.read())
-            
-        os.unlink(tmp_filename)
-        
-        buffer.seek(0)
-        # Convert BytesIO to base64 string for Dash
-        encoded = base64.b64encode(buffer.read()).decode()
-        return encoded
-
-    except Exception as e:
-        print(f"Error creating DXF: {str(e)}")
-        print(f"Error details: {str(e.__class__.__name__)}")
-        raise
+    Args:
+        name (str): Format name
+        writer (callable): Function taking a PatternExport and returning an iterable of chunks
+        mimetype (str): MIME type of the output
+        extension (str): File extension
+    """
 
-def create_double_barrel_vault_svg(r, n, m, omega, a, fold_color_1=None, fold_color_2=None, connecting_color=None, mv_width=None, connecting_width=None):
-    """Create SVG for double barrel vault pattern"""
-    # Load configuration from YAML file
-    config = get_double_barrel_vault_config()
+    def __init__(self, name, writer, mimetype, extension):
+        self.name = name
+        self.writer = writer
+        self.mimetype = mimetype
+        self.extension = extension
 
-    # Use provided values or defaults from config
-    fold_color_1 = fold_color_1 or config['colors']['fold_color_1']
-    fold_color_2 = fold_color_2 or config['colors']['fold_color_2']
-    connecting_color = connecting_color or config['colors']['connecting_color']
-    mv_width = mv_width or config['line_widths']['fold_width']
-    connecting_width = connecting_width or config['line_widths']['connecting_width']
-    connecting_line_style = config['line_styles']['connecting_line_style']
-
-    # Generate pattern using the double barrel vault pattern generator
-    traces = generate_double_barrel_vault_pattern(r, n, m, omega, a, fold_color_1, fold_color_2,
-                                          connecting_color, mv_width, connecting_width)
-
-    # We'll set the viewBox after calculating the actual pattern dimensions
-    svg_lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        # Placeholder for viewBox, will be replaced after calculating dimensions
-        '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="800px" height="800px" viewBox="0 0 0 0" preserveAspectRatio="xMidYMid meet">',
-        # Add a comment about units
-        '<!-- Pattern dimensions in meters -->',
-        '<!-- Units: All measurements are in meters -->',
-    ]
-
-    # Track min/max coordinates to determine viewBox
-    min_x = min_y = float('inf')
-    max_x = max_y = float('-inf')
-
-    for trace in traces:
-        # For double barrel vault pattern, the traces are go.Scatter objects, not dictionaries
-        # Extract x, y, and line properties safely
-        if hasattr(trace, 'x') and hasattr(trace, 'y') and hasattr(trace, 'line'):
-            # This is a go.Scatter object
-            x, y = trace.x, trace.y
-            color = trace.line.color
-            width = trace.line.width
-            # Safely get dash property, default to 'solid' if not present
-            dash = getattr(trace.line, 'dash', 'solid')
-        else:
-            # This is a dictionary (like in the pseudo dome pattern)
-            x, y = trace['x'], trace['y']
-            color = trace['line']['color']
-            width = trace['line']['width']
-            dash = trace['line'].get('dash', 'solid')
-
-        # Convert plotly traces to SVG lines
-        if len(x) == 2 and all(coord is not None for coord in x + y):
-            x1, y1, x2, y2 = float(x[0]), float(y[0]), float(x[1]), float(y[1])
-
-            # Track pattern extents
-            min_x = min(min_x, x1, x2)
-            max_x = max(max_x, x1, x2)
-            min_y = min(min_y, y1, y2)
-            max_y = max(max_y, y1, y2)
+    def __repr__(self):
+        return f"ExportFormat({self.name!r})"
 
-            # Apply line style based on configuration
-            stroke_dasharray = 'none'
-            if dash == 'dash' or (color == connecting_color and connecting_line_style == 'dash'):
-                stroke_dasharray = '5,5'
-            elif dash == 'dot' or (color == connecting_color and connecting_line_style == 'dot'):
-                stroke_dasharray = '1,3'
-            elif dash == 'dashdot' or (color == connecting_color and connecting_line_style == 'dashdot'):
-                stroke_dasharray = '5,2,1,2'
-
-            # Ensure color is properly formatted
-            if color.startswith('rgb'):
-                # Already in correct format
-                stroke_color = color
-            else:
-                # Default to config colors if not in RGB format
-                if color == fold_color_1:
-                    stroke_color = config['colors']['fold_color_1']
-                elif color == fold_color_2:
-                    stroke_color = config['colors']['fold_color_2']
-                elif color == connecting_color:
-                    stroke_color = config['colors']['connecting_color']
-                else:
-                    stroke_color = color
 
-            # Scale the line width to be proportional to the pattern size
-            scaled_width = width * 0.01  # Scale down the line width
+EXPORT_FORMATS = {}
 
-            line = f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="{stroke_color}" stroke-width="{scaled_width}" stroke-dasharray="{stroke_dasharray}" />'
-            svg_lines.append(line)
+# Called as listener(export, fmt, seconds, size) when a stream is exhausted;
+# seconds covers writing only, generation is reported by the geometry cache
+EXPORT_LISTENERS = []
 
-    svg_lines.append('</svg>')
 
-    # Calculate the ideal viewBox based on actual pattern dimensions
-    pattern_width = max_x - min_x
-    pattern_height = max_y - min_y
+def register_format(name, mimetype='application/octet-stream', extension=None):
+    """
+    Register a format writer.
 
-    # Add 10% padding around the pattern
-    padding_x = pattern_width * 0.1
-    padding_y = pattern_height * 0.1
+    The decorated function takes a PatternExport and returns an iterable of
+    str or bytes chunks.
 
-    # Calculate viewBox parameters
-    viewbox_x = min_x - padding_x
-    viewbox_y = min_y - padding_y
-    viewbox_width = pattern_width + (2 * padding_x)
-    viewbox_height = pattern_height + (2 * padding_y)
+    Args:
+        name (str): Format name
+        mimetype (str): MIME type of the output
+        extension (str): File extension, defaults to the format name
+    """
+    def decorator(writer):
+        EXPORT_FORMATS[name] = ExportFormat(name, writer, mimetype, extension or name)
+        return writer
+    return decorator
 
-    # Add metadata to the SVG to indicate units
-    svg_lines.insert(3, f'<metadata>\n  <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">\n    <rdf:Description>\n      <units>meters</units>\n      <radius>{r}</radius>\n      <segments>{n}</segments>\n      <tiles>{m}</tiles>\n      <omega>{omega}</omega>\n      <distance>{a}</distance>\n    </rdf:Description>\n  </rdf:RDF>\n</metadata>')
 
-    # Replace the placeholder viewBox with the calculated one
-    viewbox_str = f'{viewbox_x} {viewbox_y} {viewbox_width} {viewbox_height}'
-    svg_content = '\n'.join(svg_lines)
-    svg_content = svg_content.replace('viewBox="0 0 0 0"', f'viewBox="{viewbox_str}"')
+def get_format(fmt):
+    """
+    Look up a registered format.
 
-    # Print dimensions for verification
-    print(f"Double Barrel Vault SVG Pattern Dimensions:")
-    print(f"X range: {min_x:.2f} to {max_x:.2f}, width: {pattern_width:.2f}")
-    print(f"Y range: {min_y:.2f} to {max_y:.2f}, height: {pattern_height:.2f}")
-    print(f"ViewBox: {viewbox_str}")
+    Raises:
+        ValueError: If the format is not registered
+    """
+    try:
+        return EXPORT_FORMATS[fmt]
+    except KeyError:
+        raise ValueError(f"unknown export format '{fmt}'") from None
 
-    return svg_content
 
+def get_family(pattern):
+    """
+    Look up a pattern family by name.
+
+    Raises:
+        ValueError: If the pattern family doesn't exist
+    """
+    try:
+        return PATTERN_FAMILIES[pattern]
+    except KeyError:
+        raise ValueError(f"unknown pattern '{pattern}'") from None
+
+
+def prepare_export(pattern, *params, fold_color_1=None, fold_color_2=None, accent_color=None,
+                   fold_width=None, accent_width=None):
+    """
+    Generate a pattern and resolve its style table.
+
+    Args:
+        pattern (str): Pattern family name ("pseudo-dome", "barrel-vault", "double-barrel-vault")
+        *params: Geometric parameters in family order, e.g. r, n, m, omega, h
+        fold_color_1 (str): Mountain fold color
+        fold_color_2 (str): Valley fold color
+        accent_color (str): Radial or connecting line color
+        fold_width (float): Mountain/valley fold width
+        accent_width (float): Radial or connecting line width
+
+    Returns:
+        PatternExport: Generated pattern
+    """
+    family = get_family(pattern)
+    if len(params) != len(family.params):
+        raise TypeError(f"{pattern} takes parameters {', '.join(family.params)}")
 
-def create_double_barrel_vault_dxf(r, n, m, omega, a, fold_color_1=None, fold_color_2=None, connecting_color=None, fold_width=None, connecting_width=None):
-    """Create DXF file for double barrel vault pattern"""
     # Load configuration from YAML file
-    config = get_double_barrel_vault_config()
+    config = family.get_config()
 
     # Use provided values or defaults from config
     fold_color_1 = fold_color_1 or config['colors']['fold_color_1']
     fold_color_2 = fold_color_2 or config['colors']['fold_color_2']
-    connecting_color = connecting_color or config['colors']['connecting_color']
+    accent_color = accent_color or config['colors'][f'{family.accent}_color']
     fold_width = fold_width or config['line_widths']['fold_width']
-    connecting_width = connecting_width or config['line_widths']['connecting_width']
-    connecting_line_style = config['line_styles']['connecting_line_style']
+    accent_width = accent_width or config['line_widths'][f'{family.accent}_width']
+    accent_line_style = config['line_styles'][f'{family.accent}_line_style']
+
+    geometry = family.generate(*params, fold_color_1, fold_color_2, accent_color, fold_width, accent_width)
+    styles = StyleTable(geometry, config, family.accent, accent_line_style)
+    return PatternExport(family, dict(zip(family.params, params)), geometry, styles)
+
+
+def export_pattern(pattern, formats, *params, **style):
+    """
+    Generate a pattern once and write it in several formats.
+
+    Args:
+        pattern (str): Pattern family name
+        formats (iterable): Registered format names
+        *params: Geometric parameters in family order
+        **style: Style arguments of prepare_export
+
+    Returns:
+        dict: Format name -> file content (bytes)
+    """
+    export = prepare_export(pattern, *params, **style)
+    return {fmt: export.render(fmt) for fmt in formats}
 
-    try:
-        # Use AutoCAD 2010 format instead of R12
-        doc = ezdxf.new('AC1024')  # AutoCAD 2010
-        msp = doc.modelspace()
 
-        # Set units to meters with absolute coordinates
-        doc.header['$MEASUREMENT'] = 1     # Set measurement to metric
-        doc.header['$INSUNITS'] = 6        # 6 = meters (1 = inches)
-        doc.header['$LUNITS'] = 2          # Scientific notation
-        doc.header['$AUNITS'] = 0          # Decimal degrees
-        doc.header['$UNITMODE'] = 0        # Display units as decimal
+@register_format('svg', SVG_MIMETYPE)
+def write_svg(export):
+    """Write the pattern as an SVG document in meters, with shared vertices."""
+    flip_y = export.family.flip_y
+    geometry = export.merged_geometry()
+    # Report dimensions for verification
+    min_x, min_y, max_x, max_y = svg_bounds(geometry, flip_y)
+    logger.debug("%s SVG pattern dimensions: x %.2f to %.2f, y %.2f to %.2f",
+                 export.family.name, min_x, max_x, min_y, max_y)
+
+    metadata = [(METADATA_LABELS[name], value) for name, value in export.params.items()]
+    return iter_svg_document(geometry, export.styles.svg_strokes, metadata, flip_y=flip_y)
+
+
+@register_format('svgz', SVGZ_MIMETYPE)
+def write_svgz(export):
+    """Write the pattern as a gzip-compressed SVG document."""
+    return gzip_chunks(write_svg(export))
+
+
+@register_format('fold', FOLD_MIMETYPE)
+def write_fold(export):
+    """Write the crease graph as a FOLD document with fold assignments and, where known, angles."""
+    title = ' '.join([export.family.name] + [f'{name}={value}' for name, value in export.params.items()])
+    fold_angles = None
+    if export.family.fold_angles is not None:
+        fold_angles = export.family.fold_angles(**export.params)
+    return iter_fold_document(export.graph, fold_angles, title)
+
+
+@register_format('dxf', 'application/dxf')
+def write_dxf(export):
+    """
+    Create DXF file with exact dimensions matching the pattern generation
+    Using newer AutoCAD format for better compatibility
+    """
+    # ezdxf is only needed (and imported) for DXF output
+    from .dxf_writer import (
+        VERIFICATION_COLOR,
+        add_segments, add_width_dimension, dxf_to_bytes, new_document,
+    )
 
-        # Create required linetypes
-        if 'DASHED' not in doc.linetypes:
-            doc.linetypes.add('DASHED', pattern='A,0.5,-0.25')
+    try:
+        doc = new_document()
+        msp = doc.modelspace()
 
-        # Get pattern using existing generate_double_barrel_vault_pattern function
-        traces = generate_double_barrel_vault_pattern(r, n, m, omega, a, fold_color_1, fold_color_2, connecting_color, fold_width, connecting_width)
+        # Add pattern lines between the merged vertices, so connected lines share endpoints
+        geometry = export.merged_geometry()
+        add_segments(msp, geometry, export.styles.dxf_attribs)
 
         # Track pattern extents for verification
-        min_x = min_y = float('inf')
-        max_x = max_y = float('-inf')
-
-        # Add pattern lines using exact coordinates from generate_pattern
-        for trace in traces:
-            # For double barrel vault pattern, the traces are go.Scatter objects, not dictionaries
-            # Extract x, y, and line properties safely
-            if hasattr(trace, 'x') and hasattr(trace, 'y') and hasattr(trace, 'line'):
-                # This is a go.Scatter object
-                x, y = trace.x, trace.y
-                line_color = trace.line.color
-            else:
-                # This is a dictionary (like in the pseudo dome pattern)
-                x, y = trace['x'], trace['y']
-                line_color = trace['line']['color']
-
-            if len(x) == 2 and all(coord is not None for coord in x + y):
-                start = (float(x[0]), float(y[0]))
-                end = (float(x[1]), float(y[1]))
-
-                min_x = min(min_x, start[0], end[0])
-                max_x = max(max_x, start[0], end[0])
-                min_y = min(min_y, start[1], end[1])
-                max_y = max(max_y, start[1], end[1])
-
-                # Add lines with appropriate line type and color
-                # Apply line style based on configuration
-                if line_color == connecting_color:
-                    linetype = 'CONTINUOUS'
-                    if connecting_line_style in ['dash', 'dot', 'dashdot']:
-                        linetype = connecting_line_style.upper()
-
-                    # Use the color mapping function for connecting color
-                    dxf_color = get_dxf_color(connecting_color)
-                    msp.add_line(start, end, dxfattribs={
-                        'linetype': linetype,
-                        'color': dxf_color,
-                        'lineweight': connecting_width
-                    })
-                else:
-                    # Determine if this is fold_color_1 or fold_color_2
-                    dxf_color = get_dxf_color(line_color)
-                    msp.add_line(start, end, dxfattribs={
-                        'color': dxf_color,
-                        'lineweight': fold_width
-                    })
-
-        # Print exact dimensions for verification
-        print(f"Double Barrel Vault DXF Pattern Dimensions:")
-        print(f"X extent: {min_x:.6f}m to {max_x:.6f}m (width: {(max_x - min_x):.6f}m)")
-        print(f"Y extent: {min_y:.6f}m to {max_y:.6f}m (height: {(max_y - min_y):.6f}m)")
-
-        # Add verification rectangle at pattern extents
-        msp.add_lwpolyline([(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y), (min_x, min_y)], dxfattribs={'color': 3})  # Green
-
-        # Setup dimension style
-        dimstyle = doc.dimstyles.new('METRIC')
-        dimstyle.dxf.dimscale = 1.0
-        dimstyle.dxf.dimexe = 0.05
-        dimstyle.dxf.dimexo = 0.05
-        dimstyle.dxf.dimasz = 0.1
-        dimstyle.dxf.dimtxt = 0.2
-
-        # Add width dimension
-        msp.add_linear_dim(
-            base=(0, min_y - 0.5),
-            p1=(min_x, 0),
-            p2=(max_x, 0),
-            dimstyle='METRIC',
-            override={
-                'dimtxt': 0.2,
-                'dimclrd': 7,  # Dimension line color
-                'dimclre': 7   # Extension line color
-            }
-        ).render()
-
-        # Create temporary file and save
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.dxf') as tmp_file:
-            tmp_filename = tmp_file.name
-            doc.saveas(tmp_filename)
-
-            file_size = os.path.getsize(tmp_filename)
-            print(f"DXF file created: {file_size} bytes")
-
-            with open(tmp_filename, 'rb') as f:
-                buffer = BytesIO(f.read())
-
-        os.unlink(tmp_filename)
-
-        buffer.seek(0)
-        # Convert BytesIO to base64 string for Dash
-        encoded = base64.b64encode(buffer.read()).decode()
-        return encoded
-
-    except Exception as e:
-        print(f"Error creating DXF: {str(e)}")
-        print(f"Error details: {str(e.__class__.__name__)}")
+        min_x, min_y, max_x, max_y = geometry.bounds()
+        fields = {}
+        if export.family.name == 'pseudo-dome':
+            r = export.params['r']
+            fields = dict(radius=r, measured_radius=max(abs(max_x), abs(max_y)))
+            # Add verification circle at exact input radius
+            msp.add_circle((0, 0), r, dxfattribs={'color': VERIFICATION_COLOR})
+            # Add diameter dimension
+            add_width_dimension(doc, msp, (-max_x, 0), (max_x, 0), (0, min_y - 0.5))
+        else:
+            # Add verification rectangle at pattern extents
+            msp.add_lwpolyline([(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y), (min_x, min_y)],
+                               dxfattribs={'color': VERIFICATION_COLOR})
+            # Add width dimension
+            add_width_dimension(doc, msp, (min_x, 0), (max_x, 0), (0, min_y - 0.5))
+
+        # Report exact dimensions for verification
+        _log_extents(export.family.name, (min_x, min_y, max_x, max_y), **fields)
+        return [dxf_to_bytes(doc)]
+
+    except Exception:
+        logger.exception("Error creating DXF")
         raise
+
+
+def _log_extents(pattern, bounds, **fields):
+    """Log the extents of an exported pattern (debug level, structured via extra)."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    min_x, min_y, max_x, max_y = bounds
+    extents = dict(pattern=pattern, min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y,
+                   width=max_x - min_x, height=max_y - min_y, **fields)
+    logger.debug("DXF pattern extents: %s", ', '.join(f'{key}={value}' for key, value in extents.items()),
+                 extra={'extents': extents})
+
+
+def create_dxf(r, n, fold_color_1=None, fold_color_2=None, radial_color=None, fold_width=None, radial_width=None):
+    """Create DXF file for pseudo dome pattern"""
+    return prepare_export('pseudo-dome', r, n, fold_color_1=fold_color_1, fold_color_2=fold_color_2,
+                          accent_color=radial_color, fold_width=fold_width, accent_width=radial_width).render('dxf')
+
+
+def create_svg(r, n, fold_color_1=None, fold_color_2=None, radial_color=None, mv_width=None, radial_width=None):
+    """Create SVG for pseudo dome pattern"""
+    export = prepare_export('pseudo-dome', r, n, fold_color_1=fold_color_1, fold_color_2=fold_color_2,
+                            accent_color=radial_color, fold_width=mv_width, accent_width=radial_width)
+    return ''.join(export.stream('svg'))
+
+
+def create_barrel_vault_svg(r, n, m, omega, h, fold_color_1=None, fold_color_2=None, connecting_color=None, mv_width=None, connecting_width=None):
+    """Create SVG for barrel vault pattern"""
+    export = prepare_export('barrel-vault', r, n, m, omega, h, fold_color_1=fold_color_1, fold_color_2=fold_color_2,
+                            accent_color=connecting_color, fold_width=mv_width, accent_width=connecting_width)
+    return ''.join(export.stream('svg'))
+
+
+def create_barrel_vault_dxf(r, n, m, omega, h, fold_color_1=None, fold_color_2=None, connecting_color=None, fold_width=None, connecting_width=None):
+    """Create DXF file for barrel vault pattern"""
+    return prepare_export('barrel-vault', r, n, m, omega, h, fold_color_1=fold_color_1, fold_color_2=fold_color_2,
+                          accent_color=connecting_color, fold_width=fold_width, accent_width=connecting_width).render('dxf')
+
+
+def create_double_barrel_vault_svg(r, n, m, omega, a, fold_color_1=None, fold_color_2=None, connecting_color=None, mv_width=None, connecting_width=None):
+    """Create SVG for double barrel vault pattern"""
+    export = prepare_export('double-barrel-vault', r, n, m, omega, a, fold_color_1=fold_color_1, fold_color_2=fold_color_2,
+                            accent_color=connecting_color, fold_width=mv_width, accent_width=connecting_width)
+    return ''.join(export.stream('svg'))
+
+
+def create_double_barrel_vault_dxf(r, n, m, omega, a, fold_color_1=None, fold_color_2=None, connecting_color=None, fold_width=None, connecting_width=None):
+    """Create DXF file for double barrel vault pattern"""
+    return prepare_export('double-barrel-vault', r, n, m, omega, a, fold_color_1=fold_color_1, fold_color_2=fold_color_2,
+                          accent_color=connecting_color, fold_width=fold_width, accent_width=connecting_width).render('dxf')
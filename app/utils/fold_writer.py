@@ -0,0 +1,76 @@
+"""
+Streaming FOLD writer for crease graphs.
+"""
+import json
+
+import numpy as np
+
+from .geometry import MOUNTAIN, VALLEY
+
+# Number of array rows formatted per yielded chunk
+FOLD_CHUNK_SIZE = 4096
+
+FOLD_MIMETYPE = 'application/json'
+
+FOLD_SPEC = 1.2  # first version with the "C" (cut) edge assignment
+
+
+def edge_fold_angles(kinds, mountain_angle, valley_angle):
+    """
+    Look up the signed fold angle of every edge.
+
+    FOLD angles are positive for valley and negative for mountain folds; all
+    other creases are flat (0).
+
+    Args:
+        kinds (np.ndarray): (E,) crease kinds
+        mountain_angle (float): Mountain fold angle magnitude in degrees
+        valley_angle (float): Valley fold angle magnitude in degrees
+
+    Returns:
+        np.ndarray: (E,) fold angles in degrees
+    """
+    table = np.zeros(max(MOUNTAIN, VALLEY, int(kinds.max(initial=0))) + 1)
+    table[MOUNTAIN] = -abs(mountain_angle)
+    table[VALLEY] = abs(valley_angle)
+    return table[kinds]
+
+
+def _json_array(name, values, chunk_size):
+    """Yield a "name": [...] member of the document, chunk_size rows at a time."""
+    yield f',\n  "{name}": ['
+    for start in range(0, len(values), chunk_size):
+        rows = json.dumps(values[start:start + chunk_size].tolist())[1:-1]
+        yield rows if start == 0 else ', ' + rows
+    yield ']'
+
+
+def iter_fold_document(graph, fold_angles, title, chunk_size=FOLD_CHUNK_SIZE):
+    """
+    Yield a FOLD document for a crease graph in chunks.
+
+    Args:
+        graph (CreaseGraph): Pattern with merged vertices
+        fold_angles (tuple): (mountain, valley) fold angle magnitudes in degrees;
+            None leaves out edges_foldAngle
+        title (str): Frame title
+        chunk_size (int): Number of array rows per chunk
+
+    Yields:
+        str: Consecutive parts of the document
+    """
+    yield '{\n' + ',\n'.join(f'  {json.dumps(key)}: {json.dumps(value)}' for key, value in (
+        ('file_spec', FOLD_SPEC),
+        ('file_creator', 'ori-kin'),
+        ('file_classes', ['singleModel']),
+        ('frame_title', title),
+        ('frame_classes', ['creasePattern']),
+        ('frame_attributes', ['2D']),
+        ('frame_unit', 'm'),
+    ))
+    yield from _json_array('vertices_coords', graph.vertices, chunk_size)
+    yield from _json_array('edges_vertices', graph.edges, chunk_size)
+    yield from _json_array('edges_assignment', graph.assignments, chunk_size)
+    if fold_angles is not None:
+        yield from _json_array('edges_foldAngle', edge_fold_angles(graph.kinds, *fold_angles), chunk_size)
+    yield '\n}\n'
@@ -0,0 +1,347 @@
+"""
+Array-backed crease geometry shared by the pattern generators and exporters.
+"""
+from types import MappingProxyType
+
+import numpy as np
+
+# Default rounding precision for coordinate comparison
+ROUNDING_DECIMAL = 4
+
+# Crease kinds stored in the int8 kind column
+MOUNTAIN = 0
+VALLEY = 1
+RADIAL = 2
+CONNECTING = 3
+CUT = 4
+BOUNDARY = 5
+
+CREASE_KIND_NAMES = {
+    MOUNTAIN: 'mountain',
+    VALLEY: 'valley',
+    RADIAL: 'radial',
+    CONNECTING: 'connecting',
+    CUT: 'cut',
+    BOUNDARY: 'boundary',
+}
+
+
+def make_style(color, width, dash=None):
+    """
+    Create a style table entry.
+
+    Args:
+        color (str): Line colour, e.g. "rgb(255,0,0)" or "black"
+        width (float): Line width
+        dash (str): Plotly dash style ("solid", "dash", "dot", "dashdot") or None
+
+    Returns:
+        dict: Style entry with 'color', 'width' and 'dash' keys
+    """
+    return {'color': color, 'width': width, 'dash': dash}
+
+
+class CreaseGeometry:
+    """
+    Immutable-by-convention set of crease segments.
+
+    Attributes:
+        segments (np.ndarray): (N, 4) float64 array of (x0, y0, x1, y1) rows
+        kinds (np.ndarray): (N,) int8 array of crease kinds
+        styles (dict): Crease kind -> style entry (see make_style)
+    """
+
+    def __init__(self, segments=None, kinds=None, styles=None):
+        if segments is None:
+            segments = np.empty((0, 4), dtype=np.float64)
+        self.segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+        if kinds is None:
+            kinds = np.full(len(self.segments), MOUNTAIN, dtype=np.int8)
+        self.kinds = np.asarray(kinds, dtype=np.int8)
+        if len(self.kinds) != len(self.segments):
+            raise ValueError("segments and kinds must have the same length")
+        self.styles = dict(styles or {})
+
+    def __len__(self):
+        return len(self.segments)
+
+    def __repr__(self):
+        return f"CreaseGeometry({len(self)} segments)"
+
+    def style(self, kind):
+        """Return the style entry for a crease kind."""
+        return self.styles[int(kind)]
+
+    def freeze(self):
+        """Make the segment and kind arrays and the style table read-only and return self."""
+        self.segments.flags.writeable = False
+        self.kinds.flags.writeable = False
+        self.styles = MappingProxyType({kind: MappingProxyType(dict(style))
+                                        for kind, style in self.styles.items()})
+        return self
+
+    def with_styles(self, styles):
+        """
+        Return the same creases with another style table.
+
+        The segment and kind arrays are shared, not copied, so styling a cached
+        geometry costs nothing. The copy of a frozen geometry is frozen too.
+        """
+        restyled = CreaseGeometry(self.segments, self.kinds, styles)
+        return restyled if self.segments.flags.writeable else restyled.freeze()
+
+    def iter_chunks(self):
+        """Yield the geometry in chunks; a plain geometry is a single chunk."""
+        yield self
+
+    def subset(self, index):
+        """Return a new geometry holding the rows selected by a mask or index array."""
+        return CreaseGeometry(self.segments[index], self.kinds[index], self.styles)
+
+    def rotated_copies(self, angles):
+        """
+        Return copies of the geometry rotated about the origin by each angle.
+
+        All rotation matrices are built up front and applied to every endpoint
+        in one batched operation. Copies are stacked in the order of angles.
+
+        Args:
+            angles (array_like): Rotation angles in radians
+
+        Returns:
+            CreaseGeometry: len(angles) * len(self) segments
+        """
+        angles = np.asarray(angles, dtype=np.float64).ravel()
+        cos, sin = np.cos(angles), np.sin(angles)
+        matrices = np.stack([np.stack([cos, -sin], axis=-1),
+                             np.stack([sin, cos], axis=-1)], axis=-2)
+        # (R, 2N, 2) = (2N, 2) @ (R, 2, 2), i.e. every point times every transposed matrix
+        rotated = self.segments.reshape(-1, 2) @ matrices.transpose(0, 2, 1)
+        return CreaseGeometry(rotated.reshape(-1, 4), np.tile(self.kinds, len(angles)), self.styles)
+
+    def translated(self, dx=0.0, dy=0.0):
+        """Return a copy shifted by (dx, dy)."""
+        return CreaseGeometry(self.segments + (dx, dy, dx, dy), self.kinds, self.styles)
+
+    def bounds(self):
+        """
+        Return the axis-aligned extents of the geometry.
+
+        Returns:
+            tuple: (min_x, min_y, max_x, max_y)
+        """
+        xs = self.segments[:, 0::2]
+        ys = self.segments[:, 1::2]
+        return float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())
+
+    @classmethod
+    def concatenate(cls, geometries, styles=None):
+        """
+        Join several geometries into one, keeping their order.
+
+        The style table of the first geometry is used unless styles is given.
+        """
+        geometries = list(geometries)
+        if not geometries:
+            return cls(styles=styles)
+        return cls(
+            np.concatenate([g.segments for g in geometries]),
+            np.concatenate([g.kinds for g in geometries]),
+            styles if styles is not None else geometries[0].styles,
+        )
+
+
+class SegmentBuilder:
+    """
+    Collects segments one at a time and packs them into a CreaseGeometry.
+
+    Used by the unit-cell generators, which walk the pattern step by step.
+    """
+
+    def __init__(self):
+        self._rows = []
+        self._kinds = []
+
+    def __len__(self):
+        return len(self._rows)
+
+    def add(self, x0, y0, x1, y1, kind):
+        """Append the segment (x0, y0) -> (x1, y1) with the given crease kind."""
+        self._rows.append((x0, y0, x1, y1))
+        self._kinds.append(kind)
+
+    def set_kind(self, index, kind):
+        """Change the crease kind of an already added segment."""
+        self._kinds[index] = kind
+
+    def build(self, styles=None):
+        """Return the collected segments as a CreaseGeometry."""
+        return CreaseGeometry(
+            np.array(self._rows, dtype=np.float64).reshape(-1, 4),
+            np.array(self._kinds, dtype=np.int8),
+            styles,
+        )
+
+
+class TiledGeometry:
+    """
+    Unit cell repeated along a one-dimensional translation lattice.
+
+    Copies sit at offsets 0, +step, -step, ..., ±(m-1)*step; an edge shared by
+    two copies is owned by the one closer to the centre, so no deduplication
+    pass is needed.
+
+    Attributes:
+        cell (CreaseGeometry): Unit cell
+        step (np.ndarray): Translation (dx, dy) between neighbouring copies
+        m (int): Number of rings; the pattern holds 2*m - 1 copies
+        back_edge (np.ndarray): Mask of cell segments shared with the copy at -step
+        front_edge (np.ndarray): Mask of cell segments shared with the copy at +step
+        extra (CreaseGeometry): Segments added after the tiles
+    """
+
+    def __init__(self, cell, step, m, back_edge, front_edge, extra=None):
+        self.cell = cell
+        self.step = np.asarray(step, dtype=np.float64)
+        self.m = int(m)
+        self.back_edge = np.asarray(back_edge, dtype=bool)
+        self.front_edge = np.asarray(front_edge, dtype=bool)
+        self.extra = extra if extra is not None else CreaseGeometry(styles=cell.styles)
+        self.styles = cell.styles
+        self._materialized = None
+        self._frozen = False
+
+    def __len__(self):
+        counts = {}
+        total = len(self.extra)
+        for t in self.offsets():
+            flags = self._owns(t)
+            if flags not in counts:
+                counts[flags] = np.count_nonzero(self._mask(*flags))
+            total += counts[flags]
+        return int(total)
+
+    def __repr__(self):
+        return f"TiledGeometry({len(self.cell)} cell segments x {2*self.m - 1} tiles)"
+
+    def offsets(self):
+        """Return the lattice offsets t of all copies, from -(m-1) to m-1."""
+        return range(-(self.m - 1), self.m)
+
+    def _owns(self, t):
+        """Return whether the copy at offset t*step owns its (back, front) edge."""
+        return -(self.m - 1) < t <= 0, 0 <= t < self.m - 1
+
+    def _mask(self, owns_back, owns_front):
+        mask = ~(self.back_edge | self.front_edge)
+        if owns_back:
+            mask = mask | self.back_edge
+        if owns_front:
+            mask = mask | self.front_edge
+        return mask
+
+    def owned(self, t):
+        """Return the mask of cell segments owned by the copy at offset t*step."""
+        return self._mask(*self._owns(t))
+
+    def iter_chunks(self):
+        """
+        Yield the pattern as a sequence of CreaseGeometry chunks.
+
+        The first chunk is the centre copy, each following chunk holds the
+        copies at +i*step and -i*step (interleaved per segment), and the last
+        chunk holds the extra segments. Memory use is bounded by two cells.
+        """
+        cell = self.cell
+        yield cell.subset(self.owned(0))
+        paired_kinds = np.repeat(cell.kinds, 2)
+        for i in range(1, self.m):
+            shift = np.tile(self.step * i, 2)
+            segments = np.stack([cell.segments + shift, cell.segments - shift], axis=1)
+            mask = np.stack([self.owned(i), self.owned(-i)], axis=1)
+            yield CreaseGeometry(segments[mask], paired_kinds[mask.ravel()], self.styles)
+        if len(self.extra):
+            yield self.extra
+
+    def freeze(self):
+        """Make the cell, masks and extra segments read-only and return self."""
+        self.cell.freeze()
+        self.extra.freeze()
+        self.styles = self.cell.styles
+        self.back_edge.flags.writeable = False
+        self.front_edge.flags.writeable = False
+        self._frozen = True
+        if self._materialized is not None:
+            self._materialized.freeze()
+        return self
+
+    def with_styles(self, styles):
+        """
+        Return the same tiling with another style table.
+
+        The cell, masks and an already materialized pattern are shared, not copied.
+        """
+        tiled = TiledGeometry(self.cell.with_styles(styles), self.step, self.m,
+                              self.back_edge, self.front_edge, self.extra.with_styles(styles))
+        if self._materialized is not None:
+            tiled._materialized = self._materialized.with_styles(styles)
+        return tiled.freeze() if self._frozen else tiled
+
+    def materialize(self):
+        """Return (and cache) the full pattern as a CreaseGeometry."""
+        if self._materialized is None:
+            materialized = CreaseGeometry.concatenate(list(self.iter_chunks()), self.styles)
+            self._materialized = materialized.freeze() if self._frozen else materialized
+        return self._materialized
+
+    @property
+    def segments(self):
+        return self.materialize().segments
+
+    @property
+    def kinds(self):
+        return self.materialize().kinds
+
+    def style(self, kind):
+        """Return the style entry for a crease kind."""
+        return self.styles[int(kind)]
+
+    def subset(self, index):
+        """Return a CreaseGeometry holding the selected rows of the materialized pattern."""
+        return self.materialize().subset(index)
+
+    def bounds(self):
+        """
+        Return the axis-aligned extents without materializing the pattern.
+
+        Returns:
+            tuple: (min_x, min_y, max_x, max_y)
+        """
+        # extremes of each ownership class of the cell, per column
+        extremes = {}
+        for name, mask in (('interior', ~(self.back_edge | self.front_edge)),
+                           ('back', self.back_edge), ('front', self.front_edge)):
+            if np.any(mask):
+                rows = self.cell.segments[mask]
+                extremes[name] = (rows.min(axis=0), rows.max(axis=0))
+
+        lows, highs = [], []
+        for t in self.offsets():
+            owns_back, owns_front = self._owns(t)
+            names = ['interior'] + ['back'] * owns_back + ['front'] * owns_front
+            parts = [extremes[name] for name in names if name in extremes]
+            if not parts:
+                continue
+            # translation is monotonic, so a copy's extremes are the translated cell extremes
+            low = np.min([low for low, _ in parts], axis=0)
+            high = np.max([high for _, high in parts], axis=0)
+            shift = np.tile(self.step * abs(t), 2)
+            lows.append(low + shift if t >= 0 else low - shift)
+            highs.append(high + shift if t >= 0 else high - shift)
+        if len(self.extra):
+            lows.append(self.extra.segments.min(axis=0))
+            highs.append(self.extra.segments.max(axis=0))
+        low = np.min(lows, axis=0)
+        high = np.max(highs, axis=0)
+        return (float(min(low[0], low[2])), float(min(low[1], low[3])),
+                float(max(high[0], high[2])), float(max(high[1], high[3])))
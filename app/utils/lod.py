@@ -0,0 +1,119 @@
+"""
+Viewport-driven level of detail for the pattern previews.
+"""
+import numpy as np
+
+from .geometry import CreaseGeometry
+
+# Approximate plot width in pixels, for the pixel size of a viewport
+LOD_SCREEN_PIXELS = 1000
+
+# Segments shorter than this many pixels are not drawn
+LOD_MIN_PIXELS = 1.0
+
+# Part of the viewport size added on every side, so small pans stay drawn
+LOD_MARGIN = 0.5
+
+_AXIS_KEYS = ('xaxis.range[0]', 'xaxis.range[1]', 'yaxis.range[0]', 'yaxis.range[1]')
+
+
+def viewport_changed(relayout_data):
+    """Return True if a Plotly relayoutData event moved or reset an axis."""
+    return any(key.startswith(('xaxis.', 'yaxis.')) for key in (relayout_data or {}))
+
+
+def parse_viewport(relayout_data):
+    """
+    Read the visible window from Plotly relayoutData.
+
+    Args:
+        relayout_data (dict): relayoutData of a dcc.Graph, may be None
+
+    Returns:
+        tuple: (min_x, min_y, max_x, max_y), with None for an axis that is
+            not limited; None when the whole pattern is shown (autorange)
+    """
+    relayout_data = relayout_data or {}
+    x0, x1, y0, y1 = (relayout_data.get(key) for key in _AXIS_KEYS)
+    if 'xaxis.range' in relayout_data:
+        x0, x1 = relayout_data['xaxis.range']
+    if 'yaxis.range' in relayout_data:
+        y0, y1 = relayout_data['yaxis.range']
+    # an axis with only one end of its range is not limited
+    if x0 is None or x1 is None:
+        x0 = x1 = None
+    if y0 is None or y1 is None:
+        y0 = y1 = None
+    if x0 is None and y0 is None:
+        return None
+    return (
+        None if x0 is None else min(x0, x1),
+        None if y0 is None else min(y0, y1),
+        None if x0 is None else max(x0, x1),
+        None if y0 is None else max(y0, y1),
+    )
+
+
+def outline_segments(bounds):
+    """Return the rectangle around bounds as a (4, 4) segment array."""
+    min_x, min_y, max_x, max_y = bounds
+    return np.array([
+        (min_x, min_y, max_x, min_y),
+        (max_x, min_y, max_x, max_y),
+        (max_x, max_y, min_x, max_y),
+        (min_x, max_y, min_x, min_y),
+    ])
+
+
+def _window(bounds, viewport, margin):
+    """Clip the viewport to the pattern extents and widen it by the margin."""
+    window = list(bounds)
+    if viewport is not None:
+        for axis in (0, 1):
+            low, high = viewport[axis], viewport[axis + 2]
+            if low is not None:
+                window[axis], window[axis + 2] = low, high
+    width = window[2] - window[0]
+    height = window[3] - window[1]
+    return (window[0] - margin * width, window[1] - margin * height,
+            window[2] + margin * width, window[3] + margin * height), max(width, height)
+
+
+def level_of_detail(geometry, viewport=None, screen_pixels=LOD_SCREEN_PIXELS,
+                    min_pixels=LOD_MIN_PIXELS, margin=LOD_MARGIN):
+    """
+    Select the segments worth drawing for a viewport.
+
+    Tiled geometries are filtered chunk by chunk, without materializing the
+    whole pattern.
+
+    Args:
+        geometry (CreaseGeometry or TiledGeometry): Pattern geometry
+        viewport (tuple): Visible window as returned by parse_viewport; None
+            for the whole pattern
+        screen_pixels (int): Plot size in pixels along the longer window side
+        min_pixels (float): Minimum drawn segment length in pixels
+        margin (float): Viewport fraction drawn beyond each side
+
+    Returns:
+        tuple: (CreaseGeometry of the drawn segments, (4, 4) outline segment
+            array or None when the whole pattern is in view)
+    """
+    if not len(geometry):
+        return CreaseGeometry(styles=geometry.styles), None
+    bounds = geometry.bounds()
+    (min_x, min_y, max_x, max_y), extent = _window(bounds, viewport, margin)
+    min_length = extent / screen_pixels * min_pixels
+
+    parts = []
+    for part in geometry.iter_chunks():
+        x0, y0, x1, y1 = part.segments.T
+        visible = ((np.maximum(x0, x1) >= min_x) & (np.minimum(x0, x1) <= max_x)
+                   & (np.maximum(y0, y1) >= min_y) & (np.minimum(y0, y1) <= max_y)
+                   & (np.hypot(x1 - x0, y1 - y0) >= min_length))
+        parts.append(part.subset(visible))
+    drawn = CreaseGeometry.concatenate(parts, geometry.styles)
+
+    in_view = (min_x <= bounds[0] and min_y <= bounds[1]
+               and max_x >= bounds[2] and max_y >= bounds[3])
+    return drawn, None if in_view else outline_segments(bounds)
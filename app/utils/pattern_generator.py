@@ -1,9 +1,14 @@
 import numpy as np
-import plotly.graph_objs as go
 
+from .cache import cached_geometry
 from .calculations import calculate_parameters
 from .config_loader import get_pseudo_dome_config
-from .common_utils import remove_duplicate_traces, ROUNDING_DECIMAL
+from .common_utils import remove_duplicate_segments, ROUNDING_DECIMAL
+from .geometry import (
+    BOUNDARY, CUT, MOUNTAIN, RADIAL, VALLEY,
+    CreaseGeometry, SegmentBuilder, make_style,
+)
+from .spatial import SegmentIndex
 
 rounding_decimal = ROUNDING_DECIMAL
 
@@ -38,12 +43,36 @@ def generate_pattern(r, n, fold_color_1=None, fold_color_2=None, radial_color=No
     radial_width (float): Line width for radial lines
     
     Returns:
-    list: List of Plotly scatter traces representing the pattern
+    CreaseGeometry: Crease segments of the pattern
     """
+    styles = pattern_styles(fold_color_1, fold_color_2, radial_color, mv_width, radial_width, radial_line_style)
+    return _generate_pattern(r, n).with_styles(styles)
+
+def pattern_styles(fold_color_1, fold_color_2, radial_color, mv_width, radial_width, radial_line_style):
+    """
+    Style table of the pseudo-dome crease kinds.
+
+    Returns:
+    dict: Crease kind -> style entry
+    """
+    # Apply line style based on configuration
+    line_dash = None
+    if radial_line_style in ('dash', 'dot', 'dashdot'):
+        line_dash = radial_line_style
+    return {
+        MOUNTAIN: make_style(fold_color_1, mv_width),
+        VALLEY: make_style(fold_color_2, mv_width),
+        BOUNDARY: make_style('black', mv_width),
+        RADIAL: make_style(radial_color, radial_width, line_dash),
+        CUT: make_style(fold_color_1, mv_width),
+    }
+
+@cached_geometry('pseudo-dome')
+def _generate_pattern(r, n):
+    """Build the unstyled pseudo-dome geometry (cached)."""
     thetas, s, A, beta, a, alpha, h, theta1, theta_l, CD, alpha11, num_radial_segments = calculate_parameters(r, n)
-    # print(180*alpha[0][0]/np.pi)
-    traces = []
-    # first_and_last_markers = []
+
+    builder = SegmentBuilder()
     def generate_half_pattern(inverse=False):
         current_x, current_y = 0, 0
         current_angle = 0
@@ -57,15 +86,14 @@ def generate_pattern(r, n, fold_color_1=None, fold_color_2=None, radial_color=No
             
             # Draw the line         
             if i > 0:
-                color = fold_color_2
+                kind = VALLEY
             else:
-                color = fold_color_1
+                kind = MOUNTAIN
             
             if (i==0) & (current_angle==0):
                 starts_of_radial_segments.append((next_x, next_y))
             
-            traces.append(go.Scatter(x=[current_x, next_x], y=[current_y, next_y],
-                                     mode='lines', line=dict(color=color, width=mv_width)))
+            builder.add(current_x, current_y, next_x, next_y, kind)
             
             current_x, current_y = next_x, next_y
             
@@ -98,85 +126,58 @@ def generate_pattern(r, n, fold_color_1=None, fold_color_2=None, radial_color=No
             next_y = current_y + h[-1] * np.sin(current_angle)
         
         points.append((next_x, next_y))
-        traces.append(go.Scatter(x=[current_x, next_x], y=[current_y, next_y],
-                                 mode='lines', line=dict(color=color, width=mv_width)))
-        # change color of last trace
-        traces[-1].line.color = 'black'
+        # last segment closes the wedge
+        builder.add(current_x, current_y, next_x, next_y, BOUNDARY)
 
         # Generate radial lines
-        
         for i in range(0, len(points)):
-            # Apply line style based on configuration
-            line_dash = None
-            if radial_line_style in ('dash', 'dot', 'dashdot'):
-                line_dash = radial_line_style
-                
-            traces.append(go.Scatter(x=[starts_of_radial_segments[i][0], points[i][0]], y=[starts_of_radial_segments[i][1], points[i][1]],
-                                   mode='lines', line=dict(color=radial_color, width=radial_width, dash=line_dash)))
+            builder.add(starts_of_radial_segments[i][0], starts_of_radial_segments[i][1],
+                        points[i][0], points[i][1], RADIAL)
 
     
     # Generate both halves of the pattern
     generate_half_pattern()
     generate_half_pattern(inverse=True)
 
-    # Remove duplicate traces
-    traces = remove_duplicate_traces(traces, rounding_decimal)
+    # Remove duplicate segments
+    wedge = remove_duplicate_segments(builder.build(), rounding_decimal)
     # Generate full radial pattern
-    full_traces = traces.copy()
-    
-    # import pdb; pdb.set_trace()
-    for i in range(1, int(num_radial_segments/2)):
-        rotation = i * 2*alpha[0][0]
-        rot_matrix = np.array([[np.cos(rotation), -np.sin(rotation)],
-                               [np.sin(rotation), np.cos(rotation)]])
-        
+    rotations = np.arange(1, int(num_radial_segments/2)) * 2*alpha[0][0]
+    full = CreaseGeometry.concatenate([wedge, wedge.rotated_copies(rotations)])
 
-        for trace in traces:
-            x, y = np.array(trace['x']), np.array(trace['y'])
-            rotated_points = np.dot(rot_matrix, [x, y])
-            full_traces.append(go.Scatter(x=rotated_points[0], y=rotated_points[1], mode=trace['mode'],
-                                        line=trace['line'] if 'line' in trace else None,
-                                        marker=trace['marker'] if 'marker' in trace else None))
+    # Remove duplicate segments
+    full = remove_duplicate_segments(full, rounding_decimal)
+    segments = full.segments.copy()
+    kinds = full.kinds
 
-    # Remove duplicate traces
-    full_traces = remove_duplicate_traces(full_traces, rounding_decimal)
     # add a cut line to the end
-    # find the trace with ending point closest to positive x axis
-    closest_trace = None
-    max_x = -float('inf')
-    
     # last cut line should go from center to max_x, always
-    for trace in full_traces:
-        # Check if this trace's endpoint has a larger x value
-        if len(trace['x']) > 1 and trace['x'][-1] > max_x:
-            max_x = trace['x'][-1]
-    
-    closest_trace = full_traces[0]
-    closest_trace['x'] = [closest_trace['x'][0], max_x]
-    # reverse order of traces
-    full_traces.reverse()
-    
-    # Only add the cut line if we found a valid trace
-    if closest_trace is not None:
-        # cutline coordinates
-        cutline_xpositions = (0, closest_trace['x'][-1])
-        cutline_ypositions = (0, closest_trace['y'][-1])
-        cutline_slope = np.round(calculate_slope(cutline_xpositions[0], cutline_ypositions[0], cutline_xpositions[1], cutline_ypositions[1]), rounding_decimal)
-
-        # find and remove trace that has the same endpoints as the cutline & is parallel to it
-        for i, trace in enumerate(full_traces):
-            trace_slope = np.round(calculate_slope(trace['x'][0], trace['y'][0], trace['x'][1], trace['y'][1]), rounding_decimal)
-            if (np.round(trace['x'][1], rounding_decimal) == np.round(cutline_xpositions[1], rounding_decimal)) and\
-               (np.round(trace['y'][1], rounding_decimal) == np.round(cutline_ypositions[1], rounding_decimal)) and\
-               (trace_slope ==cutline_slope):
-                full_traces.pop(i)
-                # break
-        # Add a cut line from origin to the endpoint of the trace closest to positive x-axis
-        full_traces.append(go.Scatter(
-            x=cutline_xpositions, 
-            y=cutline_ypositions, 
-            mode='lines', 
-            line=dict(color=fold_color_1, width=mv_width)
-        ))
-
-    return full_traces
+    max_x = segments[:, 2].max()
+    # the first segment runs along the positive x axis and is stretched to max_x
+    segments[0, 2] = max_x
+
+    # reverse order of segments
+    segments = segments[::-1]
+    kinds = kinds[::-1]
+
+    # cutline coordinates
+    cutline_xpositions = (0, segments[-1, 2])
+    cutline_ypositions = (0, segments[-1, 3])
+    cutline_xy_end = (cutline_xpositions[1], cutline_ypositions[1])
+    cutline_slope = np.round(calculate_slope(cutline_xpositions[0], cutline_ypositions[0], cutline_xpositions[1], cutline_ypositions[1]), rounding_decimal)
+
+    # find and remove segments that end where the cutline ends & are parallel to it
+    candidates = SegmentIndex(segments, rounding_decimal).coincident(*cutline_xy_end, end=1)
+    dx = segments[candidates, 2] - segments[candidates, 0]
+    dy = segments[candidates, 3] - segments[candidates, 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slopes = np.where(dx == 0, np.inf, dy / np.where(dx == 0, 1, dx))
+    keep = np.ones(len(segments), dtype=bool)
+    keep[candidates[np.round(slopes, rounding_decimal) == cutline_slope]] = False
+
+    # Add a cut line from origin to the endpoint of the segment closest to positive x-axis
+    cutline = (cutline_xpositions[0], cutline_ypositions[0], cutline_xpositions[1], cutline_ypositions[1])
+    return CreaseGeometry(
+        np.vstack([segments[keep], cutline]),
+        np.append(kinds[keep], np.int8(CUT)),
+    )
@@ -0,0 +1,110 @@
+"""
+Conversion of CreaseGeometry into Plotly figure data.
+"""
+import base64
+
+import numpy as np
+
+from .geometry import CREASE_KIND_NAMES, make_style
+
+# Typed-array type of the figure coordinates; float32 is exact to well below
+# screen resolution for pattern sized coordinates
+FIGURE_DTYPE = 'f4'
+
+# Style of the coarse outline drawn around a zoomed-in level of detail
+OUTLINE_STYLE = make_style('rgb(170,170,170)', 1, 'dot')
+
+
+def _line_dict(style):
+    line = {'color': style['color'], 'width': style['width']}
+    if style['dash'] is not None:
+        line['dash'] = style['dash']
+    return line
+
+
+def typed_array(values, dtype=FIGURE_DTYPE):
+    """
+    Encode a numeric array as a Plotly typed array.
+
+    Args:
+        values (array-like): Values; NaN is kept and breaks lines in Plotly
+        dtype (str): Plotly dtype code, e.g. 'f4', 'f8', 'i4'
+
+    Returns:
+        dict: {'dtype': dtype, 'bdata': base64 of the little-endian values}
+    """
+    data = np.ascontiguousarray(values, dtype=np.dtype(dtype).newbyteorder('<'))
+    return {'dtype': dtype, 'bdata': base64.b64encode(data).decode('ascii')}
+
+
+def _polyline(segments):
+    """Interleave (N, 4) segments into NaN-separated x and y coordinate arrays."""
+    gap = np.full(len(segments), np.nan)
+    x = np.column_stack([segments[:, 0], segments[:, 2], gap]).ravel()
+    y = np.column_stack([segments[:, 1], segments[:, 3], gap]).ravel()
+    return x, y
+
+
+def geometry_to_grouped_traces(geometry, binary=False):
+    """
+    Convert a geometry into one Plotly scatter trace per style group.
+
+    Crease kinds sharing the same colour, width and dash are drawn as a single
+    polyline whose segments are separated by NaN gaps, so the figure carries a
+    handful of traces instead of one per segment.
+
+    Args:
+        geometry (CreaseGeometry): Pattern geometry
+        binary (bool): Encode x and y as typed arrays (see typed_array)
+
+    Returns:
+        list: List of Plotly scatter trace dictionaries, in style table order
+    """
+    groups = {}
+    for kind, style in geometry.styles.items():
+        key = (style['color'], style['width'], style['dash'])
+        groups.setdefault(key, (style, []))[1].append(kind)
+
+    segments, kinds = geometry.segments, geometry.kinds
+    traces = []
+    for style, group_kinds in groups.values():
+        selected = segments[np.isin(kinds, group_kinds)]
+        if not len(selected):
+            continue
+        x, y = _polyline(selected)
+        if binary:
+            x, y = typed_array(x), typed_array(y)
+        traces.append({
+            'type': 'scatter',
+            'x': x,
+            'y': y,
+            'mode': 'lines',
+            'line': _line_dict(style),
+            'name': '/'.join(CREASE_KIND_NAMES[kind] for kind in group_kinds),
+        })
+    return traces
+
+
+def outline_trace(segments, binary=False):
+    """
+    Build the trace of a coarse outline, e.g. the pattern extents around a zoomed view.
+
+    Args:
+        segments (np.ndarray): (N, 4) outline segments
+        binary (bool): Encode x and y as typed arrays
+
+    Returns:
+        dict: Plotly scatter trace dictionary
+    """
+    x, y = _polyline(np.asarray(segments, dtype=np.float64))
+    if binary:
+        x, y = typed_array(x), typed_array(y)
+    return {
+        'type': 'scatter',
+        'x': x,
+        'y': y,
+        'mode': 'lines',
+        'line': _line_dict(OUTLINE_STYLE),
+        'name': 'outline',
+        'hoverinfo': 'skip',
+    }
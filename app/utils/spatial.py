@@ -0,0 +1,269 @@
+"""
+Spatial index over crease segments.
+"""
+import math
+
+import numpy as np
+
+from .geometry import ROUNDING_DECIMAL
+
+# Aim for about this many endpoints per grid cell
+GRID_POINTS_PER_CELL = 2
+
+# Below this many segments, queries test every segment instead of building
+# the grid, which is faster for unit cells and other small inputs
+GRID_MIN_SEGMENTS = 256
+
+# A grid cell and its eight neighbours, as (dx, dy) offsets
+_NEIGHBOURS = np.array([(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)])
+
+
+class SegmentIndex:
+    """
+    Index over an (N, 4) array of (x0, y0, x1, y1) segments.
+
+    Endpoint e of the flattened (2N, 2) endpoint array belongs to segment
+    e // 2; e % 2 is 0 for the start and 1 for the end point.
+
+    Args:
+        segments (array_like): (N, 4) segments
+        rounding_decimal (int): Decimal places at which coordinates coincide
+        cell_size (float): Grid cell size, derived from the extents by default
+    """
+
+    def __init__(self, segments, rounding_decimal=ROUNDING_DECIMAL, cell_size=None):
+        self.segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+        self.rounding_decimal = rounding_decimal
+        self.points = self.segments.reshape(-1, 2)
+        # endpoints with NaN or infinite coordinates are never found
+        finite = np.isfinite(self.points[:, 0]) & np.isfinite(self.points[:, 1])
+        self._finite = None if finite.all() else np.flatnonzero(finite)
+        self.cell_size = cell_size
+        self._point_keys = None
+        self._cell_keys = None
+
+    def __len__(self):
+        return len(self.segments)
+
+    def __repr__(self):
+        return f"SegmentIndex({len(self)} segments)"
+
+    def _finite_endpoints(self):
+        """Return the ids (None for all) and x, y coordinates of the finite endpoints."""
+        points = self.points if self._finite is None else self.points[self._finite]
+        return self._finite, points[:, 0], points[:, 1]
+
+    @staticmethod
+    def _pack(ix, iy, origin, span):
+        """Combine integer (x, y) pairs into one sortable int64 key."""
+        return (ix - origin[0]) * span + (iy - origin[1])
+
+    @classmethod
+    def _sorted_table(cls, ix, iy, ids):
+        """
+        Sort integer (x, y) pairs by their packed key; equal keys stay in ascending id order.
+
+        Returns:
+            tuple: (origin, maximum, span, sorted keys, endpoint ids in key order)
+        """
+        if not len(ix):
+            zeros = np.zeros(2, dtype=np.int64)
+            return zeros, zeros, 1, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        origin = np.array([ix.min(), iy.min()])
+        maximum = np.array([ix.max(), iy.max()])
+        span = int(maximum[1] - origin[1] + 1)
+        keys = cls._pack(ix, iy, origin, span)
+        # with the positions packed into the low bits of the keys, a plain sort
+        # replaces the slower argsort; fall back when they don't fit into int64
+        position_bits = (len(keys) - 1).bit_length()
+        if int(cls._pack(maximum[0], maximum[1], origin, span)).bit_length() + position_bits > 62:
+            order = np.argsort(keys, kind='stable')
+            keys = keys[order]
+        else:
+            packed = np.sort((keys << position_bits) | np.arange(len(keys)))
+            keys, order = packed >> position_bits, packed & ((1 << position_bits) - 1)
+        return origin, maximum, span, keys, order if ids is None else ids[order]
+
+    def _build_points(self):
+        ids, x, y = self._finite_endpoints()
+        scale = 10.0 ** self.rounding_decimal
+        ix = np.rint(x * scale).astype(np.int64)
+        iy = np.rint(y * scale).astype(np.int64)
+        (self._point_origin, _, self._point_span,
+         self._point_keys, self._point_order) = self._sorted_table(ix, iy, ids)
+
+    def _build_grid(self):
+        ids, x, y = self._finite_endpoints()
+        if self.cell_size is None:
+            extent = max(np.ptp(x), np.ptp(y)) if len(x) else 0.0
+            cells_per_side = max(1, int(np.sqrt(len(x) / GRID_POINTS_PER_CELL)))
+            self.cell_size = float(extent) / cells_per_side or 1.0
+        cx = np.floor(x / self.cell_size).astype(np.int64)
+        cy = np.floor(y / self.cell_size).astype(np.int64)
+        (self._cell_origin, self._cell_max, self._cell_span,
+         self._cell_keys, self._cell_order) = self._sorted_table(cx, cy, ids)
+        segments = self.segments
+        with np.errstate(invalid='ignore'):
+            lengths = np.hypot(segments[:, 2] - segments[:, 0], segments[:, 3] - segments[:, 1])
+        lengths = lengths[np.isfinite(lengths)]
+        self._max_length = float(lengths.max()) if len(lengths) else 0.0
+
+    def _cell_endpoints(self, cx, cy):
+        """Return the endpoint ids in the given grid cells (arrays of cell coordinates)."""
+        inside = ((cx >= self._cell_origin[0]) & (cx <= self._cell_max[0])
+                  & (cy >= self._cell_origin[1]) & (cy <= self._cell_max[1]))
+        keys = np.unique(self._pack(cx[inside], cy[inside], self._cell_origin, self._cell_span))
+        lo = np.searchsorted(self._cell_keys, keys, 'left')
+        counts = np.searchsorted(self._cell_keys, keys, 'right') - lo
+        # positions lo[i] .. lo[i] + counts[i] of all cells, in one array
+        offsets = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        return self._cell_order[offsets + np.arange(len(offsets))]
+
+    def coincident(self, x, y, end=None):
+        """
+        Find the segments with an endpoint at (x, y).
+
+        Args:
+            x, y (float): Query point
+            end (int): Only match start points (0) or end points (1)
+
+        Returns:
+            np.ndarray: Sorted segment indices
+        """
+        if self._point_keys is None:
+            self._build_points()
+        if not (np.isfinite(x) and np.isfinite(y)):
+            return np.empty(0, dtype=np.int64)
+        ix, iy = np.rint(np.array([x, y]) * 10.0 ** self.rounding_decimal).astype(np.int64)
+        if not 0 <= iy - self._point_origin[1] < self._point_span:
+            return np.empty(0, dtype=np.int64)
+        key = self._pack(ix, iy, self._point_origin, self._point_span)
+        lo, hi = np.searchsorted(self._point_keys, [key, key + 1])
+        endpoints = self._point_order[lo:hi]
+        if end is not None:
+            endpoints = endpoints[endpoints % 2 == end]
+        return np.unique(endpoints // 2)
+
+    def merge_endpoints(self):
+        """
+        Merge coincident endpoints into vertices.
+
+        Endpoints that agree to rounding_decimal places become one vertex,
+        placed at the first of them. Vertices are numbered in order of first
+        appearance.
+
+        Returns:
+            tuple: ((V, 2) vertex coordinates, (2N,) vertex id of every
+                endpoint, -1 for non-finite endpoints)
+        """
+        if self._point_keys is None:
+            self._build_points()
+        keys, order = self._point_keys, self._point_order
+        vertex_ids = np.full(len(self.points), -1, dtype=np.int64)
+        if not len(keys):
+            return np.empty((0, 2), dtype=np.float64), vertex_ids
+        new_group = np.empty(len(keys), dtype=bool)
+        new_group[0] = True
+        np.not_equal(keys[1:], keys[:-1], out=new_group[1:])
+        # the first endpoint of every group represents it
+        firsts = order[new_group]
+        by_appearance = np.argsort(firsts)
+        group_ids = np.empty(len(firsts), dtype=np.int64)
+        group_ids[by_appearance] = np.arange(len(firsts))
+        vertex_ids[order] = group_ids[np.cumsum(new_group) - 1]
+        return self.points[firsts[by_appearance]], vertex_ids
+
+    def overlapping(self, x0, y0, x1, y1):
+        """
+        Find the segments lying on the query segment's line and overlapping it.
+
+        A segment matches when both its endpoints are within rounding precision
+        of the query line and it shares more than a single point with the
+        query segment. Zero-length segments match anywhere on the query segment.
+
+        Returns:
+            np.ndarray: Sorted segment indices
+        """
+        dx, dy = x1 - x0, y1 - y0
+        length = math.hypot(dx, dy)
+        if not (length > 0 and math.isfinite(length) and math.isfinite(x0) and math.isfinite(y0)):
+            return np.empty(0, dtype=np.int64)
+        if len(self) < GRID_MIN_SEGMENTS:
+            candidates = np.arange(len(self))
+        else:
+            if self._cell_keys is None:
+                self._build_grid()
+            # cells along the query segment and their neighbours; a segment on
+            # the line that overlaps the query starts at most the longest
+            # segment length before it
+            back = self._max_length / length
+            samples = np.linspace(-back, 1, int(np.ceil(2 * (1 + back) * length / self.cell_size)) + 2)
+            cells = np.floor(np.column_stack([x0 + samples * dx, y0 + samples * dy]) / self.cell_size)
+            cells = (cells.astype(np.int64)[:, None, :] + _NEIGHBOURS).reshape(-1, 2)
+            candidates = np.unique(self._cell_endpoints(cells[:, 0], cells[:, 1]) // 2)
+
+        ux, uy = dx / length, dy / length
+        sx0, sy0, sx1, sy1 = (self.segments[candidates] - (x0, y0, x0, y0)).T
+        tolerance = 0.5 * 10.0 ** -self.rounding_decimal
+        # non-finite endpoints give NaN here and never match
+        with np.errstate(invalid='ignore'):
+            on_line = ((np.abs(sx0 * uy - sy0 * ux) <= tolerance)
+                       & (np.abs(sx1 * uy - sy1 * ux) <= tolerance))
+            along0, along1 = sx0 * ux + sy0 * uy, sx1 * ux + sy1 * uy
+            low, high = np.minimum(along0, along1), np.maximum(along0, along1)
+            overlap = np.minimum(high, length) - np.maximum(low, 0)
+            point = high - low <= tolerance
+        return candidates[on_line & ((overlap > tolerance) | (point & (overlap >= -tolerance)))]
+
+    def nearest_endpoint(self, x, y):
+        """
+        Find the endpoint closest to (x, y).
+
+        Grid cells are searched in rings around the query cell until no closer
+        endpoint can exist.
+
+        Returns:
+            tuple: (segment index, end (0 or 1), distance), or None when there is
+                no finite endpoint or the query point is not finite
+        """
+        if not (np.isfinite(x) and np.isfinite(y)):
+            return None
+        query = np.array([x, y], dtype=np.float64)
+        if len(self) < GRID_MIN_SEGMENTS:
+            ids, px, py = self._finite_endpoints()
+            if not len(px):
+                return None
+            distances = np.hypot(px - x, py - y)
+            closest = int(np.argmin(distances))
+            best = closest if ids is None else int(ids[closest])
+            return best // 2, best % 2, float(distances[closest])
+        if self._cell_keys is None:
+            self._build_grid()
+        if not len(self._cell_keys):
+            return None
+        cx, cy = np.floor(query / self.cell_size).astype(np.int64)
+        max_ring = int(max(abs(cx - self._cell_origin[0]), abs(cx - self._cell_max[0]),
+                           abs(cy - self._cell_origin[1]), abs(cy - self._cell_max[1])))
+        # rings closer than the grid's bounding box are empty
+        min_ring = int(max(0, cx - self._cell_max[0], self._cell_origin[0] - cx,
+                           cy - self._cell_max[1], self._cell_origin[1] - cy))
+        best, best_distance = None, np.inf
+        for ring in range(min_ring, max_ring + 1):
+            # no endpoint in this ring or beyond can beat the best one
+            if best is not None and best_distance <= (ring - 1) * self.cell_size:
+                break
+            offsets = np.arange(-ring, ring + 1)
+            if ring:
+                ring_x = np.concatenate([offsets, offsets, np.full(2 * ring - 1, -ring), np.full(2 * ring - 1, ring)])
+                ring_y = np.concatenate([np.full(2 * ring + 1, -ring), np.full(2 * ring + 1, ring),
+                                         offsets[1:-1], offsets[1:-1]])
+            else:
+                ring_x = ring_y = np.zeros(1, dtype=np.int64)
+            endpoints = self._cell_endpoints(cx + ring_x, cy + ring_y)
+            if not len(endpoints):
+                continue
+            distances = np.hypot(*(self.points[endpoints] - query).T)
+            closest = int(np.argmin(distances))
+            if distances[closest] < best_distance:
+                best, best_distance = int(endpoints[closest]), float(distances[closest])
+        return best // 2, best % 2, best_distance
@@ -0,0 +1,122 @@
+"""
+Streaming SVG writer for crease geometry.
+"""
+import zlib
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
+
+# Number of <line> elements formatted per yielded chunk
+SVG_CHUNK_SIZE = 2048
+
+SVG_MIMETYPE = 'image/svg+xml'
+
+SVGZ_MIMETYPE = 'application/gzip'
+
+SVG_HEADER = ('<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+              'width="800px" height="800px" viewBox="{viewbox}" preserveAspectRatio="xMidYMid meet">')
+
+
+def svg_viewbox(bounds, padding=0.1):
+    """
+    Compute the viewBox string for pattern bounds.
+
+    Args:
+        bounds (tuple): (min_x, min_y, max_x, max_y) in SVG coordinates
+        padding (float): Padding around the pattern as a fraction of its size
+
+    Returns:
+        str: "x y width height"
+    """
+    min_x, min_y, max_x, max_y = bounds
+    pattern_width = max_x - min_x
+    pattern_height = max_y - min_y
+
+    # Add 10% padding around the pattern
+    padding_x = pattern_width * padding
+    padding_y = pattern_height * padding
+
+    # Calculate viewBox parameters
+    viewbox_x = min_x - padding_x
+    viewbox_y = min_y - padding_y
+    viewbox_width = pattern_width + (2 * padding_x)
+    viewbox_height = pattern_height + (2 * padding_y)
+    return f'{viewbox_x} {viewbox_y} {viewbox_width} {viewbox_height}'
+
+
+def svg_bounds(geometry, flip_y=False):
+    """Return the geometry bounds in SVG coordinates (y optionally pointing down)."""
+    min_x, min_y, max_x, max_y = geometry.bounds()
+    if flip_y:
+        min_y, max_y = -max_y, -min_y
+    return min_x, min_y, max_x, max_y
+
+
+def _metadata(metadata):
+    fields = ''.join(f'      <{name}>{escape(str(value))}</{name}>\n' for name, value in metadata)
+    return ('<metadata>\n  <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">\n'
+            '    <rdf:Description>\n      <units>meters</units>\n'
+            f'{fields}'
+            '    </rdf:Description>\n  </rdf:RDF>\n</metadata>')
+
+
+def iter_svg_document(geometry, strokes, metadata, flip_y=False, chunk_size=SVG_CHUNK_SIZE):
+    """
+    Yield an SVG document for a geometry in chunks.
+
+    Args:
+        geometry (CreaseGeometry or TiledGeometry): Pattern geometry
+        strokes (dict): Crease kind -> (stroke colour, stroke width, stroke dasharray)
+        metadata (list): (name, value) pairs written to the RDF description
+        flip_y (bool): Negate y so the pattern is not drawn upside down
+        chunk_size (int): Number of <line> elements per chunk
+
+    Yields:
+        str: Consecutive parts of the document
+    """
+    viewbox = svg_viewbox(svg_bounds(geometry, flip_y))
+    yield '\n'.join([
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        SVG_HEADER.format(viewbox=viewbox),
+        # Add a comment about units
+        '<!-- Pattern dimensions in meters -->',
+        # Add metadata to the SVG to indicate units
+        _metadata(metadata),
+        '<!-- Units: All measurements are in meters -->',
+    ])
+
+    # Everything after the coordinates depends on the crease kind only
+    suffixes = np.empty(max(strokes) + 1, dtype=object)
+    for kind, (stroke_color, scaled_width, stroke_dasharray) in strokes.items():
+        suffixes[kind] = (f'" stroke={quoteattr(str(stroke_color))} stroke-width="{scaled_width}" '
+                          f'stroke-dasharray={quoteattr(str(stroke_dasharray))} />')
+
+    sign = -1 if flip_y else 1
+    for part in geometry.iter_chunks():
+        for start in range(0, len(part), chunk_size):
+            coords = part.segments[start:start + chunk_size] * (1, sign, 1, sign)
+            tails = suffixes[part.kinds[start:start + chunk_size]]
+            yield '\n' + '\n'.join([
+                f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}{tail}'
+                for (x1, y1, x2, y2), tail in zip(coords.tolist(), tails.tolist())
+            ])
+    yield '\n</svg>'
+
+
+def gzip_chunks(chunks, level=9):
+    """
+    Compress a stream of text chunks into gzip (.svgz) bytes chunks.
+
+    Args:
+        chunks (iterable): str or bytes chunks
+        level (int): zlib compression level
+
+    Yields:
+        bytes: Consecutive parts of the gzip stream
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31 = gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,135 @@
+"""
+Parameter sweeps over Cartesian grids of pattern inputs.
+"""
+import numpy as np
+import pandas as pd
+
+from .calculations import (
+    calculate_barrel_vault_parameters,
+    calculate_double_barrel_vault_parameters,
+    calculate_parameters_batch,
+)
+
+# Per-segment fields of calculate_parameters_batch, alpha is split into its two angles
+PSEUDO_DOME_SEGMENT_FIELDS = ('thetas', 's', 'A', 'h', 'alpha_1', 'alpha_2', 'beta', 'a')
+PSEUDO_DOME_SCALAR_FIELDS = ('r', 'n', 'theta1', 'theta_l', 'CD', 'alpha11', 'num_radial_segments')
+
+
+def cartesian_grid(**axes):
+    """
+    Flatten the Cartesian product of one-dimensional inputs.
+
+    Args:
+        **axes: Input name -> scalar or sequence of values
+
+    Returns:
+        dict: Input name -> 1-D array with one entry per combination
+    """
+    arrays = np.meshgrid(*(np.atleast_1d(np.asarray(values)) for values in axes.values()), indexing='ij')
+    return {name: array.ravel() for name, array in zip(axes, arrays)}
+
+
+def _frame(params, names):
+    return pd.DataFrame({name: params[name] for name in names})
+
+
+def _segment_arrays(params):
+    """Per-segment fields as (rows, n_max) arrays padded with NaN."""
+    n_max = params['thetas'].shape[-1]
+    arrays = {}
+    for name in PSEUDO_DOME_SEGMENT_FIELDS:
+        if name in ('alpha_1', 'alpha_2'):
+            values = params['alpha'][..., int(name[-1]) - 1]
+        else:
+            values = params[name]
+        if values.shape[-1] < n_max:
+            # beta and a exist between consecutive segments only
+            values = np.pad(values, ((0, 0), (0, n_max - values.shape[-1])), constant_values=np.nan)
+        arrays[name] = values
+    return arrays
+
+
+def sweep_pseudo_dome(r, n, per_segment=None):
+    """
+    Evaluate the pseudo-dome quantities over a grid of radii and segment counts.
+
+    Args:
+        r (array_like): Radii
+        n (array_like): Numbers of segments (n >= 3)
+        per_segment (str): How to return the ragged per-segment quantities
+            (thetas, s, A, h, alpha_1, alpha_2, beta, a):
+            None to leave them out, 'arrays' for a dict of (rows, n_max) arrays
+            padded with NaN, 'long' for a DataFrame with one row per segment
+
+    Returns:
+        pd.DataFrame: One row per (r, n) with r, n, theta1, theta_l, CD, alpha11,
+            num_radial_segments; with per_segment, a tuple (DataFrame, per-segment values)
+
+    Raises:
+        ValueError: If per_segment is unknown or any n is less than 3
+    """
+    if per_segment not in (None, 'arrays', 'long'):
+        raise ValueError("per_segment must be None, 'arrays' or 'long'")
+    grid = cartesian_grid(r=r, n=n)
+    params = calculate_parameters_batch(grid['r'], grid['n'])
+    df = _frame(params, PSEUDO_DOME_SCALAR_FIELDS)
+    if per_segment is None:
+        return df
+
+    arrays = _segment_arrays(params)
+    if per_segment == 'arrays':
+        return df, arrays
+
+    valid = np.arange(params['thetas'].shape[-1]) < params['n'][:, None]
+    rows, segments = np.nonzero(valid)
+    long = pd.DataFrame({'row': rows, 'segment': segments})
+    for name, values in arrays.items():
+        long[name] = values[valid]
+    return df, long
+
+
+def sweep_barrel_vault(r, n, omega, h=None):
+    """
+    Evaluate the barrel vault quantities over a grid of inputs.
+
+    Args:
+        r (array_like): Radii
+        n (array_like): Numbers of segments
+        omega (array_like): Central angles in degrees
+        h (array_like): Requested unit cell heights, a further grid axis;
+            clamped to [0, h_max]. Defaults to h_max.
+
+    Returns:
+        pd.DataFrame: Columns r, n, omega, theta, s, alpha, h_max, h (clamped),
+            plus h_requested when h is given
+    """
+    axes = dict(r=r, n=n, omega=omega)
+    if h is not None:
+        axes['h'] = h
+    grid = cartesian_grid(**axes)
+    params = calculate_barrel_vault_parameters(grid['r'], grid['n'], grid['omega'], grid.get('h'))
+    df = _frame(params, params.dtype.names)
+    if h is not None:
+        df['h_requested'] = grid['h']
+    return df
+
+
+def sweep_double_barrel_vault(r, n, omega, a):
+    """
+    Evaluate the double barrel vault quantities over a grid of inputs.
+
+    Combinations with a > 2r have no geometry; their angles are NaN.
+
+    Args:
+        r (array_like): Radii
+        n (array_like): Numbers of segments
+        omega (array_like): Central angles in degrees
+        a (array_like): Distances between barrel vault centers
+
+    Returns:
+        pd.DataFrame: Columns r, n, omega, a, theta, s, alpha1, beta, alpha2, h
+    """
+    grid = cartesian_grid(r=r, n=n, omega=omega, a=a)
+    with np.errstate(invalid='ignore'):
+        params = calculate_double_barrel_vault_parameters(grid['r'], grid['n'], grid['omega'], grid['a'])
+    return _frame(params, params.dtype.names)
@@ -0,0 +1,31 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption('--memory-threshold', type=float, metavar='PERCENT',
+                     help='fail cases whose peak memory exceeds the run given by '
+                          '--benchmark-compare by more than PERCENT')
+
+
+def pytest_sessionstart(session):
+    config = session.config
+    benchmark_session = getattr(config, '_benchmarksession', None)
+    if config.getoption('memory_threshold') is not None and not (
+            benchmark_session and benchmark_session.compared_mapping):
+        raise pytest.UsageError('--memory-threshold requires valid --benchmark-compare.')
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    result = yield
+    threshold = item.config.getoption('memory_threshold')
+    benchmark = item.funcargs.get('benchmark')
+    if threshold is None or benchmark is None or 'peak_kb' not in benchmark.extra_info:
+        return result
+    peak_kb = benchmark.extra_info['peak_kb']
+    for path, compared in item.config._benchmarksession.compared_mapping.items():
+        stored_kb = compared.get(benchmark.fullname, {}).get('extra_info', {}).get('peak_kb')
+        if stored_kb is not None and peak_kb > stored_kb * (1 + threshold / 100):
+            pytest.fail(f'peak memory {peak_kb} KiB exceeds the {stored_kb} KiB of {path} '
+                        f'by more than {threshold:g}%', pytrace=False)
+    return result
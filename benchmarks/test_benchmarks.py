@@ -0,0 +1,194 @@
+"""Benchmarks of the generators, deduplication, vertex merging, exporters and Dash callbacks."""
+import functools
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from app.utils.barrel_vault_double import generate_double_barrel_vault_pattern
+from app.utils.barrel_vault_single import generate_barrel_vault_pattern
+from app.utils.cache import geometry_cache
+from app.utils.calculations import calculate_parameters
+from app.utils.common_utils import remove_duplicate_segments, remove_duplicate_traces
+from app.utils.crease_graph import CreaseGraph
+from app.utils.export import (
+    create_barrel_vault_dxf, create_barrel_vault_svg, create_double_barrel_vault_dxf,
+    create_double_barrel_vault_svg, create_dxf, create_svg, prepare_export,
+)
+from app.utils.pattern_generator import generate_pattern
+from app.utils.sweep import sweep_pseudo_dome
+
+pytest.importorskip('pytest_benchmark')
+
+# Timed rounds per case
+ROUNDS = 5
+
+# Fixed vault parameters; the tile count m is varied
+VAULT = {'r': 2, 'n': 6, 'omega': 180}
+VAULT_H = 1
+VAULT_A = 1
+
+
+def run(benchmark, func, *args, cold=False):
+    """
+    Time func(*args) and record its peak Python memory in the benchmark extra info.
+
+    Args:
+        benchmark: pytest-benchmark fixture
+        func (callable): Function to time
+        cold (bool): Empty the geometry cache before every round, so that the
+            case measures a cold request rather than a cache hit
+    """
+    def setup():
+        if cold:
+            geometry_cache.clear()
+        return args, {}
+
+    benchmark.pedantic(func, setup=setup, rounds=ROUNDS, warmup_rounds=1)
+
+    setup()
+    tracemalloc.start()
+    try:
+        func(*args)
+        benchmark.extra_info['peak_kb'] = round(tracemalloc.get_traced_memory()[1] / 1024)
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize('n', [8, 100, 10000])
+def test_calculate_parameters(benchmark, n):
+    run(benchmark, calculate_parameters, 1, n)
+
+
+def test_sweep_pseudo_dome(benchmark):
+    run(benchmark, sweep_pseudo_dome, np.linspace(1, 10, 100), np.arange(3, 103))
+
+
+@pytest.mark.parametrize('n', [5, 10, 20, 40])
+def test_generate_pattern(benchmark, n):
+    run(benchmark, generate_pattern, 5, n, cold=True)
+
+
+@pytest.mark.parametrize('m', [1, 5, 10, 20])
+def test_generate_barrel_vault_pattern(benchmark, m):
+    run(benchmark, lambda: generate_barrel_vault_pattern(m=m, h=VAULT_H, **VAULT).materialize(), cold=True)
+
+
+@pytest.mark.parametrize('m', [1, 5, 10, 20])
+def test_generate_double_barrel_vault_pattern(benchmark, m):
+    run(benchmark, lambda: generate_double_barrel_vault_pattern(m=m, a=VAULT_A, **VAULT).materialize(), cold=True)
+
+
+def test_restyle_pattern(benchmark):
+    # warm cache: only the style table changes
+    generate_pattern(5, 40)
+    run(benchmark, generate_pattern, 5, 40, 'rgb(0,0,255)')
+
+
+@functools.cache
+def _dome_traces(n):
+    geometry = generate_pattern(5, n)
+    traces = [{'x': [x0, x1], 'y': [y0, y1]} for x0, y0, x1, y1 in geometry.segments.tolist()]
+    # Every segment twice, as produced by overlapping sectors
+    return traces * 2
+
+
+@functools.cache
+def _vault_geometry(m):
+    geometry = generate_barrel_vault_pattern(m=m, h=VAULT_H, **VAULT).materialize()
+    return type(geometry).concatenate([geometry, geometry])
+
+
+@pytest.mark.parametrize('n', [20, 40])
+def test_remove_duplicate_traces(benchmark, n):
+    run(benchmark, remove_duplicate_traces, _dome_traces(n))
+
+
+def test_remove_duplicate_segments(benchmark):
+    run(benchmark, remove_duplicate_segments, _vault_geometry(20))
+
+
+@pytest.mark.parametrize('n', [20, 40])
+def test_crease_graph(benchmark, n):
+    run(benchmark, CreaseGraph.from_geometry, generate_pattern(5, n))
+
+
+@pytest.mark.parametrize('n', [7, 20])
+def test_create_svg(benchmark, n):
+    run(benchmark, create_svg, 5, n, cold=True)
+
+
+@pytest.mark.parametrize('n', [7, 20])
+def test_create_dxf(benchmark, n):
+    run(benchmark, create_dxf, 5, n, cold=True)
+
+
+@pytest.mark.parametrize('n', [7, 20])
+def test_export_fold(benchmark, n):
+    run(benchmark, lambda: prepare_export('pseudo-dome', 5, n).render('fold'), cold=True)
+
+
+@pytest.mark.parametrize('create', [create_barrel_vault_svg, create_barrel_vault_dxf],
+                         ids=['svg', 'dxf'])
+@pytest.mark.parametrize('m', [3, 20])
+def test_create_barrel_vault(benchmark, create, m):
+    run(benchmark, lambda: create(m=m, h=VAULT_H, **VAULT), cold=True)
+
+
+@pytest.mark.parametrize('create', [create_double_barrel_vault_svg, create_double_barrel_vault_dxf],
+                         ids=['svg', 'dxf'])
+@pytest.mark.parametrize('m', [3, 20])
+def test_create_double_barrel_vault(benchmark, create, m):
+    run(benchmark, lambda: create(m=m, a=VAULT_A, **VAULT), cold=True)
+
+
+# Dash callback round trips through the Flask test client; skipped when the
+# web extra is not installed.
+@functools.cache
+def _client():
+    from app import create_app
+    client = create_app().server.test_client()
+    client.get('/')
+    return client
+
+
+def _callback_body(outputs, inputs):
+    return {
+        'output': '..' + '...'.join(outputs) + '..',
+        'outputs': [dict(zip(('id', 'property'), output.split('.'))) for output in outputs],
+        'inputs': [{'id': id, 'property': 'value', 'value': value} for id, value in inputs]
+                  + [{'id': outputs[0].split('.')[0], 'property': 'relayoutData', 'value': None}],
+        'state': [{'id': 'session-id', 'property': 'data', 'value': None}],
+        'changedPropIds': [f'{inputs[0][0]}.value'],
+    }
+
+
+CALLBACKS = {
+    'pseudo-dome': _callback_body(
+        ['pattern-plot.figure', 'parameter-display.children'],
+        [('radius-input', 5), ('segments-input', 7), ('fold-color-1-input', ''),
+         ('fold-color-2-input', ''), ('radial-color-input', ''), ('fold-width-input', ''),
+         ('radial-width-input', '')]),
+    'barrel-vault': _callback_body(
+        ['barrel-pattern-plot.figure', 'barrel-parameter-display.children',
+         'barrel-height-label.children', 'barrel-height-input.value'],
+        [('barrel-radius-input', 2), ('barrel-segments-input', 6), ('barrel-tiles-input', 10),
+         ('barrel-omega-input', 180), ('barrel-height-input', 1)]),
+    'double-barrel-vault': _callback_body(
+        ['double-barrel-pattern-plot.figure', 'double-barrel-parameter-display.children'],
+        [('double-barrel-radius-input', 2), ('double-barrel-segments-input', 6),
+         ('double-barrel-tiles-input', 10), ('double-barrel-omega-input', 180),
+         ('double-barrel-distance-input', 1)]),
+}
+
+
+@pytest.mark.parametrize('pattern', CALLBACKS)
+def test_callback_round_trip(benchmark, pattern):
+    pytest.importorskip('dash')
+    client = _client()
+
+    def post():
+        response = client.post('/_dash-update-component', json=CALLBACKS[pattern])
+        assert response.status_code == 200, response.status_code
+
+    run(benchmark, post, cold=True)
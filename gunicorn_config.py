@@ -1,2 +1,25 @@
+import os
+import shutil
+
 workers = 4
-bind = "0.0.0.0:10000"
\ No newline at end of file
+bind = "0.0.0.0:10000"
+# Import the app once in the master process; workers are forked with it loaded.
+# Required by app/coalescing.py: the request sequencer's shared table must be
+# created before the fork, or each worker only coalesces its own requests.
+preload_app = True
+
+# Workers write Prometheus samples here so /metrics can aggregate all of them.
+# Must be set before the app (and prometheus_client) is imported.
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/ori-kin-metrics")
+
+
+def on_starting(server):
+    # Drop samples of previous runs
+    metrics_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,69 @@
+import json
+import zipfile
+
+import pytest
+
+from app.utils.batch import MANIFEST_NAME, expand_grid, job_name, read_manifest, run_batch
+
+GRID = {'r': 5, 'n': [7, 8]}
+
+
+def manifest_entries(path):
+    with open(path) as file:
+        return [json.loads(line) for line in file]
+
+
+def test_expand_grid():
+    assert expand_grid({'r': 1, 'n': [3, 4], 'm': range(2)}) == [
+        {'r': 1, 'n': 3, 'm': 0}, {'r': 1, 'n': 3, 'm': 1},
+        {'r': 1, 'n': 4, 'm': 0}, {'r': 1, 'n': 4, 'm': 1},
+    ]
+
+
+def test_resume_regenerates_only_missing_files(tmp_path):
+    param_sets = expand_grid(GRID)
+    names = [job_name('pseudo-dome', params) for params in param_sets]
+    assert run_batch('pseudo-dome', param_sets, tmp_path, formats=['svg', 'fold'], workers=1) == \
+        {'ok': 2, 'error': 0, 'skipped': 0}
+    manifest = tmp_path / MANIFEST_NAME
+    assert read_manifest(manifest) == {name: {'svg': f'{name}.svg', 'fold': f'{name}.fold'} for name in names}
+
+    (tmp_path / f'{names[1]}.fold').unlink()
+    kept = (tmp_path / f'{names[0]}.svg').stat().st_mtime_ns
+    assert run_batch('pseudo-dome', param_sets, tmp_path, formats=['svg', 'fold'], workers=1, resume=True) == \
+        {'ok': 1, 'error': 0, 'skipped': 1}
+
+    assert (tmp_path / f'{names[1]}.fold').is_file()
+    assert (tmp_path / f'{names[0]}.svg').stat().st_mtime_ns == kept
+    entries = manifest_entries(manifest)
+    assert len(entries) == 3
+    assert {entry['name'] for entry in entries[:2]} == set(names)
+    assert entries[-1]['name'] == names[1]
+    assert all(entry['status'] == 'ok' for entry in entries)
+    assert entries[-1]['params'] == param_sets[1]
+
+
+def test_resume_into_zip_archive(tmp_path):
+    path = tmp_path / 'catalogue.zip'
+    param_sets = expand_grid(GRID)
+    run_batch('pseudo-dome', param_sets[:1], path, workers=1)
+    assert run_batch('pseudo-dome', param_sets, path, workers=1, resume=True) == \
+        {'ok': 1, 'error': 0, 'skipped': 1}
+    with zipfile.ZipFile(path) as archive:
+        assert sorted(archive.namelist()) == sorted(f'{job_name("pseudo-dome", params)}.svg'
+                                                    for params in param_sets)
+    assert len(read_manifest(path.with_suffix('.manifest.jsonl'))) == 2
+
+
+def test_failed_jobs_are_recorded_and_retried(tmp_path):
+    param_sets = [{'r': 5, 'n': 7}, {'r': 5, 'n': 1}]
+    assert run_batch('pseudo-dome', param_sets, tmp_path, workers=1)['ok'] == 1
+    entries = {entry['name']: entry for entry in manifest_entries(tmp_path / MANIFEST_NAME)}
+    failed = entries[job_name('pseudo-dome', param_sets[1])]
+    assert failed['status'] == 'error' and failed['error']
+    assert run_batch('pseudo-dome', param_sets, tmp_path, workers=1, resume=True)['skipped'] == 1
+
+
+def test_missing_parameter_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        run_batch('pseudo-dome', [{'r': 5}], tmp_path)
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from app.utils import cache
+from app.utils.cache import GeometryCache, cached_geometry, canonicalize, geometry_cache
+from app.utils.geometry import MOUNTAIN, CreaseGeometry
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_least_recently_used_entry_is_evicted():
+    entries = GeometryCache(maxsize=2)
+    entries.put('a', 1)
+    entries.put('b', 2)
+    assert entries.get('a') == 1  # 'b' is now the least recently used
+    entries.put('c', 3)
+    assert len(entries) == 2
+    assert entries.get('b') is None
+    assert (entries.get('a'), entries.get('c')) == (1, 3)
+
+
+def test_expired_entry_is_dropped(clock):
+    entries = GeometryCache(max_age=10)
+    entries.put('a', 1)
+    clock[0] += 10
+    assert entries.get('a') == 1
+    clock[0] += 1
+    assert entries.get('a') is None
+    assert len(entries) == 0
+    assert (entries.hits, entries.misses) == (1, 1)
+
+
+def test_put_refreshes_the_age(clock):
+    entries = GeometryCache(max_age=10)
+    entries.put('a', 1)
+    clock[0] += 8
+    entries.put('a', 2)
+    clock[0] += 8
+    assert entries.get('a') == 2
+
+
+def test_clear_resets_statistics():
+    entries = GeometryCache()
+    entries.put('a', 1)
+    entries.get('a')
+    entries.get('b')
+    entries.clear()
+    assert (len(entries), entries.hits, entries.misses) == (0, 0, 0)
+
+
+@pytest.mark.parametrize('a, b', [(None, ''), (2, 2.0), (np.float64(0.5), 0.5), (np.int64(3), 3.0)])
+def test_canonicalize_equal_values(a, b):
+    assert canonicalize(a) == canonicalize(b)
+
+
+def test_cached_geometry_shares_one_frozen_result():
+    geometry_cache.clear()
+    calls = []
+
+    @cached_geometry('test')
+    def generate(r, n=3):
+        calls.append((r, n))
+        return CreaseGeometry([(0, 0, r, n)], [MOUNTAIN])
+
+    first = generate(1)
+    assert generate(1.0, n=3) is first
+    assert calls == [(1, 3)]
+    assert not first.segments.flags.writeable
+    geometry_cache.clear()
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from app.utils.calculations import (
+    calculate_alpha1_angle, calculate_alpha2_angle, calculate_barrel_vault_parameters,
+    calculate_beta_angle, calculate_double_barrel_vault_parameters, calculate_folding_angle,
+    calculate_height, calculate_parameters, calculate_parameters_batch,
+    calculate_segment_angle, calculate_segment_length,
+)
+
+
+def test_pseudo_dome_batch_matches_scalar_calculations():
+    r = np.array([[1.0], [2.5]])
+    n = np.array([3, 4, 7, 12])
+    batch = calculate_parameters_batch(r, n)
+    assert batch.shape == (2, 4)
+
+    for i, j in np.ndindex(batch.shape):
+        row = batch[i, j]
+        size = n[j]
+        (thetas, s, A, beta, a, alpha, h, theta1, theta_l, CD, alpha11,
+         num_radial_segments) = calculate_parameters(r[i, 0], size)
+        np.testing.assert_allclose(row['thetas'][:size], thetas)
+        np.testing.assert_allclose(row['s'][:size], s)
+        np.testing.assert_allclose(row['A'][:size], A)
+        np.testing.assert_allclose(row['beta'][:size - 1], beta)
+        np.testing.assert_allclose(row['a'][:size - 1], a)
+        np.testing.assert_allclose(row['alpha'][:size], alpha)
+        np.testing.assert_allclose(row['h'][:size], h)
+        np.testing.assert_allclose([row['theta1'], row['theta_l'], row['CD'], row['alpha11']],
+                                   [theta1, theta_l, CD, alpha11])
+        assert row['num_radial_segments'] == num_radial_segments
+        # shorter patterns are padded with NaN
+        assert np.isnan(row['thetas'][size:]).all()
+        assert np.isnan(row['beta'][size - 1:]).all()
+
+
+@pytest.mark.parametrize('h', [None, -1.0, 0.05, 100.0])
+def test_barrel_vault_batch_matches_scalar_calculations(h):
+    r, n, omega = 2.0, np.array([3, 6, 11]), np.array([[90.0], [180.0]])
+    batch = calculate_barrel_vault_parameters(r, n, omega, h)
+    assert batch.shape == (2, 3)
+
+    for i, j in np.ndindex(batch.shape):
+        row = batch[i, j]
+        theta = calculate_segment_angle(omega[i, 0], n[j])
+        s = calculate_segment_length(r, theta)
+        alpha = calculate_folding_angle(theta)
+        h_max = calculate_height(s, alpha)
+        expected_h = h_max if h is None else np.clip(h, 0, h_max)
+        np.testing.assert_allclose([row['theta'], row['s'], row['alpha'], row['h_max'], row['h']],
+                                   [theta, s, alpha, h_max, expected_h])
+        assert 0 <= row['h'] <= row['h_max']
+
+
+def test_double_barrel_vault_batch_matches_scalar_calculations():
+    r, n, omega = 1.0, np.array([4, 6]), 180.0
+    a = np.array([[0.5], [1.5], [3.0]])  # a > 2r has no solution
+    with np.errstate(invalid='ignore'):
+        batch = calculate_double_barrel_vault_parameters(r, n, omega, a)
+        for i, j in np.ndindex(batch.shape):
+            row = batch[i, j]
+            theta = calculate_segment_angle(omega, n[j])
+            s = calculate_segment_length(r, theta)
+            alpha1 = calculate_alpha1_angle(a[i, 0], r, n[j])
+            beta = calculate_beta_angle(a[i, 0], r, n[j])
+            np.testing.assert_allclose(
+                [row['theta'], row['s'], row['alpha1'], row['beta'], row['alpha2'], row['h']],
+                [theta, s, alpha1, beta, calculate_alpha2_angle(beta), calculate_height(s, alpha1)])
+    assert np.isnan(batch['h'][2]).all()
+    assert np.isfinite(batch['h'][:2]).all()
@@ -0,0 +1,48 @@
+import multiprocessing
+
+import pytest
+
+from app.coalescing import RequestSequencer
+
+
+def test_newer_request_supersedes_older_one():
+    sequencer = RequestSequencer()
+    first = sequencer.begin('session', 'pseudo-dome')
+    assert not sequencer.superseded('session', 'pseudo-dome', first)
+    second = sequencer.begin('session', 'pseudo-dome')
+    assert second > first
+    assert sequencer.superseded('session', 'pseudo-dome', first)
+    assert not sequencer.superseded('session', 'pseudo-dome', second)
+
+
+def test_sessions_and_channels_are_independent():
+    sequencer = RequestSequencer()
+    ticket = sequencer.begin('a', 'pseudo-dome')
+    sequencer.begin('b', 'pseudo-dome')
+    sequencer.begin('a', 'barrel-vault')
+    assert not sequencer.superseded('a', 'pseudo-dome', ticket)
+
+
+def test_requests_without_session_are_never_superseded():
+    sequencer = RequestSequencer()
+    assert sequencer.begin(None, 'pseudo-dome') is None
+    sequencer.begin('', 'pseudo-dome')
+    assert not sequencer.superseded(None, 'pseudo-dome', None)
+
+
+def test_colliding_session_does_not_drop_a_current_request():
+    sequencer = RequestSequencer(slots=1)
+    ticket = sequencer.begin('a', 'pseudo-dome')
+    sequencer.begin('b', 'pseudo-dome')
+    assert not sequencer.superseded('a', 'pseudo-dome', ticket)
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='needs fork')
+def test_forked_workers_share_the_table():
+    sequencer = RequestSequencer()
+    ticket = sequencer.begin('session', 'pseudo-dome')
+    worker = multiprocessing.get_context('fork').Process(target=sequencer.begin, args=('session', 'pseudo-dome'))
+    worker.start()
+    worker.join()
+    assert worker.exitcode == 0
+    assert sequencer.superseded('session', 'pseudo-dome', ticket)
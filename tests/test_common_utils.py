@@ -0,0 +1,52 @@
+import numpy as np
+
+from app.utils.common_utils import (
+    find_duplicate_segments, remove_duplicate_segments, remove_duplicate_traces,
+)
+from app.utils.geometry import MOUNTAIN, VALLEY, CreaseGeometry
+
+
+def test_reversed_segment_is_a_duplicate():
+    keep, counts = find_duplicate_segments([
+        (0, 0, 1, 1),
+        (1, 1, 0, 0),
+        (0, 0, 1, 2),
+    ])
+    assert keep.tolist() == [True, False, True]
+    assert counts.tolist() == [2, 2, 1]
+
+
+def test_duplicates_match_after_rounding():
+    keep, _ = find_duplicate_segments([
+        (0, 0, 1, 1),
+        (1.00001, 1, -0.00001, 0),
+        (0, 0, 1.001, 1),
+    ], rounding_decimal=4)
+    assert keep.tolist() == [True, False, True]
+
+
+def test_negative_zero_matches_zero():
+    keep, _ = find_duplicate_segments([(0.0, 0.0, 1, 0), (1, 0, -0.0, -0.0)])
+    assert keep.tolist() == [True, False]
+
+
+def test_vertical_segments_in_both_directions():
+    keep, _ = find_duplicate_segments([(2, 3, 2, 1), (2, 1, 2, 3), (2, 1, 2, 2)])
+    assert keep.tolist() == [True, False, True]
+
+
+def test_no_segments():
+    keep, counts = find_duplicate_segments(np.empty((0, 4)))
+    assert len(keep) == 0 and len(counts) == 0
+
+
+def test_remove_duplicate_segments_keeps_first_occurrence():
+    geometry = CreaseGeometry([(0, 0, 1, 0), (1, 0, 0, 0), (0, 0, 0, 1)], [MOUNTAIN, VALLEY, VALLEY])
+    unique = remove_duplicate_segments(geometry)
+    np.testing.assert_array_equal(unique.segments, [(0, 0, 1, 0), (0, 0, 0, 1)])
+    assert unique.kinds.tolist() == [MOUNTAIN, VALLEY]
+
+
+def test_remove_duplicate_traces_ignores_direction():
+    traces = [{'x': [0, 1], 'y': [0, 1]}, {'x': [1, 0], 'y': [1, 0]}, {'x': [0, 2], 'y': [0, 1]}]
+    assert remove_duplicate_traces(traces) == [traces[0], traces[2]]
@@ -0,0 +1,62 @@
+import os
+from types import MappingProxyType
+
+import pytest
+
+from app.utils.config_loader import (
+    BARREL_VAULT_DEFAULTS, clear_config_cache, get_barrel_vault_config, load_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+def write_config(path, fold_width, mtime_ns):
+    path.write_text(f"line_widths:\n  fold_width: {fold_width}\n  connecting_width: 1\n")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_changed_file_is_reloaded(tmp_path):
+    path = tmp_path / 'config.yaml'
+    write_config(path, 2, 1_000_000_000)
+    first = load_config(path, BARREL_VAULT_DEFAULTS)
+    assert first['line_widths']['fold_width'] == 2
+    assert load_config(path, BARREL_VAULT_DEFAULTS) is first
+
+    write_config(path, 5, 2_000_000_000)
+    second = load_config(path, BARREL_VAULT_DEFAULTS)
+    assert second['line_widths']['fold_width'] == 5
+    # missing sections and keys come from the defaults
+    assert second['colors'] == BARREL_VAULT_DEFAULTS['colors']
+
+
+def test_config_is_read_only():
+    config = get_barrel_vault_config()
+    assert isinstance(config, MappingProxyType)
+    assert isinstance(config['colors'], MappingProxyType)
+    with pytest.raises(TypeError):
+        config['colors'] = {}
+    with pytest.raises(TypeError):
+        config['colors']['fold_color_1'] = 'green'
+    assert get_barrel_vault_config() is config
+
+
+@pytest.mark.parametrize('content', [None, 'colors: [red]\n', '- not a mapping\n'])
+def test_unloadable_file_falls_back_to_defaults(tmp_path, content):
+    path = tmp_path / 'config.yaml'
+    if content is not None:
+        path.write_text(content)
+    config = load_config(path, BARREL_VAULT_DEFAULTS)
+    assert config == BARREL_VAULT_DEFAULTS
+    assert isinstance(config, MappingProxyType)
+
+
+def test_missing_file_is_loaded_once_it_appears(tmp_path):
+    path = tmp_path / 'config.yaml'
+    assert load_config(path, BARREL_VAULT_DEFAULTS) == BARREL_VAULT_DEFAULTS
+    write_config(path, 7, 1_000_000_000)
+    assert load_config(path, BARREL_VAULT_DEFAULTS)['line_widths']['fold_width'] == 7
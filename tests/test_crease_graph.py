@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from app.utils.barrel_vault_double import generate_double_barrel_vault_pattern
+from app.utils.barrel_vault_single import generate_barrel_vault_pattern
+from app.utils.crease_graph import CreaseGraph
+from app.utils.geometry import BOUNDARY, CUT, MOUNTAIN, RADIAL, VALLEY, CreaseGeometry, make_style
+from app.utils.pattern_generator import generate_pattern
+
+
+def test_from_geometry_merges_vertices_and_drops_degenerate_edges():
+    styles = {MOUNTAIN: make_style('red', 1)}
+    geometry = CreaseGeometry([
+        (0, 0, 1, 0),
+        (1.00001, 0, 1, 1),
+        (1, 0, 0, 0),        # repeats the first edge reversed
+        (1, 1, 1.00002, 1),  # collapses into one vertex
+        (np.nan, 0, 1, 1),   # non-finite endpoint
+        (1, 1, 0, 0),
+    ], [MOUNTAIN, VALLEY, VALLEY, VALLEY, VALLEY, CUT], styles)
+    graph = CreaseGraph.from_geometry(geometry)
+
+    np.testing.assert_array_equal(graph.vertices, [(0, 0), (1, 0), (1, 1)])
+    assert graph.edges.tolist() == [[0, 1], [1, 2], [2, 0]]
+    assert graph.kinds.tolist() == [MOUNTAIN, VALLEY, CUT]
+    assert graph.assignments.tolist() == ['M', 'V', 'C']
+    assert graph.styles == styles
+    assert graph.bounds() == (0.0, 0.0, 1.0, 1.0)
+
+
+def test_to_geometry_shares_endpoints_exactly():
+    graph = CreaseGraph.from_geometry(CreaseGeometry([(0, 0, 1, 0), (1.00001, 0, 1, 1)], [MOUNTAIN, VALLEY]))
+    segments = graph.to_geometry().segments
+    assert tuple(segments[0, 2:]) == tuple(segments[1, :2])
+
+
+def test_pattern_graph_has_one_edge_per_unique_crease():
+    geometry = generate_pattern(5, 7)
+    graph = CreaseGraph.from_geometry(geometry)
+    assert 0 < len(graph) <= len(geometry)
+    # every vertex is used by an edge and the kinds come from the geometry
+    assert np.array_equal(np.unique(graph.edges), np.arange(len(graph.vertices)))
+    assert set(graph.kinds.tolist()) <= {MOUNTAIN, VALLEY, RADIAL, BOUNDARY, CUT}
+    low, high = np.sort(graph.edges, axis=1).T
+    assert len(np.unique(low * len(graph.vertices) + high)) == len(graph)
+
+
+@pytest.mark.parametrize('generate, params', [
+    (generate_barrel_vault_pattern, (1, 6, 3, 180, 0.5)),
+    (generate_barrel_vault_pattern, (2, 5, 4, 120, 0.3)),
+    (generate_double_barrel_vault_pattern, (1, 6, 2, 180, 1.5)),
+])
+def test_vault_boundary_edges_lie_on_the_sheet_outline(generate, params):
+    graph = CreaseGraph.from_geometry(generate(*params))
+    min_x, min_y, max_x, max_y = graph.bounds()
+    x0, y0, x1, y1 = graph.segments[graph.assignments == 'B'].T
+    on_side = (np.isclose(x0, x1) & (np.isclose(x0, min_x) | np.isclose(x0, max_x)))
+    on_end = (np.isclose(y0, y1) & (np.isclose(y0, min_y) | np.isclose(y0, max_y)))
+    assert (on_side | on_end).all()
@@ -0,0 +1,88 @@
+import gzip
+from xml.etree import ElementTree
+
+import pytest
+
+from app.utils.export import EXPORT_FORMATS, StyleTable, parse_color, parse_width, prepare_export
+from app.utils.geometry import BOUNDARY, CONNECTING, MOUNTAIN, RADIAL, VALLEY, CreaseGeometry
+from app.utils.svg_writer import iter_svg_document
+
+
+def test_styles_follow_the_crease_kind_not_the_colour():
+    export = prepare_export('pseudo-dome', 5, 7, fold_color_1='rgb(1,2,3)', accent_color='rgb(1,2,3)')
+    config = {'colors': {'fold_color_1': '', 'fold_color_2': '', 'radial_color': ''}}
+    styles = StyleTable(export.geometry, config, 'radial', 'dash')
+    assert styles.svg_strokes[MOUNTAIN][2] == 'none'
+    assert styles.svg_strokes[RADIAL][2] == '5,5'
+    assert 'linetype' not in styles.dxf_attribs[MOUNTAIN]
+    assert styles.dxf_attribs[RADIAL]['linetype'] == 'DASH'
+
+
+def test_vault_boundary_is_not_an_accent_line():
+    styles = prepare_export('barrel-vault', 1, 6, 3, 180, 0.5).styles
+    assert 'linetype' in styles.dxf_attribs[CONNECTING]
+    assert 'linetype' not in styles.dxf_attribs[BOUNDARY]
+    assert 'linetype' not in styles.dxf_attribs[VALLEY]
+
+
+def test_svg_stroke_attributes_are_escaped():
+    geometry = CreaseGeometry([[0, 0, 1, 1]], [MOUNTAIN])
+    strokes = {MOUNTAIN: ('red" onload="alert(1)', 0.5, '5,5 <&>')}
+    document = ''.join(iter_svg_document(geometry, strokes, [('radius', '<1>')]))
+    root = ElementTree.fromstring(document.encode())
+    line = root.find('{http://www.w3.org/2000/svg}line')
+    assert line.attrib['stroke'] == 'red" onload="alert(1)'
+    assert line.attrib['stroke-dasharray'] == '5,5 <&>'
+    assert 'onload' not in line.attrib
+
+
+def test_svgz_is_served_as_gzip():
+    assert EXPORT_FORMATS['svg'].mimetype == 'image/svg+xml'
+    assert EXPORT_FORMATS['svgz'].mimetype == 'application/gzip'
+    content = prepare_export('pseudo-dome', 5, 7).render('svgz')
+    assert gzip.decompress(content) == prepare_export('pseudo-dome', 5, 7).render('svg')
+
+
+def test_dxf_attributes_are_resolved_only_for_dxf():
+    # a colour the DXF colour mapping can't parse still exports to SVG
+    export = prepare_export('pseudo-dome', 5, 7, fold_color_1='rgb(1,2)')
+    assert export.render('svg')
+    with pytest.raises(ValueError):
+        export.render('dxf')
+
+
+@pytest.mark.parametrize('text', ['red', '#f00', '#ff0000', 'rgb(1,2,3)', 'rgb( 255 , 0 , 0 )'])
+def test_valid_colors(text):
+    assert parse_color(text) == text
+
+
+@pytest.mark.parametrize('text', ['', 'rgb(1,2)', 'rgb(1,2,300)', 'rgba(1,2,3,0)', 'red;', '#ff00', 'x" y="'])
+def test_invalid_colors(text):
+    with pytest.raises(ValueError):
+        parse_color(text)
+
+
+@pytest.mark.parametrize('text', ['0', '-1', 'nan', 'inf', 'wide'])
+def test_invalid_widths(text):
+    with pytest.raises(ValueError):
+        parse_width(text)
+
+
+@pytest.fixture(scope='module')
+def client():
+    from app import create_app
+    return create_app().server.test_client()
+
+
+@pytest.mark.parametrize('query', ['r=5&n=7&fold_color_1=rgb(1,2)', 'r=5&n=7&accent_color=rgb(1,2,999)',
+                                   'r=5&n=7&fold_width=-2', 'r=5&n=7&accent_width=nan', 'r=5&n=seven', 'r=5'])
+def test_export_route_rejects_bad_arguments(client, query):
+    response = client.get(f'/export/pseudo-dome.svg?{query}')
+    assert response.status_code == 400
+
+
+def test_export_route_streams_the_export(client):
+    response = client.get('/export/pseudo-dome.svgz?r=5&n=7&fold_color_1=rgb(0,0,255)&fold_width=2')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/gzip'
+    assert b'rgb(0,0,255)' in gzip.decompress(response.data)
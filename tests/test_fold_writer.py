@@ -0,0 +1,55 @@
+import json
+
+import numpy as np
+import pytest
+
+from app.utils.crease_graph import CreaseGraph
+from app.utils.export import prepare_export
+from app.utils.fold_writer import edge_fold_angles, iter_fold_document
+from app.utils.geometry import BOUNDARY, MOUNTAIN, VALLEY
+
+EXPORTS = {
+    'pseudo-dome': (5, 7),
+    'barrel-vault': (1, 6, 3, 180, 0.5),
+    'double-barrel-vault': (1, 6, 2, 180, 1.5),
+}
+
+
+@pytest.mark.parametrize('pattern', EXPORTS)
+def test_fold_document_is_valid(pattern):
+    export = prepare_export(pattern, *EXPORTS[pattern])
+    document = json.loads(export.render('fold'))
+
+    assert document['file_spec'] == 1.2
+    assert document['frame_classes'] == ['creasePattern']
+    vertices = np.array(document['vertices_coords'])
+    edges = np.array(document['edges_vertices'])
+    assert vertices.shape == (len(export.graph.vertices), 2)
+    assert edges.shape == (len(export.graph), 2)
+    assert edges.min() >= 0 and edges.max() < len(vertices)
+    assert (edges[:, 0] != edges[:, 1]).all()
+    assert len(document['edges_assignment']) == len(edges)
+    assert set(document['edges_assignment']) <= set('MVFBC')
+
+    if pattern == 'pseudo-dome':
+        assert 'edges_foldAngle' not in document
+    else:
+        angles = np.array(document['edges_foldAngle'])
+        assignments = np.array(document['edges_assignment'])
+        assert len(angles) == len(edges)
+        assert (angles[assignments == 'M'] < 0).all()
+        assert (angles[assignments == 'V'] > 0).all()
+        assert (angles[~np.isin(assignments, ['M', 'V'])] == 0).all()
+
+
+def test_chunk_size_does_not_change_the_document():
+    graph = CreaseGraph.from_geometry(prepare_export('pseudo-dome', 5, 7).geometry)
+    whole = ''.join(iter_fold_document(graph, (30, 60), 'test'))
+    chunked = ''.join(iter_fold_document(graph, (30, 60), 'test', chunk_size=7))
+    assert chunked == whole
+    assert json.loads(whole)['frame_title'] == 'test'
+
+
+def test_edge_fold_angles_signs():
+    kinds = np.array([MOUNTAIN, VALLEY, BOUNDARY], dtype=np.int8)
+    assert edge_fold_angles(kinds, 30, -60).tolist() == [-30, 60, 0]
@@ -0,0 +1,72 @@
+"""Import-time budgets of the entry points, measured in fresh interpreters."""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Fastest of this many interpreter starts is compared against the budget
+RUNS = 3
+
+# Multiplier for all budgets, for slow machines
+BUDGET_SCALE = float(os.environ.get('IMPORT_BUDGET_SCALE', 1.0))
+
+# name -> (statement to time, budget in ms, modules that must not be loaded)
+BUDGETS = {
+    'cli': (
+        'import app.cli',
+        500,
+        ('dash', 'plotly', 'flask', 'ezdxf', 'pandas'),
+    ),
+    'export': (
+        'import app.utils.export',
+        500,
+        ('dash', 'plotly', 'flask', 'ezdxf', 'pandas'),
+    ),
+    'create_app': (
+        'from app import create_app; create_app()',
+        4000,
+        ('plotly.express', 'ezdxf', 'pandas', 'app.layout'),
+    ),
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'ms': elapsed * 1000, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def measure(statement, runs=RUNS):
+    """
+    Time a statement in fresh interpreters.
+
+    Returns:
+        tuple: (fastest milliseconds, modules loaded after the statement)
+    """
+    times = []
+    modules = set()
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', PROBE.format(statement=statement)],
+                                cwd=ROOT, check=True, capture_output=True, text=True).stdout
+        result = json.loads(output.splitlines()[-1])
+        times.append(result['ms'])
+        modules = set(result['modules'])
+    return min(times), modules
+
+
+@pytest.mark.parametrize('name', BUDGETS)
+def test_import_budget(name):
+    statement, budget, forbidden = BUDGETS[name]
+    if name == 'create_app':
+        pytest.importorskip('dash')
+    elapsed, modules = measure(statement)
+    loaded = [module for module in forbidden
+              if module in modules or any(m.startswith(module + '.') for m in modules)]
+    assert not loaded, f"{name} loads {', '.join(loaded)}"
+    assert elapsed <= budget * BUDGET_SCALE, f"{name} took {elapsed:.0f} ms (budget {budget * BUDGET_SCALE:.0f} ms)"
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from app.utils.geometry import MOUNTAIN, CreaseGeometry
+from app.utils.lod import level_of_detail, outline_segments, parse_viewport, viewport_changed
+
+
+@pytest.mark.parametrize('relayout_data', [None, {}, {'xaxis.autorange': True, 'yaxis.autorange': True},
+                                           {'autosize': True}, {'dragmode': 'pan'}])
+def test_whole_pattern_shown(relayout_data):
+    assert parse_viewport(relayout_data) is None
+
+
+def test_zoomed_viewport():
+    relayout_data = {'xaxis.range[0]': 2, 'xaxis.range[1]': -1, 'yaxis.range[0]': 0, 'yaxis.range[1]': 3}
+    assert parse_viewport(relayout_data) == (-1, 0, 2, 3)
+    assert parse_viewport({'xaxis.range': [4, 1], 'yaxis.range': [0, 3]}) == (1, 0, 4, 3)
+
+
+@pytest.mark.parametrize('relayout_data, viewport', [
+    ({'xaxis.range[0]': 0, 'xaxis.range[1]': 1}, (0, None, 1, None)),
+    ({'yaxis.range[0]': 0, 'yaxis.range[1]': 1, 'xaxis.autorange': True}, (None, 0, None, 1)),
+    ({'xaxis.range[0]': 0, 'yaxis.range[0]': 0, 'yaxis.range[1]': 1}, (None, 0, None, 1)),
+    ({'xaxis.range[1]': 1}, None),
+])
+def test_partial_viewport(relayout_data, viewport):
+    assert parse_viewport(relayout_data) == viewport
+
+
+def test_viewport_changed():
+    assert viewport_changed({'xaxis.range[0]': 0, 'xaxis.range[1]': 1})
+    assert viewport_changed({'yaxis.autorange': True})
+    assert not viewport_changed({'dragmode': 'zoom'})
+    assert not viewport_changed(None)
+
+
+@pytest.fixture
+def geometry():
+    # 10 x 10 square sheet: four 10 long edges and 100 short segments of length 0.01 to 1
+    lengths = np.linspace(0.01, 1, 100)
+    short = np.column_stack([np.full(100, 5.0), np.linspace(0, 9, 100), 5 + lengths, np.linspace(0, 9, 100)])
+    segments = np.vstack([outline_segments((0, 0, 10, 10)), short])
+    return CreaseGeometry(segments, np.full(len(segments), MOUNTAIN))
+
+
+def test_short_segments_are_decimated(geometry):
+    drawn, outline = level_of_detail(geometry, screen_pixels=100, min_pixels=2)
+    # 2 pixels of a 10 wide view on 100 pixels
+    min_length = 0.2
+    lengths = np.hypot(*(geometry.segments[:, 2:] - geometry.segments[:, :2]).T)
+    assert len(drawn) == np.count_nonzero(lengths >= min_length - 1e-12)
+    assert outline is None
+
+    # zooming in by 10 draws all but the shortest of the segments in view
+    drawn, outline = level_of_detail(geometry, (4, 0, 6, 2), screen_pixels=100, min_pixels=2, margin=0)
+    x0, y0, x1, y1 = drawn.segments.T
+    assert (np.hypot(x1 - x0, y1 - y0) >= 0.04 - 1e-12).all()
+    assert ((np.minimum(y0, y1) <= 2) & (np.minimum(x0, x1) <= 6)).all()
+    np.testing.assert_array_equal(outline, outline_segments((0, 0, 10, 10)))
+
+
+def test_thresholds_scale_with_the_screen(geometry):
+    counts = [len(level_of_detail(geometry, screen_pixels=pixels)[0]) for pixels in (10, 100, 2000)]
+    assert counts == sorted(counts)
+    assert counts[-1] == len(geometry)
+
+
+def test_empty_geometry():
+    drawn, outline = level_of_detail(CreaseGeometry())
+    assert len(drawn) == 0 and outline is None
@@ -0,0 +1,61 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from app.metrics import segment_bucket
+from app.utils.barrel_vault_single import generate_barrel_vault_pattern
+from app.utils.cache import geometry_cache
+
+CALLBACK = {
+    'output': '..barrel-pattern-plot.figure...barrel-parameter-display.children...'
+              'barrel-height-label.children...barrel-height-input.value..',
+    'outputs': [{'id': 'barrel-pattern-plot', 'property': 'figure'},
+                {'id': 'barrel-parameter-display', 'property': 'children'},
+                {'id': 'barrel-height-label', 'property': 'children'},
+                {'id': 'barrel-height-input', 'property': 'value'}],
+    'inputs': [{'id': id, 'property': 'value', 'value': value} for id, value in [
+        ('barrel-radius-input', 2), ('barrel-segments-input', 6), ('barrel-tiles-input', 3),
+        ('barrel-omega-input', 180), ('barrel-height-input', 1)]]
+        + [{'id': 'barrel-pattern-plot', 'property': 'relayoutData', 'value': None}],
+    'state': [{'id': 'session-id', 'property': 'data', 'value': None}],
+    'changedPropIds': ['barrel-radius-input.value'],
+}
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.fixture(scope='module')
+def client():
+    from app import create_app
+    return create_app().server.test_client()
+
+
+@pytest.mark.parametrize('count, label', [(None, 'none'), (0, '16'), (16, '16'), (17, '64'), (10 ** 7, '+Inf')])
+def test_segment_bucket(count, label):
+    assert segment_bucket(count) == label
+
+
+def test_cache_metrics_use_the_pattern_name(client):
+    geometry_cache.clear()
+    misses = sample('orikin_geometry_cache_requests_total', pattern='barrel-vault', result='miss')
+    hits = sample('orikin_geometry_cache_requests_total', pattern='barrel-vault', result='hit')
+    generate_barrel_vault_pattern(2, 6, 3, 180, 1)
+    generate_barrel_vault_pattern(2, 6, 3, 180, 1)
+    assert sample('orikin_geometry_cache_requests_total', pattern='barrel-vault', result='miss') == misses + 1
+    assert sample('orikin_geometry_cache_requests_total', pattern='barrel-vault', result='hit') == hits + 1
+    assert sample('orikin_generation_segments_count', pattern='barrel-vault') >= 1
+
+
+def test_callback_latency_carries_the_segment_count(client):
+    segments = len(generate_barrel_vault_pattern(2, 6, 3, 180, 1))
+    bucket = segment_bucket(segments)
+    before = sample('orikin_callback_duration_seconds_count', callback='update_barrel_vault_pattern',
+                    segments=bucket)
+    total = sample('orikin_callback_segments_sum', callback='update_barrel_vault_pattern')
+
+    response = client.post('/_dash-update-component', json=CALLBACK)
+    assert response.status_code == 200
+    assert sample('orikin_callback_duration_seconds_count', callback='update_barrel_vault_pattern',
+                  segments=bucket) == before + 1
+    assert sample('orikin_callback_segments_sum', callback='update_barrel_vault_pattern') == total + segments
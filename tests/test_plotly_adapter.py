@@ -0,0 +1,55 @@
+import base64
+
+import numpy as np
+
+from app.utils.geometry import CONNECTING, MOUNTAIN, VALLEY, CreaseGeometry, make_style
+from app.utils.plotly_adapter import geometry_to_grouped_traces, outline_trace, typed_array
+
+STYLES = {
+    MOUNTAIN: make_style('red', 2),
+    VALLEY: make_style('red', 2),
+    CONNECTING: make_style('black', 1, 'dash'),
+}
+
+
+def decode(values):
+    assert values['dtype'] == 'f4'
+    return np.frombuffer(base64.b64decode(values['bdata']), '<f4')
+
+
+def test_typed_array_round_trip():
+    values = np.array([0.0, -1.5, np.nan, 1e3, 0.1])
+    decoded = decode(typed_array(values))
+    np.testing.assert_array_equal(decoded, values.astype(np.float32))
+    assert np.isnan(decoded[2])
+
+    ints = typed_array(np.arange(4), 'i4')
+    np.testing.assert_array_equal(np.frombuffer(base64.b64decode(ints['bdata']), '<i4'), np.arange(4))
+
+
+def test_grouped_traces_round_trip():
+    segments = np.array([[0, 0, 1, 0.5], [1, 0.5, 2, 0], [0, 1, 2, 1], [0.25, 0, 0.25, 1]])
+    geometry = CreaseGeometry(segments, [MOUNTAIN, CONNECTING, VALLEY, MOUNTAIN], STYLES)
+    plain = geometry_to_grouped_traces(geometry)
+    binary = geometry_to_grouped_traces(geometry, binary=True)
+    # mountain and valley folds share their style and are drawn as one trace
+    assert [trace['name'] for trace in binary] == ['mountain/valley', 'connecting']
+
+    for plain_trace, binary_trace, kinds in zip(plain, binary, [(MOUNTAIN, VALLEY), (CONNECTING,)]):
+        selected = segments[np.isin(geometry.kinds, kinds)]
+        x, y = decode(binary_trace['x']), decode(binary_trace['y'])
+        assert len(x) == len(y) == 3 * len(selected)
+        # every segment is followed by a NaN separator
+        assert np.isnan(x[2::3]).all() and np.isnan(y[2::3]).all()
+        np.testing.assert_array_equal(np.column_stack([x[0::3], y[0::3], x[1::3], y[1::3]]),
+                                      selected.astype(np.float32))
+        np.testing.assert_array_equal(x, np.asarray(plain_trace['x'], dtype=np.float32))
+        assert binary_trace['line'] == plain_trace['line']
+
+
+def test_outline_trace_round_trip():
+    outline = np.array([[0, 0, 3, 0], [3, 0, 3, 2]])
+    trace = outline_trace(outline, binary=True)
+    x, y = decode(trace['x']), decode(trace['y'])
+    np.testing.assert_array_equal(x, np.array([0, 3, np.nan, 3, 3, np.nan], dtype=np.float32))
+    np.testing.assert_array_equal(y, np.array([0, 0, np.nan, 0, 2, np.nan], dtype=np.float32))
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from app.utils.spatial import GRID_MIN_SEGMENTS, SegmentIndex
+
+
+def test_coincident_matches_to_rounding_precision():
+    index = SegmentIndex([(0, 0, 1, 0), (1.00001, 0, 1, 1), (2, 2, 1, 0)])
+    assert index.coincident(1, 0).tolist() == [0, 1, 2]
+    assert index.coincident(1, 0, end=1).tolist() == [0, 2]
+    assert index.coincident(1.001, 0).tolist() == []
+
+
+def test_coincident_ignores_non_finite_endpoints():
+    index = SegmentIndex([(np.nan, 0, 1, 1), (0, 0, 1, 1)])
+    assert index.coincident(1, 1).tolist() == [0, 1]
+    assert index.coincident(np.nan, 0).tolist() == []
+
+
+def _line_with_noise(count):
+    """Unit segments along y=0 followed by random diagonal segments."""
+    rng = np.random.default_rng(0)
+    along = np.column_stack([np.arange(count), np.zeros(count), np.arange(count) + 1, np.zeros(count)])
+    noise = rng.uniform(1, 10, (count, 4))
+    return np.vstack([along, noise])
+
+
+@pytest.mark.parametrize('count', [4, GRID_MIN_SEGMENTS])
+def test_overlapping_finds_collinear_segments(count):
+    segments = _line_with_noise(count)
+    index = SegmentIndex(segments)
+    found = index.overlapping(0.5, 0, 2.5, 0)
+    assert found.tolist() == [0, 1, 2]
+    # segments touching the query in a single point do not overlap it
+    assert index.overlapping(1, 0, 2, 0).tolist() == [1]
+
+
+def test_overlapping_finds_long_segment_starting_before_the_query():
+    segments = np.vstack([[(-100, 0, 100, 0)], _line_with_noise(GRID_MIN_SEGMENTS)[GRID_MIN_SEGMENTS:] + 50])
+    index = SegmentIndex(segments)
+    assert index.overlapping(10, 0, 11, 0).tolist() == [0]
+
+
+def test_overlapping_matches_zero_length_segments_on_the_query():
+    index = SegmentIndex([(1, 0, 1, 0), (5, 0, 5, 0)])
+    assert index.overlapping(0, 0, 2, 0).tolist() == [0]
+
+
+def test_merge_endpoints_numbers_vertices_by_first_appearance():
+    index = SegmentIndex([(1, 1, 0, 0), (0.00001, 0, 2, 0), (2, 0, 1, 1.00002)])
+    vertices, vertex_ids = index.merge_endpoints()
+    np.testing.assert_array_equal(vertices, [(1, 1), (0, 0), (2, 0)])
+    assert vertex_ids.tolist() == [0, 1, 1, 2, 2, 0]
+
+
+def test_merge_endpoints_marks_non_finite_endpoints():
+    vertices, vertex_ids = SegmentIndex([(0, 0, np.nan, 1), (0, 0, 1, np.inf)]).merge_endpoints()
+    np.testing.assert_array_equal(vertices, [(0, 0)])
+    assert vertex_ids.tolist() == [0, -1, 0, -1]
+
+
+def test_merge_endpoints_of_no_segments():
+    vertices, vertex_ids = SegmentIndex(np.empty((0, 4))).merge_endpoints()
+    assert vertices.shape == (0, 2) and len(vertex_ids) == 0
+
+
+@pytest.mark.parametrize('count', [10, 4 * GRID_MIN_SEGMENTS])
+def test_nearest_endpoint_matches_brute_force(count):
+    rng = np.random.default_rng(1)
+    segments = rng.uniform(-5, 5, (count, 4))
+    segments[0] = (np.nan, np.nan, 0, 0)
+    index = SegmentIndex(segments)
+    points = segments.reshape(-1, 2)
+    # queries inside, on the edge of and far outside the endpoint cloud
+    for x, y in np.vstack([rng.uniform(-6, 6, (50, 2)), [(5, 5), (-40, 3), (100, -100)]]):
+        segment, end, distance = index.nearest_endpoint(x, y)
+        distances = np.hypot(points[:, 0] - x, points[:, 1] - y)
+        assert distance == pytest.approx(np.nanmin(distances))
+        assert distances[2 * segment + end] == pytest.approx(distance)
+
+
+def test_nearest_endpoint_without_finite_points():
+    assert SegmentIndex([(np.nan, 0, np.inf, 1)]).nearest_endpoint(0, 0) is None
+    assert SegmentIndex(np.empty((0, 4))).nearest_endpoint(0, 0) is None
+    assert SegmentIndex([(0, 0, 1, 1)]).nearest_endpoint(np.nan, 0) is None
+    assert SegmentIndex([(0, 0, 1, 1)]).nearest_endpoint(0.9, 1.2) == (0, 1, pytest.approx(np.hypot(0.1, 0.2)))
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from app.utils.calculations import calculate_parameters, calculate_parameters_batch
+from app.utils.sweep import (
+    PSEUDO_DOME_SCALAR_FIELDS, PSEUDO_DOME_SEGMENT_FIELDS, cartesian_grid, sweep_barrel_vault,
+    sweep_double_barrel_vault, sweep_pseudo_dome,
+)
+
+R = [1.0, 2.0]
+N = [3, 5]
+
+
+def test_cartesian_grid_varies_the_last_axis_fastest():
+    grid = cartesian_grid(r=[1, 2], n=[3, 4, 5])
+    np.testing.assert_array_equal(grid['r'], [1, 1, 1, 2, 2, 2])
+    np.testing.assert_array_equal(grid['n'], [3, 4, 5, 3, 4, 5])
+
+
+def test_pseudo_dome_rows():
+    df = sweep_pseudo_dome(R, N)
+    assert list(df.columns) == list(PSEUDO_DOME_SCALAR_FIELDS)
+    assert list(zip(df['r'], df['n'])) == [(1, 3), (1, 5), (2, 3), (2, 5)]
+    for row in df.itertuples():
+        *_, theta1, theta_l, CD, alpha11, num_radial_segments = calculate_parameters(row.r, row.n)
+        np.testing.assert_allclose([row.theta1, row.theta_l, row.CD, row.alpha11],
+                                   [theta1, theta_l, CD, alpha11])
+        assert row.num_radial_segments == num_radial_segments
+
+
+def test_pseudo_dome_per_segment_arrays():
+    df, arrays = sweep_pseudo_dome(R, N, per_segment='arrays')
+    assert set(arrays) == set(PSEUDO_DOME_SEGMENT_FIELDS)
+    assert all(values.shape == (len(df), max(N)) for values in arrays.values())
+    params = calculate_parameters_batch(df['r'], df['n'])
+    np.testing.assert_array_equal(arrays['thetas'], params['thetas'])
+    np.testing.assert_array_equal(arrays['alpha_1'], params['alpha'][:, :, 0])
+    np.testing.assert_array_equal(arrays['alpha_2'], params['alpha'][:, :, 1])
+    # beta and a exist between segments only and are padded to the full width
+    assert np.isnan(arrays['beta'][:, -1]).all()
+    assert np.isnan(arrays['s'][df['n'] == 3][:, 3:]).all()
+
+
+def test_pseudo_dome_long_format():
+    df, long = sweep_pseudo_dome(R, N, per_segment='long')
+    assert list(long.columns) == ['row', 'segment', *PSEUDO_DOME_SEGMENT_FIELDS]
+    # one row per segment of every configuration
+    assert len(long) == df['n'].sum()
+    assert (long.groupby('row')['segment'].max() + 1 == df['n']).all()
+
+    _, arrays = sweep_pseudo_dome(R, N, per_segment='arrays')
+    for name in PSEUDO_DOME_SEGMENT_FIELDS:
+        np.testing.assert_array_equal(long[name], arrays[name][long['row'], long['segment']])
+    # the last segment has no following one
+    last = long['segment'] == df['n'][long['row']].to_numpy() - 1
+    assert long.loc[last, 'beta'].isna().all()
+    assert long.loc[~last, 'beta'].notna().all()
+
+
+def test_pseudo_dome_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        sweep_pseudo_dome(R, [2, 5])
+    with pytest.raises(ValueError):
+        sweep_pseudo_dome(R, N, per_segment='wide')
+
+
+def test_barrel_vault_clamps_requested_heights():
+    df = sweep_barrel_vault(1, 6, [90, 180], h=[-1.0, 0.01, 100.0])
+    assert len(df) == 6
+    assert list(df.columns) == ['r', 'n', 'omega', 'theta', 's', 'alpha', 'h_max', 'h', 'h_requested']
+    np.testing.assert_array_equal(df['h'], np.clip(df['h_requested'], 0, df['h_max']))
+    assert 'h_requested' not in sweep_barrel_vault(1, 6, 180).columns
+
+
+def test_double_barrel_vault_invalid_rows_are_nan():
+    df = sweep_double_barrel_vault(1, 6, 180, [1.0, 3.0])
+    assert list(df.columns) == ['r', 'n', 'omega', 'a', 'theta', 's', 'alpha1', 'beta', 'alpha2', 'h']
+    valid, invalid = df.iloc[0], df.iloc[1]
+    assert valid[['alpha1', 'beta', 'alpha2', 'h']].notna().all()
+    # no geometry exists for a > 2r
+    assert invalid[['alpha1', 'beta', 'alpha2', 'h']].isna().all()
+    assert invalid['s'] == valid['s']
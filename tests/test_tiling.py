@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from app.utils.barrel_vault_double import generate_double_barrel_vault_pattern_unit_cell
+from app.utils.barrel_vault_single import generate_barrel_vault_pattern_unit_cell
+from app.utils.calculations import (
+    calculate_alpha1_angle,
+    calculate_alpha2_angle,
+    calculate_beta_angle,
+    calculate_folding_angle,
+    calculate_height,
+    calculate_segment_angle,
+    calculate_segment_length,
+)
+from app.utils.common_utils import remove_duplicate_segments, tile_unit_cell
+from app.utils.geometry import BOUNDARY, CreaseGeometry
+
+R, N, OMEGA, A = 1, 6, 180, 1.5
+
+
+@pytest.fixture(scope='module', params=['barrel', 'double_barrel'])
+def unit_cell(request):
+    """(h, unit cell, horizontal line positions, total length) of a vault."""
+    theta = calculate_segment_angle(OMEGA, N)
+    s = calculate_segment_length(R, theta)
+    if request.param == 'barrel':
+        h = 0.5
+        return (h, *generate_barrel_vault_pattern_unit_cell(s, N, h, calculate_folding_angle(theta)))
+    alpha1, beta = calculate_alpha1_angle(A, R, N), calculate_beta_angle(A, R, N)
+    h = calculate_height(s, alpha1)
+    return (h, *generate_double_barrel_vault_pattern_unit_cell(s, N, h, alpha1, calculate_alpha2_angle(beta),
+                                                                beta, A))
+
+
+def eager_tiling(unit_cell, m):
+    """Every copy of the cell, deduplicated, with the outermost edge lines replaced by boundaries."""
+    h, cell, hl_pos, total_length = unit_cell
+    copies = [cell.translated(0, 4 * h * t) for t in range(-(m - 1), m)]
+    tiled = remove_duplicate_segments(CreaseGeometry.concatenate(copies))
+    y_bottom, y_top = hl_pos[0] * (2*m - 1), hl_pos[-1] * (2*m - 1)
+    y0, y1 = tiled.segments[:, 1], tiled.segments[:, 3]
+    outer = np.isclose(y0, y1) & (np.isclose(y0, y_bottom) | np.isclose(y0, y_top))
+    edges = CreaseGeometry([[0, y, total_length, y] for y in (y_bottom, y_top)], [BOUNDARY, BOUNDARY])
+    return CreaseGeometry.concatenate([tiled.subset(~outer), edges])
+
+
+def rows(geometry):
+    """Sorted (segment, kind) rows with rounded, direction-independent endpoints."""
+    segments = np.round(geometry.segments, 6) + 0.0
+    start, end = segments[:, :2], segments[:, 2:]
+    swap = (start[:, 0] > end[:, 0]) | ((start[:, 0] == end[:, 0]) & (start[:, 1] > end[:, 1]))
+    segments[swap] = segments[swap][:, [2, 3, 0, 1]]
+    table = np.column_stack([segments, geometry.kinds])
+    return table[np.lexsort(table.T[::-1])]
+
+
+@pytest.mark.parametrize('m', [1, 2, 5])
+def test_lazy_tiling_equals_eager_tiling(unit_cell, m):
+    h, cell, hl_pos, total_length = unit_cell
+    tiled = tile_unit_cell(cell, hl_pos, total_length, m, h)
+    materialized = tiled.materialize()
+    expected = eager_tiling(unit_cell, m)
+
+    assert len(tiled) == len(materialized) == len(expected)
+    np.testing.assert_allclose(rows(materialized), rows(expected), atol=1e-9)
+    np.testing.assert_allclose(tiled.bounds(), expected.bounds())
+
+
+def test_shared_edges_are_drawn_once(unit_cell):
+    h, cell, hl_pos, total_length = unit_cell
+    materialized = tile_unit_cell(cell, hl_pos, total_length, 4, h).materialize()
+    assert len(remove_duplicate_segments(materialized)) == len(materialized)